@@ -0,0 +1,54 @@
+# type: ignore
+"""
+Counts the remote calls made by ``Folder.clips`` on a large bin.
+
+Runs against the in-memory ``fake`` backend, which counts every remote call and can add
+a per-call latency to stand in for the round-trip to Resolve. The "eager" row builds
+every clip's ``MarkerCollection`` straight away, which is what ``MediaPoolItem.__init__``
+used to do.
+
+Usage:
+    python benchmarks/folder_clips.py [clips] [latency in ms]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.backends.fake import FakeBackend  # noqa: E402
+from pydavinci.main import connection  # noqa: E402
+from pydavinci.wrappers.folder import Folder  # noqa: E402
+
+
+def measure(backend: FakeBackend, folder: Folder, eager: bool) -> tuple:
+    backend.reset_calls()
+    start = time.perf_counter()
+    clips = folder.clips
+    if eager:
+        for clip in clips:
+            clip.markers  # noqa: B018
+    elapsed = time.perf_counter() - start
+    return backend.total_calls, backend.calls["GetMarkers"], elapsed
+
+
+def main(clips: int = 5000, latency_ms: float = 0.0) -> None:
+    backend = connection.use_backend(FakeBackend(latency=latency_ms / 1000))
+    backend.populate(clips=clips, markers_per_clip=2)
+    folder = Folder(
+        connection.GetProjectManager().GetCurrentProject().GetMediaPool().GetRootFolder()
+    )
+
+    print(f"Folder.clips on a bin with {clips} clips, {latency_ms} ms per remote call")
+    print(f"{'':8}{'remote calls':>14}{'GetMarkers':>12}{'time':>12}")
+    for label, eager in (("eager", True), ("lazy", False)):
+        total, markers, elapsed = measure(backend, folder, eager)
+        print(f"{label:8}{total:>14}{markers:>12}{elapsed * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.0,
+    )
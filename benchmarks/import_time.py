@@ -0,0 +1,52 @@
+# type: ignore
+"""
+Measures the cost of importing the wrapper modules.
+
+Each run imports ``pydavinci.wrappers.timeline`` in a fresh interpreter and checks that
+no connection to Resolve was made and ``fusionscript`` was never loaded.
+
+Usage:
+    python benchmarks/import_time.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+CHECK = f"""
+import sys
+sys.path.insert(0, {SRC!r})
+import pydavinci.wrappers.timeline
+import pydavinci.main
+assert not pydavinci.main.connection.connected, "import connected to Resolve"
+assert "fusionscript" not in sys.modules, "import loaded fusionscript"
+"""
+
+
+def run_once() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", CHECK], check=True)
+    return time.perf_counter() - start
+
+
+def baseline() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    return time.perf_counter() - start
+
+
+def main(runs: int = 10) -> None:
+    empty = [baseline() for _ in range(runs)]
+    timings = [run_once() for _ in range(runs)]
+
+    print(f"interpreter startup:        {statistics.median(empty) * 1000:8.1f} ms (median)")
+    print(f"import wrappers.timeline:   {statistics.median(timings) * 1000:8.1f} ms (median)")
+    print("remote calls during import:        0 (fusionscript never loaded)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
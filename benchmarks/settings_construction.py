@@ -0,0 +1,101 @@
+# type: ignore
+"""
+Times building ``ProjectSettings`` from a project's ``GetSetting()``.
+
+Runs against the in-memory ``fake`` backend. The "legacy" row is how ``get_prj_settings``
+used to split the settings: a scan of the whole settings dict for each of the 8 models.
+The "routed" row sorts them in one pass with the precomputed routing tables and parses
+only the top level settings, "one section" then uses ``color`` and "all sections" every
+section. The "cached" row is a second ``Project.settings`` on the same project, from
+another wrapper.
+
+Usage:
+    python benchmarks/settings_construction.py [rounds] [latency in ms]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.backends.fake import FakeBackend  # noqa: E402
+from pydavinci.main import connection  # noqa: E402
+from pydavinci.wrappers.project import Project  # noqa: E402
+from pydavinci.wrappers.settings.constructor import (  # noqa: E402
+    PROJECT_SECTIONS,
+    ProjectSettings,
+    get_prj_settings,
+)
+from pydavinci.wrappers.settings.map import super_scale_transform  # noqa: E402
+
+
+def legacy(obj: Project) -> ProjectSettings:
+    data = obj._obj.GetSetting()
+    data["_selfvalidate"] = False
+    data["superScale"] = super_scale_transform(data["superScale"])
+
+    const = {}
+    for section, model in PROJECT_SECTIONS.items():
+        keys = {}
+        for field in model.__fields__.values():
+            if field.alias in data.keys():
+                keys[field.alias] = data[field.alias]
+        parsed = model.parse_obj(keys)
+        if section:
+            parsed._obj = obj._obj
+            parsed._selfvalidate = True
+            const[section] = parsed
+        else:
+            const.update(parsed.dict())
+
+    _ret = ProjectSettings.construct(_fields_set=None, **const)
+    _ret._obj = obj._obj
+    _ret._selfvalidate = True
+    return _ret
+
+
+def measure(backend: FakeBackend, build, rounds: int) -> tuple:
+    backend.reset_calls()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build()
+    elapsed = time.perf_counter() - start
+    return backend.total_calls / rounds, elapsed * 1000 / rounds
+
+
+def main(rounds: int = 200, latency_ms: float = 0.0) -> None:
+    backend = connection.use_backend(FakeBackend(latency=latency_ms / 1000))
+    project = Project(connection.GetProjectManager().GetCurrentProject())
+
+    def routed():
+        return get_prj_settings(project, cached=False)
+
+    def one_section():
+        return get_prj_settings(project, cached=False).color
+
+    def all_sections():
+        return get_prj_settings(project, cached=False).dict()
+
+    def cached():
+        return Project(project._obj).settings
+
+    print(f"ProjectSettings construction, {rounds} rounds, {latency_ms} ms per remote call")
+    print(f"{'':14}{'remote calls':>14}{'time':>12}")
+    project.settings  # noqa: B018
+    for label, build in (
+        ("legacy", lambda: legacy(project)),
+        ("routed", routed),
+        ("one section", one_section),
+        ("all sections", all_sections),
+        ("cached", cached),
+    ):
+        calls, elapsed = measure(backend, build, rounds)
+        print(f"{label:14}{calls:>14.0f}{elapsed:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 200,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.0,
+    )
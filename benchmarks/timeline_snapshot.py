@@ -0,0 +1,91 @@
+# type: ignore
+"""
+Reads every item of a long timeline, per item and with ``Timeline.snapshot()``.
+
+Runs against the in-memory ``fake`` backend, which counts every remote call and can add
+a per-call latency to stand in for the round-trip to Resolve. Calls are made one at a
+time, like with ``fusionscript``. The "per item" row is the usual loop over
+``Timeline.items`` reading each ``TimelineItem`` property into a dict. The "indexed" row
+takes the positions from a ``TimelineIndex`` built beforehand. Memory is what the results
+take, measured with ``tracemalloc``.
+
+Usage:
+    python benchmarks/timeline_snapshot.py [items] [latency in ms]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydavinci.backends.fake import FakeBackend  # noqa: E402
+from pydavinci.main import connection  # noqa: E402
+from pydavinci.utils import TRACK_TYPES  # noqa: E402
+from pydavinci.wrappers.timeline import Timeline  # noqa: E402
+
+
+def per_item(timeline: Timeline) -> list:
+    rows = []
+    for track_type in TRACK_TYPES:
+        for index in range(1, timeline.track_count(track_type) + 1):
+            for item in timeline.items(track_type, index):
+                mediapoolitem = item._obj.GetMediaPoolItem()
+                rows.append(
+                    {
+                        "item": item,
+                        "track_type": track_type,
+                        "track_index": index,
+                        "name": item.name,
+                        "start": item.start,
+                        "end": item.end,
+                        "duration": item.duration,
+                        "left_offset": item.left_offset,
+                        "right_offset": item.right_offset,
+                        "media_id": mediapoolitem.GetMediaId() if mediapoolitem else "",
+                        "flags": item.flags,
+                        "clip_color": item.color,
+                    }
+                )
+    return rows
+
+
+def measure(backend: FakeBackend, read) -> tuple:
+    backend.reset_calls()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = read()
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return backend.total_calls, elapsed, memory
+
+
+def main(items: int = 20000, latency_ms: float = 0.0) -> None:
+    backend = connection.use_backend(FakeBackend(latency=latency_ms / 1000, max_workers=1))
+    clips = backend.populate(clips=200).clips
+    fake = backend.resolve.project.media_pool._new_timeline("Feature")
+    for i in range(items):
+        fake.add_item(clips[i % len(clips)], duration=48, track_index=i % 4 + 1)
+    timeline = Timeline(fake)
+
+    print(f"Reading {items} timeline items, {latency_ms} ms per remote call")
+    print(f"{'':10}{'remote calls':>14}{'time':>12}{'memory':>12}")
+    index = timeline.index()
+    runs = (
+        ("per item", lambda: per_item(timeline)),
+        ("snapshot", timeline.snapshot),
+        ("indexed", lambda: timeline.snapshot(index=index)),
+    )
+    for label, read in runs:
+        calls, elapsed, memory = measure(backend, read)
+        print(f"{label:10}{calls:>14}{elapsed * 1000:>9.1f} ms{memory / 1024:>9.0f} kB")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 0.0,
+    )
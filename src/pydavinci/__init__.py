@@ -1,4 +1,5 @@
 # type: ignore
+from .instrumentation import profile  # noqa: F401
 from .wrappers import resolve as davinci  # noqa: F401
 
 __version__ = "0.3.1"
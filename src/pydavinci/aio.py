@@ -0,0 +1,244 @@
+"""
+asyncio facade over the wrappers.
+
+Every remote call runs on a worker thread, so an event loop can drive Resolve alongside
+network I/O without stalling:
+
+```python
+from pydavinci import aio
+
+async def main():
+    resolve = aio.Resolve()
+    pool = await resolve.media_pool
+    async for path, clip in pool.iter_clips(name="*.mov"):
+        print(path, await clip.name, await clip.get_metadata("Scene"))
+    project = await resolve.project
+    await project.set("name", "Ingest")
+```
+
+Async wrappers mirror the regular ones: method calls are awaited, properties are
+awaited (``await clip.name``) and set with ``await wrapper.set(name, value)``, and
+generators such as ``iter_clips`` become async iterators. Wrappers returned by a call,
+on their own or in lists and tuples, come back wrapped as well. The regular wrapper is
+always available as ``.sync``.
+
+Calls are serialised on a single worker thread, or spread over a pool when the backend
+allows concurrent calls (see [``Backend.max_workers``][pydavinci.backends.Backend]).
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, Generator, Optional, Type
+
+from pydavinci.backends import Backend
+from pydavinci.main import connection
+from pydavinci.wrappers.mediapool import MediaPool as _MediaPool
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem as _MediaPoolItem
+from pydavinci.wrappers.project import Project as _Project
+from pydavinci.wrappers.resolve import Resolve as _Resolve
+from pydavinci.wrappers.timeline import Timeline as _Timeline
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_backend: Optional[Backend] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Returns the executor remote calls run on, sized for the current backend. Switching
+    backends replaces it.
+
+    Returns:
+        (ThreadPoolExecutor): executor
+    """
+    global _executor, _executor_backend
+    backend = connection.backend
+    with _executor_lock:
+        if _executor is None or _executor_backend is not backend:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ThreadPoolExecutor(backend.max_workers, thread_name_prefix="pydavinci-aio")
+            _executor_backend = backend
+        return _executor
+
+
+def shutdown(wait: bool = True) -> None:
+    """
+    Stops the worker threads. A new executor is started on the next call.
+
+    Args:
+        wait (bool, optional): wait for running calls to finish. Defaults to ``True``.
+    """
+    global _executor, _executor_backend
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+        _executor = _executor_backend = None
+
+
+async def run(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Runs ``func(*args, **kwargs)`` on the remote call executor. Async wrappers in the
+    arguments are passed on as regular ones, and wrappers in the result are returned as
+    async wrappers.
+
+    Args:
+        func (Callable): blocking function making remote calls
+
+    Returns:
+        (Any): what ``func`` returned
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(func, *unwrap(args), **{k: unwrap(v) for k, v in kwargs.items()})
+    result = await loop.run_in_executor(get_executor(), call)
+    return wrap(result)
+
+
+class AsyncWrapper(object):
+    """
+    Async version of any wrapper. Attribute access is forwarded to the wrapped one.
+
+    Args:
+        wrapped (Any): regular wrapper
+    """
+
+    _wraps: ClassVar[Type[Any]] = object
+
+    def __init__(self, wrapped: Any) -> None:
+        self.sync = wrapped
+
+    def __getattr__(self, name: str) -> Any:
+        attr = inspect.getattr_static(type(self.sync), name, None)
+        if isinstance(attr, (property, cached_property)):
+            return run(getattr, self.sync, name)
+        if inspect.isfunction(attr):
+            method = getattr(self.sync, name)
+
+            @functools.wraps(method)
+            def call(*args: Any, **kwargs: Any) -> "AsyncCall":
+                return AsyncCall(method, *args, **kwargs)
+
+            return call
+        return getattr(self.sync, name)
+
+    async def set(self, name: str, value: Any) -> None:
+        """
+        Sets property ``name`` of the wrapped object:
+        ```python
+        await project.set("name", "Dailies")
+        ```
+
+        Args:
+            name (str): property name
+            value (Any): new value
+        """
+        await run(setattr, self.sync, name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AsyncWrapper):
+            return self.sync is other.sync
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(id(self.sync))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({type(self.sync).__name__})"
+
+
+class Resolve(AsyncWrapper):
+    """Async [``Resolve``][pydavinci.wrappers.resolve.Resolve]."""
+
+    _wraps = _Resolve
+
+    def __init__(self, wrapped: Optional[_Resolve] = None) -> None:
+        # Creating the regular Resolve wrapper doesn't make remote calls
+        super().__init__(wrapped if wrapped is not None else _Resolve())
+
+
+class Project(AsyncWrapper):
+    """Async [``Project``][pydavinci.wrappers.project.Project]."""
+
+    _wraps = _Project
+
+
+class MediaPool(AsyncWrapper):
+    """Async [``MediaPool``][pydavinci.wrappers.mediapool.MediaPool]."""
+
+    _wraps = _MediaPool
+
+
+class Timeline(AsyncWrapper):
+    """Async [``Timeline``][pydavinci.wrappers.timeline.Timeline]."""
+
+    _wraps = _Timeline
+
+
+class MediaPoolItem(AsyncWrapper):
+    """Async [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem]."""
+
+    _wraps = _MediaPoolItem
+
+
+ASYNC_WRAPPERS: Dict[Type[Any], Type[AsyncWrapper]] = {
+    cls._wraps: cls for cls in (Resolve, Project, MediaPool, Timeline, MediaPoolItem)
+}
+
+
+def wrap(value: Any) -> Any:
+    """
+    Turns wrappers, and lists or tuples of them, into async wrappers. Anything else is
+    returned as is.
+    """
+    if isinstance(value, list):
+        return [wrap(x) for x in value]
+    if isinstance(value, tuple):
+        return tuple(wrap(x) for x in value)
+    cls = ASYNC_WRAPPERS.get(type(value))
+    if cls is not None:
+        return cls(value)
+    if type(value).__module__.startswith("pydavinci.wrappers."):
+        return AsyncWrapper(value)
+    return value
+
+
+def unwrap(value: Any) -> Any:
+    """Turns async wrappers, and lists or tuples of them, back into regular wrappers."""
+    if isinstance(value, list):
+        return [unwrap(x) for x in value]
+    if isinstance(value, tuple):
+        return tuple(unwrap(x) for x in value)
+    if isinstance(value, AsyncWrapper):
+        return value.sync
+    return value
+
+
+_DONE = object()
+
+
+class AsyncCall(object):
+    """
+    A wrapper method call, run once awaited. Calls returning an iterator, like
+    ``iter_clips``, can be looped over with ``async for`` instead.
+    """
+
+    def __init__(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._method = method
+        self._args = args
+        self._kwargs = kwargs
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        return run(self._method, *self._args, **self._kwargs).__await__()
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        # Each step runs on the executor, as it may fetch more from Resolve
+        iterator = iter(await self)
+        while True:
+            item = await run(next, iterator, _DONE)
+            if item is _DONE:
+                return
+            yield item
@@ -0,0 +1,97 @@
+import importlib
+import os
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteResolve
+
+
+class Backend(object):
+    """
+    Base class for the transports pydavinci uses to reach Resolve.
+
+    A backend hands out the root remote ``Resolve`` object. Every wrapper then talks to
+    the objects it gets back from it, so swapping the backend swaps everything underneath
+    the wrappers.
+    """
+
+    name: str = ""
+
+    max_workers: int = 1
+    """How many threads may call into this backend at the same time."""
+
+    def connect(self) -> "PyRemoteResolve":
+        """
+        Connects and returns the remote ``Resolve`` object, or ``None`` if it isn't reachable.
+
+        Returns:
+            (PyRemoteResolve): remote Resolve object
+        """
+        raise NotImplementedError
+
+    def is_remote(self, obj: Any) -> bool:
+        """
+        Checks if ``obj`` is a remote object handed out by this backend.
+
+        Args:
+            obj (Any): object to check
+
+        Returns:
+            bool: ``True`` if it is, ``False`` otherwise
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+# Backends are imported on demand so selecting one never imports the others.
+BACKENDS: Dict[str, str] = {
+    "fusionscript": "pydavinci.backends.fusionscript.FusionscriptBackend",
+    "fake": "pydavinci.backends.fake.FakeBackend",
+}
+
+DEFAULT_BACKEND = "fusionscript"
+BACKEND_ENV_VARIABLE = "PYDAVINCI_BACKEND"
+
+
+def register_backend(name: str, backend: Union[str, Type[Backend]]) -> None:
+    """
+    Registers ``backend`` under ``name`` so it can be selected with
+    [``get_backend``][pydavinci.backends.get_backend].
+
+    Args:
+        name (str): backend name
+        backend (Union[str, Type[Backend]]): ``Backend`` subclass or its dotted import path
+    """
+    if isinstance(backend, str):
+        BACKENDS[name] = backend
+    else:
+        BACKENDS[name] = f"{backend.__module__}.{backend.__qualname__}"
+
+
+def get_backend(name: Optional[str] = None, **options: Any) -> Backend:
+    """
+    Creates the backend registered as ``name``. If no ``name`` is provided, uses the
+    ``PYDAVINCI_BACKEND`` environment variable and falls back to ``fusionscript``.
+
+    Args:
+        name (str, optional): backend name
+        **options: passed on to the backend constructor
+
+    Raises:
+        ValueError: no backend registered with that name
+
+    Returns:
+        (Backend): backend instance
+    """
+    if not name:
+        name = os.environ.get(BACKEND_ENV_VARIABLE) or DEFAULT_BACKEND
+
+    if name not in BACKENDS:
+        available = ", ".join(BACKENDS)
+        raise ValueError(f'"{name}" is not a valid backend. Available backends are: {available}')
+
+    module_name, _, class_name = BACKENDS[name].rpartition(".")
+    backend_cls: Type[Backend] = getattr(importlib.import_module(module_name), class_name)
+    return backend_cls(**options)
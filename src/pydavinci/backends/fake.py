@@ -0,0 +1,2029 @@
+"""
+In-process simulation of the DaVinci Resolve scripting API.
+
+The fake implements the same CamelCase methods as the remote objects in
+``_resolve_stubs.pyi``, keeps all state in memory and can add a configurable latency to
+every call. It lets the wrappers run, be tested and be benchmarked on machines without
+Resolve, and counts how many remote calls every operation costs.
+
+Helpers that aren't part of the Resolve API are ``snake_case`` so they are never
+mistaken for remote calls (and are neither delayed nor counted).
+"""
+
+import copy
+import os
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from pydavinci import instrumentation
+from pydavinci.backends import Backend
+from pydavinci.pyremoteobject import PyRemoteObject
+
+PAGES = ["media", "cut", "edit", "fusion", "color", "fairlight", "deliver"]
+
+TRACK_TYPES = ["video", "audio", "subtitle"]
+
+MARKER_COLORS = [
+    "Blue",
+    "Cyan",
+    "Green",
+    "Yellow",
+    "Red",
+    "Pink",
+    "Purple",
+    "Fuchsia",
+    "Rose",
+    "Lavender",
+    "Sky",
+    "Mint",
+    "Lemon",
+    "Sand",
+    "Cocoa",
+    "Cream",
+]
+
+METADATA_FIELDS = {
+    "Angle",
+    "Camera #",
+    "Camera Type",
+    "Clip Name",
+    "Comments",
+    "Date Recorded",
+    "Description",
+    "Good Take",
+    "Keywords",
+    "People",
+    "Production Name",
+    "Reel Number",
+    "Roll Card #",
+    "Scene",
+    "Shot",
+    "Take",
+}
+
+RENDER_FORMATS = {
+    "AVI": "avi",
+    "DPX": "dpx",
+    "MP4": "mp4",
+    "MXF OP-Atom": "mxf",
+    "MXF OP1A": "mxf_op1a",
+    "QuickTime": "mov",
+    "TIFF": "tif",
+}
+
+RENDER_CODECS = {
+    "avi": {"Uncompressed 10 bit": "RGB10"},
+    "dpx": {"RGB 10 bit": "RGB10"},
+    "mp4": {"H.264": "H264", "H.265": "H265"},
+    "mxf": {"DNxHD 36 8-bit": "DNxHD36", "DNxHR HQ": "DNxHRHQ"},
+    "mxf_op1a": {"DNxHR HQ": "DNxHRHQ", "DNxHR SQ": "DNxHRSQ"},
+    "mov": {
+        "Apple ProRes 422": "ProRes422",
+        "Apple ProRes 422 HQ": "ProRes422HQ",
+        "Apple ProRes 4444": "ProRes4444",
+        "H.264": "H264",
+        "H.265": "H265",
+    },
+    "tif": {"RGB 8 bit": "RGB8"},
+}
+
+RENDER_RESOLUTIONS = [
+    {"Width": 720, "Height": 480},
+    {"Width": 1280, "Height": 720},
+    {"Width": 1920, "Height": 1080},
+    {"Width": 2048, "Height": 1080},
+    {"Width": 3840, "Height": 2160},
+    {"Width": 4096, "Height": 2160},
+]
+
+RENDER_PRESETS = [
+    "H.264 Master",
+    "H.265 Master",
+    "YouTube - 1080p",
+    "Vimeo - 1080p",
+    "ProRes 422 HQ",
+]
+
+# Values as Resolve 18 hands them out from Project.GetSetting(): nearly everything is
+# a string, booleans are "0"/"1", and superScale is a number.
+PROJECT_SETTINGS: Dict[str, Any] = {
+    "audioCaptureNumChannels": "2",
+    "audioOutputHasTimecode": "0",
+    "audioPlayoutNumChannels": "2",
+    "colorAcesGamutCompressType": "None",
+    "colorAcesIDT": "No Input Transform",
+    "colorAcesNodeLUTProcessingSpace": "acesccAp1",
+    "colorAcesODT": "No Output Transform",
+    "colorGalleryStillsLocation": "",
+    "colorGalleryStillsNamingCustomPattern": "",
+    "colorGalleryStillsNamingEnabled": "0",
+    "colorGalleryStillsNamingPattern": "clipName",
+    "colorGalleryStillsNamingWithStillNumber": "off",
+    "colorKeyframeDynamicsEndProfile": "1",
+    "colorKeyframeDynamicsStartProfile": "1",
+    "colorLuminanceMixerDefaultZero": "0",
+    "colorScienceMode": "davinciYRGB",
+    "colorSpaceInput": "Rec.709",
+    "colorSpaceInputGamma": "Gamma 2.4",
+    "colorSpaceOutput": "Rec.709",
+    "colorSpaceOutputGamma": "Gamma 2.4",
+    "colorSpaceOutputGamutMapping": "None",
+    "colorSpaceOutputGamutSaturationKnee": "0.9",
+    "colorSpaceOutputGamutSaturationMax": "1",
+    "colorSpaceOutputToneLuminanceMax": "100",
+    "colorSpaceOutputToneMapping": "None",
+    "colorSpaceTimeline": "Rec.709",
+    "colorSpaceTimelineGamma": "Gamma 2.4",
+    "colorUseBGRPixelOrderForDPX": "0",
+    "colorUseContrastSCurve": "1",
+    "colorUseLegacyLogGrades": "1",
+    "colorUseLocalVersionsAsDefault": "1",
+    "colorUseStereoConvergenceForEffects": "0",
+    "colorVersion10Name": "",
+    "colorVersion1Name": "",
+    "colorVersion2Name": "",
+    "colorVersion3Name": "",
+    "colorVersion4Name": "",
+    "colorVersion5Name": "",
+    "colorVersion6Name": "",
+    "colorVersion7Name": "",
+    "colorVersion8Name": "",
+    "colorVersion9Name": "",
+    "graphicsWhiteLevel": "200",
+    "hdr10PlusControlsOn": "0",
+    "hdrDolbyControlsOn": "0",
+    "hdrDolbyMasterDisplay": "",
+    "hdrDolbyVersion": "4.0",
+    "hdrMasteringLuminanceMax": "1000",
+    "hdrMasteringOn": "0",
+    "imageDeinterlaceQuality": "normal",
+    "imageEnableFieldProcessing": "0",
+    "imageMotionEstimationMode": "standardFaster",
+    "imageMotionEstimationRange": "medium",
+    "imageResizeMode": "sharper",
+    "imageResizingGamma": "Log",
+    "imageRetimeInterpolation": "nearest",
+    "inputDRT": "None",
+    "inputDRTSatRolloffLimit": "10000",
+    "inputDRTSatRolloffStart": "100",
+    "isAutoColorManage": "0",
+    "limitAudioMeterAlignLevel": "0",
+    "limitAudioMeterDisplayMode": "post_fader",
+    "limitAudioMeterHighLevel": "-8",
+    "limitAudioMeterLUFS": "-23",
+    "limitAudioMeterLoudnessScale": "ebu_18_scale",
+    "limitAudioMeterLowLevel": "-18",
+    "limitBroadcastSafeLevels": "20_120",
+    "limitBroadcastSafeOn": "0",
+    "limitSubtitleCPL": "60",
+    "limitSubtitleCaptionDurationSec": "3",
+    "outputDRT": "None",
+    "outputDRTSatRolloffLimit": "10000",
+    "outputDRTSatRolloffStart": "100",
+    "perfAutoRenderCacheAfterTime": "5",
+    "perfAutoRenderCacheComposite": "0",
+    "perfAutoRenderCacheEnable": "1",
+    "perfAutoRenderCacheFuEffect": "1",
+    "perfAutoRenderCacheTransition": "0",
+    "perfCacheClipsLocation": "",
+    "perfOptimisedCodec": "dnxhd_hq",
+    "perfOptimisedMediaOn": "1",
+    "perfOptimizedResolutionRatio": "auto",
+    "perfProxyMediaOn": "1",
+    "perfProxyResolutionRatio": "original",
+    "perfRenderCacheCodec": "dnxhd_hq",
+    "perfRenderCacheMode": "smart",
+    "rcmPresetMode": "SDR Rec.709",
+    "separateColorSpaceAndGamma": "0",
+    "superScale": 0,
+    "superScaleNoiseReduction": "Medium",
+    "superScaleSharpness": "Medium",
+    "timelineDropFrameTimecode": "0",
+    "timelineFrameRate": "24",
+    "timelineFrameRateMismatchBehavior": "resolve",
+    "timelineInputResMismatchBehavior": "scaleToFit",
+    "timelineInputResMismatchCustomPreset": "",
+    "timelineInputResMismatchUseCustomPreset": "0",
+    "timelineInterlaceProcessing": "0",
+    "timelineOutputPixelAspectRatio": "square",
+    "timelineOutputResMatchTimelineRes": "1",
+    "timelineOutputResMismatchBehavior": "scaleToFit",
+    "timelineOutputResMismatchCustomPreset": "",
+    "timelineOutputResMismatchUseCustomPreset": "0",
+    "timelineOutputResolutionHeight": "1080",
+    "timelineOutputResolutionWidth": "1920",
+    "timelinePixelAspectRatio": "square",
+    "timelinePlaybackFrameRate": "24",
+    "timelineResolutionHeight": "1080",
+    "timelineResolutionWidth": "1920",
+    "timelineSaveThumbsInProject": "0",
+    "timelineWorkingLuminance": "100",
+    "timelineWorkingLuminanceMode": "SDR 100",
+    "useCATransform": "0",
+    "useColorSpaceAwareGradingTools": "0",
+    "useInverseDRT": "1",
+    "videoCaptureCodec": "rgb",
+    "videoCaptureFormat": "mov",
+    "videoCaptureIngestHandles": "0",
+    "videoCaptureLocation": "",
+    "videoCaptureMode": "video_audio",
+    "videoDataLevels": "Video",
+    "videoDataLevelsRetainSubblockAndSuperWhiteData": "0",
+    "videoDeckAdd32Pulldown": "0",
+    "videoDeckBitDepth": "10",
+    "videoDeckFormat": "HD 1080PsF 23.976",
+    "videoDeckNonAutoEditFrames": "0",
+    "videoDeckOutputSyncSource": "auto",
+    "videoDeckPrerollSec": "5",
+    "videoDeckSDIConfiguration": "single_link",
+    "videoDeckUse444SDI": "0",
+    "videoDeckUseAudoEdit": "0",
+    "videoDeckUseStereoSDI": "0",
+    "videoMonitorBitDepth": "10",
+    "videoMonitorFormat": "HD 1080p 24",
+    "videoMonitorMatrixOverrideFor422SDI": "Rec.709",
+    "videoMonitorSDIConfiguration": "single_link",
+    "videoMonitorScaling": "bilinear",
+    "videoMonitorUse444SDI": "0",
+    "videoMonitorUseHDROverHDMI": "0",
+    "videoMonitorUseLevelA": "0",
+    "videoMonitorUseMatrixOverrideFor422SDI": "0",
+    "videoMonitorUseStereoSDI": "0",
+    "videoPlayoutAudioFramesOffset": "0",
+    "videoPlayoutBatchHeadDuration": "0",
+    "videoPlayoutBatchTailDuration": "0",
+    "videoPlayoutLTCFramesOffset": "0",
+    "videoPlayoutMode": "video_audio",
+    "videoPlayoutShowLTC": "0",
+    "videoPlayoutShowSourceTimecode": "0",
+}
+
+# Settings a timeline can override once "useCustomSettings" is on
+TIMELINE_SETTING_KEYS = [
+    "superScale",
+    "timelineDropFrameTimecode",
+    "timelineFrameRate",
+    "timelineInputResMismatchBehavior",
+    "timelineInterlaceProcessing",
+    "timelineOutputPixelAspectRatio",
+    "timelineOutputResMatchTimelineRes",
+    "timelineOutputResMismatchBehavior",
+    "timelineOutputResolutionHeight",
+    "timelineOutputResolutionWidth",
+    "timelinePixelAspectRatio",
+    "timelineResolutionHeight",
+    "timelineResolutionWidth",
+    "videoDataLevels",
+    "videoDataLevelsRetainSubblockAndSuperWhiteData",
+    "videoMonitorBitDepth",
+    "videoMonitorFormat",
+    "videoMonitorMatrixOverrideFor422SDI",
+    "videoMonitorSDIConfiguration",
+    "videoMonitorScaling",
+    "videoMonitorUse444SDI",
+    "videoMonitorUseHDROverHDMI",
+    "videoMonitorUseLevelA",
+    "videoMonitorUseMatrixOverrideFor422SDI",
+    "videoMonitorUseStereoSDI",
+]
+
+TIMELINE_START_FRAME = 86400  # 01:00:00:00 at 24 fps
+
+DEFAULT_CLIP_FPS = 24.0
+
+
+def _setting_value(name: str, value: Any) -> Any:
+    # Resolve stores everything but superScale as strings
+    if name == "superScale":
+        return int(value)
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, (int, float)):
+        return str(value)
+    return value
+
+
+def _frames_to_timecode(frames: int, fps: float) -> str:
+    base = int(round(fps)) or 24
+    frames = max(int(frames), 0)
+    ff = frames % base
+    total_seconds = frames // base
+    return (
+        f"{total_seconds // 3600:02d}:{(total_seconds // 60) % 60:02d}:"
+        f"{total_seconds % 60:02d}:{ff:02d}"
+    )
+
+
+def _timecode_to_frames(timecode: str, fps: float) -> int:
+    base = int(round(fps)) or 24
+    hh, mm, ss, ff = (int(x) for x in timecode.replace(";", ":").split(":"))
+    return ((hh * 60 + mm) * 60 + ss) * base + ff
+
+
+class FakeRemoteObject(PyRemoteObject):
+    """Base class of every simulated remote object.
+
+    Looking up a CamelCase attribute goes through the backend, which counts the call,
+    sleeps for the configured latency and runs the method under the backend's lock.
+    """
+
+    def __init__(self, backend: "FakeBackend") -> None:
+        self._backend = backend
+        self._unique_id = backend.new_id()
+
+    def __getattribute__(self, name: str) -> Any:
+        attr = object.__getattribute__(self, name)
+        if name[:1].isupper() and callable(attr):
+            return object.__getattribute__(self, "_backend").remote_call(name, attr)
+        return attr
+
+    def GetUniqueId(self) -> str:
+        return self._unique_id
+
+
+class _FakeMarkers(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend") -> None:
+        super().__init__(backend)
+        self._markers: Dict[int, Dict[str, Any]] = {}
+
+    def marker_range(self) -> int:
+        # Markers live in [0, marker_range). Overridden by every marker parent.
+        return 2**31
+
+    def add_marker(
+        self,
+        frameid: int,
+        color: str = "Blue",
+        name: str = "",
+        note: str = "",
+        duration: int = 1,
+        customdata: str = "",
+    ) -> bool:
+        frameid = int(frameid)
+        duration = int(duration)
+        if frameid in self._markers or color not in MARKER_COLORS:
+            return False
+        if frameid < 0 or duration < 1 or frameid + duration > self.marker_range():
+            return False
+        self._markers[frameid] = {
+            "color": color,
+            "duration": duration,
+            "note": note,
+            "name": name,
+            "customData": customdata,
+        }
+        return True
+
+    def AddMarker(
+        self, frameId: int, color: str, name: str, note: str, duration: int, customData: str = ""
+    ) -> bool:
+        return self.add_marker(frameId, color, name, note, duration, customData)
+
+    def GetMarkers(self) -> Dict[int, Dict[str, Any]]:
+        return {frame: dict(data) for frame, data in sorted(self._markers.items())}
+
+    def _first_with_customdata(self, customData: str) -> Optional[int]:
+        for frame in sorted(self._markers):
+            if self._markers[frame]["customData"] == customData:
+                return frame
+        return None
+
+    def GetMarkerByCustomData(self, customData: str) -> Dict[int, Dict[str, Any]]:
+        frame = self._first_with_customdata(customData)
+        if frame is None:
+            return {}
+        return {frame: dict(self._markers[frame])}
+
+    def UpdateMarkerCustomData(self, frameId: int, customData: str) -> bool:
+        if int(frameId) not in self._markers:
+            return False
+        self._markers[int(frameId)]["customData"] = customData
+        return True
+
+    def GetMarkerCustomData(self, frameId: int) -> str:
+        marker = self._markers.get(int(frameId))
+        return marker["customData"] if marker else ""
+
+    def DeleteMarkersByColor(self, color: str) -> bool:
+        if color == "All":
+            deleted = list(self._markers)
+        else:
+            deleted = [f for f, data in self._markers.items() if data["color"] == color]
+        for frame in deleted:
+            del self._markers[frame]
+        return bool(deleted)
+
+    def DeleteMarkerAtFrame(self, frameNum: int) -> bool:
+        return self._markers.pop(int(frameNum), None) is not None
+
+    def DeleteMarkerByCustomData(self, customData: str) -> bool:
+        frame = self._first_with_customdata(customData)
+        if frame is None:
+            return False
+        del self._markers[frame]
+        return True
+
+
+class _FakeFlagsAndColor(_FakeMarkers):
+    def __init__(self, backend: "FakeBackend") -> None:
+        super().__init__(backend)
+        self._flags: List[str] = []
+        self._clip_color = ""
+
+    def AddFlag(self, color: str) -> bool:
+        if color not in MARKER_COLORS:
+            return False
+        if color not in self._flags:
+            self._flags.append(color)
+        return True
+
+    def GetFlagList(self) -> List[str]:
+        return list(self._flags)
+
+    def ClearFlags(self, color: str = "All") -> bool:
+        if color == "All":
+            self._flags.clear()
+            return True
+        if color in self._flags:
+            self._flags.remove(color)
+            return True
+        return False
+
+    def GetClipColor(self) -> str:
+        return self._clip_color
+
+    def SetClipColor(self, colorName: str) -> bool:
+        if colorName not in MARKER_COLORS:
+            return False
+        self._clip_color = colorName
+        return True
+
+    def ClearClipColor(self) -> bool:
+        self._clip_color = ""
+        return True
+
+
+class FakeMediaPoolItem(_FakeFlagsAndColor):
+    def __init__(
+        self,
+        backend: "FakeBackend",
+        name: str,
+        file_path: str = "",
+        frames: Optional[int] = None,
+        fps: float = DEFAULT_CLIP_FPS,
+        resolution: str = "1920x1080",
+        clip_type: str = "Video + Audio",
+        **properties: Any,
+    ) -> None:
+        super().__init__(backend)
+        if frames is None:
+            # Stable, varied clip lengths between 100 and 499 frames
+            frames = 100 + zlib.crc32(name.encode()) % 400
+        self._media_id = str(uuid.uuid4())
+        self._metadata: Dict[str, str] = {}
+        self._proxy = ""
+        self.folder: Optional["FakeFolder"] = None
+        self._properties: Dict[str, Any] = {
+            "Clip Name": name,
+            "File Name": os.path.basename(file_path) or name,
+            "File Path": file_path,
+            "Type": clip_type,
+            "Resolution": resolution,
+            "FPS": fps,
+            "Frames": str(frames),
+            "Start": "0",
+            "End": str(frames - 1),
+            "Duration": _frames_to_timecode(frames, fps),
+            "Start TC": "00:00:00:00",
+            "End TC": _frames_to_timecode(frames, fps),
+            "Format": os.path.splitext(file_path)[1].lstrip(".").upper() or "QuickTime",
+            "Video Codec": "Apple ProRes 422 HQ",
+            "Audio Codec": "Linear PCM",
+            "Audio Ch": "2",
+            "Sample Rate": "48000",
+            "Proxy": "None",
+            "Proxy Media Path": "",
+            "Date Added": time.strftime("%a %b %d %Y %H:%M:%S"),
+            "Comments": "",
+            "Description": "",
+        }
+        self._properties.update(properties)
+
+    @property
+    def frames(self) -> int:
+        return int(self._properties["Frames"])
+
+    def marker_range(self) -> int:
+        return self.frames
+
+    def GetName(self) -> str:
+        return self._properties["Clip Name"]
+
+    def GetMetadata(self, metadataType: Optional[str] = None) -> Union[str, Dict[str, str]]:
+        if metadataType:
+            return self._metadata.get(metadataType, "")
+        return dict(self._metadata)
+
+    def SetMetadata(self, metadata: Union[str, Dict[str, Any]], value: Any = None) -> bool:
+        if isinstance(metadata, str):
+            metadata = {metadata: value}
+        if not metadata or any(key not in METADATA_FIELDS for key in metadata):
+            return False
+        self._metadata.update({key: str(value) for key, value in metadata.items()})
+        return True
+
+    def GetMediaId(self) -> str:
+        return self._media_id
+
+    def GetClipProperty(self, propertyName: Optional[str] = None) -> Union[str, Dict[str, Any]]:
+        if propertyName:
+            return self._properties.get(propertyName, "")
+        properties = dict(self._properties)
+        properties["Flags"] = ", ".join(self._flags)
+        properties["Clip Color"] = self._clip_color
+        return properties
+
+    def SetClipProperty(self, propertyName: str, propertyValue: Any) -> bool:
+        if propertyName not in self._properties or propertyName in ("File Path", "Frames"):
+            return False
+        self._properties[propertyName] = propertyValue
+        return True
+
+    def LinkProxyMedia(self, proxyMediaFilePath: str) -> bool:
+        self._proxy = proxyMediaFilePath
+        self._properties["Proxy"] = "1920x1080"
+        self._properties["Proxy Media Path"] = proxyMediaFilePath
+        return True
+
+    def UnlinkProxyMedia(self) -> bool:
+        if not self._proxy:
+            return False
+        self._proxy = ""
+        self._properties["Proxy"] = "None"
+        self._properties["Proxy Media Path"] = ""
+        return True
+
+    def ReplaceClip(self, filePath: str) -> bool:
+        self._properties["File Path"] = filePath
+        self._properties["File Name"] = os.path.basename(filePath)
+        return True
+
+
+class FakeFolder(FakeRemoteObject):
+    def __init__(
+        self, backend: "FakeBackend", name: str, parent: Optional["FakeFolder"] = None
+    ) -> None:
+        super().__init__(backend)
+        self.name = name
+        self.parent = parent
+        self.clips: List[FakeMediaPoolItem] = []
+        self.subfolders: List["FakeFolder"] = []
+
+    def add_clip(self, name: str, **properties: Any) -> FakeMediaPoolItem:
+        """Creates a clip in this folder without going through the API."""
+        clip = FakeMediaPoolItem(self._backend, name, **properties)
+        clip.folder = self
+        self.clips.append(clip)
+        return clip
+
+    def add_subfolder(self, name: str) -> "FakeFolder":
+        """Creates a subfolder without going through the API."""
+        folder = FakeFolder(self._backend, name, self)
+        self.subfolders.append(folder)
+        return folder
+
+    def GetClipList(self) -> List[FakeMediaPoolItem]:
+        return list(self.clips)
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetSubFolderList(self) -> List["FakeFolder"]:
+        return list(self.subfolders)
+
+    def GetIsFolderStale(self) -> bool:
+        return False
+
+
+class FakeTimelineItem(_FakeFlagsAndColor):
+    def __init__(
+        self,
+        backend: "FakeBackend",
+        timeline: "FakeTimeline",
+        mediapoolitem: Optional[FakeMediaPoolItem],
+        start: int,
+        duration: int,
+        left_offset: int = 0,
+        right_offset: int = 0,
+        name: Optional[str] = None,
+    ) -> None:
+        super().__init__(backend)
+        self.timeline = timeline
+        self.mediapoolitem = mediapoolitem
+        self.start = int(start)
+        self.duration = int(duration)
+        self.left_offset = int(left_offset)
+        self.right_offset = int(right_offset)
+        self.name = name if name is not None else (mediapoolitem.GetName() if mediapoolitem else "")
+        self._properties: Dict[str, Any] = {
+            "Pan": 0.0,
+            "Tilt": 0.0,
+            "ZoomX": 1.0,
+            "ZoomY": 1.0,
+            "ZoomGang": True,
+            "RotationAngle": 0.0,
+            "AnchorPointX": 0.0,
+            "AnchorPointY": 0.0,
+            "Pitch": 0.0,
+            "Yaw": 0.0,
+            "FlipX": False,
+            "FlipY": False,
+            "CropLeft": 0.0,
+            "CropRight": 0.0,
+            "CropTop": 0.0,
+            "CropBottom": 0.0,
+            "CropSoftness": 0.0,
+            "CropRetain": False,
+            "DynamicZoomEase": 0,
+            "CompositeMode": 0,
+            "Opacity": 100.0,
+            "Distortion": 0.0,
+            "RetimeProcess": 0,
+            "MotionEstimation": 0,
+            "Scaling": 0,
+            "ResizeFilter": 0,
+        }
+        self._versions: Dict[int, List[str]] = {0: ["Version 1"], 1: []}
+        self._current_version: Dict[str, Any] = {"versionName": "Version 1", "versionType": 0}
+        self._luts: Dict[int, str] = {}
+        self._cdl: Dict[str, str] = {}
+        self._takes: List[Dict[str, Any]] = []
+        self._selected_take = 0
+        self._fusion_comps: List[str] = []
+
+    @property
+    def end(self) -> int:
+        return self.start + self.duration
+
+    def marker_range(self) -> int:
+        return self.duration
+
+    def GetName(self) -> str:
+        return self.name
+
+    def GetDuration(self) -> int:
+        return self.duration
+
+    def GetStart(self) -> int:
+        return self.start
+
+    def GetEnd(self) -> int:
+        return self.end
+
+    def GetLeftOffset(self) -> int:
+        return self.left_offset
+
+    def GetRightOffset(self) -> int:
+        return self.right_offset
+
+    def GetProperty(self, propertyKey: Optional[str] = None) -> Any:
+        if propertyKey:
+            return self._properties.get(propertyKey)
+        return dict(self._properties)
+
+    def SetProperty(self, propertyKey: str, propertyValue: Any) -> bool:
+        if propertyKey not in self._properties:
+            return False
+        self._properties[propertyKey] = propertyValue
+        return True
+
+    def GetMediaPoolItem(self) -> Optional[FakeMediaPoolItem]:
+        return self.mediapoolitem
+
+    def GetFusionCompCount(self) -> int:
+        return len(self._fusion_comps)
+
+    def GetFusionCompByIndex(self, compIndex: int) -> Any:
+        if 1 <= compIndex <= len(self._fusion_comps):
+            return self._fusion_comps[compIndex - 1]
+        return None
+
+    def GetFusionCompNameList(self) -> List[str]:
+        return list(self._fusion_comps)
+
+    def GetFusionCompByName(self, compName: str) -> Any:
+        return compName if compName in self._fusion_comps else None
+
+    def AddFusionComp(self) -> Any:
+        name = f"Composition {len(self._fusion_comps) + 1}"
+        self._fusion_comps.append(name)
+        return name
+
+    def ImportFusionComp(self, path: str) -> Any:
+        name = os.path.splitext(os.path.basename(path))[0]
+        self._fusion_comps.append(name)
+        return name
+
+    def ExportFusionComp(self, path: str, compIndex: int) -> bool:
+        return 1 <= compIndex <= len(self._fusion_comps)
+
+    def DeleteFusionCompByName(self, compName: str) -> bool:
+        if compName not in self._fusion_comps:
+            return False
+        self._fusion_comps.remove(compName)
+        return True
+
+    def LoadFusionCompByName(self, compName: str) -> Any:
+        return self.GetFusionCompByName(compName)
+
+    def RenameFusionCompByName(self, oldName: str, newName: str) -> bool:
+        if oldName not in self._fusion_comps:
+            return False
+        self._fusion_comps[self._fusion_comps.index(oldName)] = newName
+        return True
+
+    def AddVersion(self, versionName: str, versionType: int) -> bool:
+        versions = self._versions.get(int(versionType))
+        if versions is None or versionName in versions:
+            return False
+        versions.append(versionName)
+        self._current_version = {"versionName": versionName, "versionType": int(versionType)}
+        return True
+
+    def GetCurrentVersion(self) -> Dict[str, Any]:
+        return dict(self._current_version)
+
+    def DeleteVersionByName(self, versionName: str, versionType: int) -> bool:
+        versions = self._versions.get(int(versionType), [])
+        if versionName not in versions or versionName == self._current_version["versionName"]:
+            return False
+        versions.remove(versionName)
+        return True
+
+    def LoadVersionByName(self, versionName: str, versionType: int) -> bool:
+        if versionName not in self._versions.get(int(versionType), []):
+            return False
+        self._current_version = {"versionName": versionName, "versionType": int(versionType)}
+        return True
+
+    def RenameVersionByName(self, oldName: str, newName: str, versionType: int) -> bool:
+        versions = self._versions.get(int(versionType), [])
+        if oldName not in versions or newName in versions:
+            return False
+        versions[versions.index(oldName)] = newName
+        if self._current_version["versionName"] == oldName:
+            self._current_version["versionName"] = newName
+        return True
+
+    def GetVersionNameList(self, versionType: int) -> List[str]:
+        return list(self._versions.get(int(versionType), []))
+
+    def GetStereoConvergenceValues(self) -> Dict[Any, Any]:
+        return {}
+
+    def GetStereoLeftFloatingWindowParams(self) -> Dict[Any, Any]:
+        return {}
+
+    def GetStereoRightFloatingWindowParams(self) -> Dict[Any, Any]:
+        return {}
+
+    def GetNumNodes(self) -> int:
+        return max([1, *self._luts.keys()])
+
+    def SetLUT(self, nodeIndex: int, lutPath: str) -> bool:
+        if nodeIndex < 1:
+            return False
+        self._luts[int(nodeIndex)] = lutPath
+        return True
+
+    def GetLUT(self, nodeIndex: int) -> str:
+        return self._luts.get(int(nodeIndex), "")
+
+    def SetCDL(self, cdl: Dict[str, str]) -> bool:
+        if "NodeIndex" not in cdl:
+            return False
+        self._cdl = dict(cdl)
+        return True
+
+    def AddTake(
+        self,
+        mediapoolitem: FakeMediaPoolItem,
+        startFrame: Optional[int] = 0,
+        endFrame: Optional[int] = 0,
+    ) -> bool:
+        if not isinstance(mediapoolitem, FakeMediaPoolItem):
+            return False
+        if not self._takes and self.mediapoolitem is not None:
+            self._takes.append(
+                {"mediaPoolItem": self.mediapoolitem, "startFrame": 0, "endFrame": 0}
+            )
+            self._selected_take = 1
+        self._takes.append(
+            {"mediaPoolItem": mediapoolitem, "startFrame": startFrame, "endFrame": endFrame}
+        )
+        return True
+
+    def GetSelectedTakeIndex(self) -> int:
+        return self._selected_take
+
+    def GetTakesCount(self) -> int:
+        return len(self._takes)
+
+    def GetTakeByIndex(self, idx: int) -> Dict[Any, Any]:
+        if 1 <= idx <= len(self._takes):
+            return dict(self._takes[idx - 1])
+        return {}
+
+    def DeleteTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes):
+            return False
+        del self._takes[idx - 1]
+        self._selected_take = min(self._selected_take, len(self._takes))
+        return True
+
+    def SelectTakeByIndex(self, idx: int) -> bool:
+        if not 1 <= idx <= len(self._takes):
+            return False
+        self._selected_take = idx
+        self.mediapoolitem = self._takes[idx - 1]["mediaPoolItem"]
+        return True
+
+    def FinalizeTake(self) -> bool:
+        if not self._takes:
+            return False
+        self._takes = []
+        self._selected_take = 0
+        return True
+
+    def CopyGrades(self, items: List["FakeTimelineItem"]) -> bool:
+        for item in items:
+            item._luts = dict(self._luts)
+            item._cdl = dict(self._cdl)
+        return True
+
+
+class FakeTimeline(_FakeMarkers):
+    def __init__(self, backend: "FakeBackend", project: "FakeProject", name: str) -> None:
+        super().__init__(backend)
+        self.project = project
+        self.name = name
+        self.start_frame = TIMELINE_START_FRAME
+        self.tracks: Dict[str, List[List[FakeTimelineItem]]] = {
+            "video": [[]],
+            "audio": [[]],
+            "subtitle": [],
+        }
+        self.track_names: Dict[str, List[str]] = {
+            "video": ["Video 1"],
+            "audio": ["Audio 1"],
+            "subtitle": [],
+        }
+        self.playhead = self.start_frame
+        self.custom_settings: Optional[Dict[str, Any]] = None
+
+    # Helpers
+
+    @property
+    def fps(self) -> float:
+        return float(self.settings()["timelineFrameRate"])
+
+    @property
+    def end_frame(self) -> int:
+        ends = [item.end for tracks in self.tracks.values() for track in tracks for item in track]
+        return max(ends, default=self.start_frame)
+
+    def marker_range(self) -> int:
+        return max(self.end_frame - self.start_frame, 1)
+
+    def settings(self) -> Dict[str, Any]:
+        if self.custom_settings is not None:
+            return self.custom_settings
+        return {key: self.project.settings[key] for key in TIMELINE_SETTING_KEYS}
+
+    def add_track(self, track_type: str) -> int:
+        """Appends an empty track of ``track_type`` and returns its index."""
+        self.tracks[track_type].append([])
+        index = len(self.tracks[track_type])
+        self.track_names[track_type].append(f"{track_type.capitalize()} {index}")
+        return index
+
+    def add_item(
+        self,
+        mediapoolitem: Optional[FakeMediaPoolItem],
+        start: Optional[int] = None,
+        duration: Optional[int] = None,
+        left_offset: int = 0,
+        track_type: str = "video",
+        track_index: int = 1,
+        name: Optional[str] = None,
+    ) -> FakeTimelineItem:
+        """Places an item on a track without going through the API.
+
+        ``start`` defaults to the end of the track and ``duration`` to the rest of the clip.
+        """
+        while len(self.tracks[track_type]) < track_index:
+            self.add_track(track_type)
+        track = self.tracks[track_type][track_index - 1]
+        if start is None:
+            start = track[-1].end if track else self.start_frame
+        source_frames = mediapoolitem.frames if mediapoolitem else (duration or 1)
+        if duration is None:
+            duration = source_frames - left_offset
+        right_offset = max(source_frames - left_offset - duration, 0)
+        item = FakeTimelineItem(
+            self._backend, self, mediapoolitem, start, duration, left_offset, right_offset, name
+        )
+        track.append(item)
+        track.sort(key=lambda x: x.start)
+        return item
+
+    def remove_item(self, item: FakeTimelineItem) -> None:
+        for tracks in self.tracks.values():
+            for track in tracks:
+                if item in track:
+                    track.remove(item)
+
+    # API
+
+    def GetName(self) -> str:
+        return self.name
+
+    def SetName(self, timelineName: str) -> bool:
+        if any(tl.name == timelineName for tl in self.project.timelines if tl is not self):
+            return False
+        self.name = timelineName
+        return True
+
+    def GetStartFrame(self) -> int:
+        return self.start_frame
+
+    def GetEndFrame(self) -> int:
+        return self.end_frame
+
+    def GetTrackCount(self, trackType: str) -> int:
+        return len(self.tracks.get(trackType, []))
+
+    def AddTrack(self, trackType: str, subTrackType: Optional[str] = None) -> bool:
+        if trackType not in self.tracks:
+            return False
+        self.add_track(trackType)
+        return True
+
+    def GetItemListInTrack(self, trackType: str, index: int) -> List[FakeTimelineItem]:
+        tracks = self.tracks.get(trackType, [])
+        if not 1 <= index <= len(tracks):
+            return []
+        return list(tracks[index - 1])
+
+    def ApplyGradeFromDRX(self, path: str, gradeMode: int, items: List[FakeTimelineItem]) -> bool:
+        return gradeMode in (0, 1, 2) and bool(items)
+
+    def GetCurrentTimecode(self) -> str:
+        return _frames_to_timecode(self.playhead, self.fps)
+
+    def SetCurrentTimecode(self, timecode: str) -> bool:
+        try:
+            self.playhead = _timecode_to_frames(timecode, self.fps)
+        except ValueError:
+            return False
+        return True
+
+    def GetCurrentVideoItem(self) -> Optional[FakeTimelineItem]:
+        for track in reversed(self.tracks["video"]):
+            for item in track:
+                if item.start <= self.playhead < item.end:
+                    return item
+        return None
+
+    def GetCurrentClipThumbnailImage(self) -> Dict[str, Any]:
+        if self.GetCurrentVideoItem() is None:
+            return {}
+        return {"width": 320, "height": 180, "format": "RGB 8 bit", "data": ""}
+
+    def GetTrackName(self, trackType: str, trackIndex: int) -> str:
+        names = self.track_names.get(trackType, [])
+        if not 1 <= trackIndex <= len(names):
+            return ""
+        return names[trackIndex - 1]
+
+    def SetTrackName(self, trackType: str, trackIndex: int, name: str) -> bool:
+        names = self.track_names.get(trackType, [])
+        if not 1 <= trackIndex <= len(names):
+            return False
+        names[trackIndex - 1] = name
+        return True
+
+    def DuplicateTimeline(self, timelineName: Optional[str] = None) -> Optional["FakeTimeline"]:
+        name = timelineName or f"{self.name} Copy"
+        if any(tl.name == name for tl in self.project.timelines):
+            return None
+        duplicate = FakeTimeline(self._backend, self.project, name)
+        duplicate.start_frame = self.start_frame
+        duplicate.playhead = self.playhead
+        duplicate.track_names = copy.deepcopy(self.track_names)
+        duplicate._markers = copy.deepcopy(self._markers)
+        duplicate.custom_settings = copy.deepcopy(self.custom_settings)
+        duplicate.tracks = {track_type: [] for track_type in self.tracks}
+        for track_type, tracks in self.tracks.items():
+            for index, track in enumerate(tracks, start=1):
+                duplicate.tracks[track_type].append([])
+                for item in track:
+                    new = duplicate.add_item(
+                        item.mediapoolitem,
+                        item.start,
+                        item.duration,
+                        item.left_offset,
+                        track_type,
+                        index,
+                        item.name,
+                    )
+                    new._markers = copy.deepcopy(item._markers)
+                    new._flags = list(item._flags)
+                    new._clip_color = item._clip_color
+        self.project.timelines.append(duplicate)
+        self.project.media_pool.current_folder.clips.append(
+            self.project.media_pool.timeline_clip(duplicate)
+        )
+        return duplicate
+
+    def _replace_with(self, items: List[FakeTimelineItem], name: str) -> Optional[FakeTimelineItem]:
+        if not items:
+            return None
+        start = min(item.start for item in items)
+        end = max(item.end for item in items)
+        for item in items:
+            self.remove_item(item)
+        return self.add_item(None, start, end - start, name=name)
+
+    def CreateCompoundClip(
+        self, items: List[FakeTimelineItem], clipinfo: Optional[Dict[str, Any]] = None
+    ) -> Optional[FakeTimelineItem]:
+        name = (clipinfo or {}).get("name", "Compound Clip 1")
+        return self._replace_with(list(items), name)
+
+    def CreateFusionClip(self, items: List[FakeTimelineItem]) -> Optional[FakeTimelineItem]:
+        return self._replace_with(list(items), "Fusion Clip 1")
+
+    def ImportIntoTimeline(
+        self, filePath: str, importOptions: Optional[Dict[Any, Any]] = None
+    ) -> bool:
+        return filePath.lower().endswith(".aaf")
+
+    def Export(
+        self, fileName: str, exportType: float, exportSubtype: Optional[float] = None
+    ) -> bool:
+        return bool(fileName) and 0 <= exportType <= 15
+
+    def GetSetting(self, settingName: Optional[str] = None) -> Any:
+        settings = dict(self.settings())
+        settings["useCustomSettings"] = "1" if self.custom_settings is not None else "0"
+        if settingName:
+            return settings.get(settingName, "")
+        return settings
+
+    def SetSetting(self, settingName: str, settingValue: Any) -> bool:
+        if settingName == "useCustomSettings":
+            if str(settingValue) == "1":
+                if self.custom_settings is None:
+                    self.custom_settings = dict(self.settings())
+            else:
+                self.custom_settings = None
+            return True
+        if self.custom_settings is None or settingName not in self.custom_settings:
+            return False
+        self.custom_settings[settingName] = _setting_value(settingName, settingValue)
+        return True
+
+    def _insert_generated(self, name: str) -> FakeTimelineItem:
+        return self.add_item(None, self.playhead, int(round(self.fps)) * 5, name=name)
+
+    def InsertGeneratorIntoTimeline(self, generatorName: str) -> FakeTimelineItem:
+        return self._insert_generated(generatorName)
+
+    def InsertFusionGeneratorIntoTimeline(self, generatorName: str) -> FakeTimelineItem:
+        return self._insert_generated(generatorName)
+
+    def InsertOFXGeneratorIntoTimeline(self, generatorName: str) -> FakeTimelineItem:
+        return self._insert_generated(generatorName)
+
+    def InsertTitleIntoTimeline(self, titleName: str) -> FakeTimelineItem:
+        return self._insert_generated(titleName)
+
+    def InsertFusionTitleIntoTimeline(self, titleName: str) -> FakeTimelineItem:
+        return self._insert_generated(titleName)
+
+    def GrabStill(self) -> Optional["FakeGalleryStill"]:
+        if self.GetCurrentVideoItem() is None:
+            return None
+        still = FakeGalleryStill(self._backend)
+        self.project.gallery.current_album.stills.append(still)
+        return still
+
+    def GrabAllStills(self, stillFrameSource: int) -> List["FakeGalleryStill"]:
+        stills = [FakeGalleryStill(self._backend) for _ in self.tracks["video"][0]]
+        self.project.gallery.current_album.stills.extend(stills)
+        return stills
+
+
+class FakeGalleryStill(FakeRemoteObject):
+    pass
+
+
+class FakeGalleryStillAlbum(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend", name: str) -> None:
+        super().__init__(backend)
+        self.name = name
+        self.stills: List[FakeGalleryStill] = []
+        self.labels: Dict[str, str] = {}
+
+    def GetStills(self) -> List[FakeGalleryStill]:
+        return list(self.stills)
+
+    def GetLabel(self, galleryStill: FakeGalleryStill) -> str:
+        return self.labels.get(galleryStill.GetUniqueId(), "")
+
+    def SetLabel(self, galleryStill: FakeGalleryStill, label: str) -> bool:
+        if galleryStill not in self.stills:
+            return False
+        self.labels[galleryStill.GetUniqueId()] = label
+        return True
+
+    def ExportStills(
+        self, galleryStills: List[FakeGalleryStill], folderPath: str, filePrefix: str, format: str
+    ) -> bool:
+        return all(still in self.stills for still in galleryStills)
+
+    def DeleteStills(self, galleryStills: List[FakeGalleryStill]) -> bool:
+        for still in galleryStills:
+            if still in self.stills:
+                self.stills.remove(still)
+        return True
+
+
+class FakeGallery(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend") -> None:
+        super().__init__(backend)
+        self.albums = [FakeGalleryStillAlbum(backend, "Stills 1")]
+        self.current_album = self.albums[0]
+
+    def GetAlbumName(self, galleryStillAlbum: FakeGalleryStillAlbum) -> str:
+        return galleryStillAlbum.name
+
+    def SetAlbumName(self, galleryStillAlbum: FakeGalleryStillAlbum, albumName: str) -> bool:
+        galleryStillAlbum.name = albumName
+        return True
+
+    def GetCurrentStillAlbum(self) -> FakeGalleryStillAlbum:
+        return self.current_album
+
+    def SetCurrentStillAlbum(self, galleryStillAlbum: FakeGalleryStillAlbum) -> bool:
+        if galleryStillAlbum not in self.albums:
+            return False
+        self.current_album = galleryStillAlbum
+        return True
+
+    def GetGalleryStillAlbums(self) -> List[FakeGalleryStillAlbum]:
+        return list(self.albums)
+
+
+class FakeMediaPool(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend", project: "FakeProject") -> None:
+        super().__init__(backend)
+        self.project = project
+        self.root = FakeFolder(backend, "Master")
+        self.current_folder = self.root
+        self.mattes: Dict[str, List[str]] = {}
+
+    # Helpers
+
+    def folders(self) -> Iterable[FakeFolder]:
+        stack = [self.root]
+        while stack:
+            folder = stack.pop()
+            yield folder
+            stack.extend(folder.subfolders)
+
+    def timeline_clip(self, timeline: FakeTimeline) -> FakeMediaPoolItem:
+        clip = FakeMediaPoolItem(self._backend, timeline.name, clip_type="Timeline")
+        clip.folder = self.current_folder
+        return clip
+
+    def _detach(self, clip: FakeMediaPoolItem) -> None:
+        if clip.folder is not None and clip in clip.folder.clips:
+            clip.folder.clips.remove(clip)
+
+    def _new_timeline(self, name: str) -> Optional[FakeTimeline]:
+        if not name or any(tl.name == name for tl in self.project.timelines):
+            return None
+        timeline = FakeTimeline(self._backend, self.project, name)
+        self.project.timelines.append(timeline)
+        self.project.current_timeline = timeline
+        self.current_folder.clips.append(self.timeline_clip(timeline))
+        return timeline
+
+    def _append(self, timeline: FakeTimeline, clips: List[Any]) -> List[FakeTimelineItem]:
+        appended = []
+        for clip in clips:
+            if isinstance(clip, dict):
+                mpi = clip.get("mediaPoolItem")
+                if not isinstance(mpi, FakeMediaPoolItem):
+                    continue
+                start_frame = int(clip.get("startFrame", 0))
+                end_frame = int(clip.get("endFrame", mpi.frames - 1))
+                media_types = [clip["mediaType"]] if "mediaType" in clip else [1, 2]
+                track_index = int(clip.get("trackIndex", 1))
+                record = clip.get("recordFrame")
+            elif isinstance(clip, FakeMediaPoolItem):
+                mpi, start_frame, end_frame = clip, 0, clip.frames - 1
+                media_types, track_index, record = [1, 2], 1, None
+            else:
+                continue
+            for media_type in media_types:
+                track_type = "video" if media_type == 1 else "audio"
+                if track_type == "audio" and mpi.GetClipProperty("Type") == "Video":
+                    continue
+                item = timeline.add_item(
+                    mpi,
+                    start=int(record) if record is not None else None,
+                    duration=end_frame - start_frame + 1,
+                    left_offset=start_frame,
+                    track_type=track_type,
+                    track_index=track_index,
+                )
+                if track_type == "video" or 1 not in media_types:
+                    appended.append(item)
+        return appended
+
+    # API
+
+    def GetRootFolder(self) -> FakeFolder:
+        return self.root
+
+    def AddSubFolder(self, folder: FakeFolder, name: str) -> Optional[FakeFolder]:
+        if not isinstance(folder, FakeFolder):
+            return None
+        return folder.add_subfolder(name)
+
+    def CreateEmptyTimeline(self, name: str) -> Optional[FakeTimeline]:
+        return self._new_timeline(name)
+
+    def AppendToTimeline(self, clips: List[Any]) -> List[FakeTimelineItem]:
+        timeline = self.project.current_timeline
+        if timeline is None:
+            return []
+        if not isinstance(clips, list):
+            clips = [clips]
+        return self._append(timeline, clips)
+
+    def CreateTimelineFromClips(self, name: str, clips: List[Any]) -> Optional[FakeTimeline]:
+        timeline = self._new_timeline(name)
+        if timeline is not None:
+            self._append(timeline, clips if isinstance(clips, list) else [clips])
+        return timeline
+
+    def ImportTimelineFromFile(
+        self, filePath: str, options: Optional[Dict[str, Any]] = None
+    ) -> Optional[FakeTimeline]:
+        name = (options or {}).get("timelineName") or os.path.splitext(os.path.basename(filePath))[
+            0
+        ]
+        return self._new_timeline(name)
+
+    def DeleteTimelines(self, timelines: List[FakeTimeline]) -> bool:
+        for timeline in timelines:
+            if timeline not in self.project.timelines:
+                return False
+        for timeline in timelines:
+            self.project.timelines.remove(timeline)
+            if self.project.current_timeline is timeline:
+                self.project.current_timeline = (
+                    self.project.timelines[0] if self.project.timelines else None
+                )
+        return True
+
+    def GetCurrentFolder(self) -> FakeFolder:
+        return self.current_folder
+
+    def SetCurrentFolder(self, folder: FakeFolder) -> bool:
+        if not isinstance(folder, FakeFolder):
+            return False
+        self.current_folder = folder
+        return True
+
+    def DeleteClips(self, clips: List[FakeMediaPoolItem]) -> bool:
+        for clip in clips:
+            self._detach(clip)
+            clip.folder = None
+        return True
+
+    def DeleteFolders(self, subfolder: List[FakeFolder]) -> bool:
+        for folder in subfolder:
+            if folder is self.root or folder.parent is None:
+                return False
+            folder.parent.subfolders.remove(folder)
+            if self.current_folder is folder:
+                self.current_folder = self.root
+        return True
+
+    def MoveClips(self, clips: List[FakeMediaPoolItem], targetFolder: FakeFolder) -> bool:
+        for clip in clips:
+            self._detach(clip)
+            clip.folder = targetFolder
+            targetFolder.clips.append(clip)
+        return True
+
+    def MoveFolders(self, folder: List[FakeFolder], targetFolder: FakeFolder) -> bool:
+        for moved in folder:
+            if moved.parent is None:
+                return False
+            moved.parent.subfolders.remove(moved)
+            moved.parent = targetFolder
+            targetFolder.subfolders.append(moved)
+        return True
+
+    def GetClipMatteList(self, MediaPoolItem: FakeMediaPoolItem) -> List[str]:
+        return list(self.mattes.get(MediaPoolItem.GetUniqueId(), []))
+
+    def GetTimelineMatteList(self, folder: FakeFolder) -> List[FakeMediaPoolItem]:
+        return [clip for clip in folder.clips if clip.GetClipProperty("Type") == "Matte"]
+
+    def DeleteClipMattes(self, MediaPoolItem: FakeMediaPoolItem, paths: List[str]) -> bool:
+        mattes = self.mattes.get(MediaPoolItem.GetUniqueId(), [])
+        for path in paths:
+            if path in mattes:
+                mattes.remove(path)
+        return True
+
+    def RelinkClips(self, clips: List[FakeMediaPoolItem], folderPath: str) -> bool:
+        for clip in clips:
+            clip._properties["File Path"] = os.path.join(folderPath, clip._properties["File Name"])
+        return True
+
+    def UnlinkClips(self, clips: List[FakeMediaPoolItem]) -> bool:
+        for clip in clips:
+            clip._properties["Offline"] = "1"
+        return True
+
+    def ImportMedia(self, path: Union[str, List[Any]]) -> List[FakeMediaPoolItem]:
+        paths = [path] if isinstance(path, str) else list(path)
+        files: List[str] = []
+        for entry in paths:
+            if isinstance(entry, dict):
+                entry = entry.get("FilePath", "")
+            if not entry:
+                continue
+            if os.path.isdir(entry):
+                files.extend(
+                    os.path.join(entry, name)
+                    for name in sorted(os.listdir(entry))
+                    if os.path.isfile(os.path.join(entry, name))
+                )
+            else:
+                files.append(entry)
+        return [
+            self.current_folder.add_clip(os.path.basename(file), file_path=file) for file in files
+        ]
+
+    def ExportMetadata(
+        self, fileName: str, clips: Optional[List[FakeMediaPoolItem]] = None
+    ) -> bool:
+        return bool(fileName)
+
+
+class FakeProject(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend", name: str) -> None:
+        super().__init__(backend)
+        self.name = name
+        self.settings: Dict[str, Any] = dict(PROJECT_SETTINGS)
+        self.timelines: List[FakeTimeline] = []
+        self.current_timeline: Optional[FakeTimeline] = None
+        self.media_pool = FakeMediaPool(backend, self)
+        self.gallery = FakeGallery(backend)
+        self.presets = ["Current Project", "Default"]
+        self.render_presets = list(RENDER_PRESETS)
+        self.render_settings: Dict[str, Any] = {
+            "SelectAllFrames": True,
+            "TargetDir": "",
+            "CustomName": "",
+        }
+        self.render_format = "mov"
+        self.render_codec = "ProRes422HQ"
+        self.render_mode = 1
+        self.render_jobs: List[Dict[str, Any]] = []
+        self._job_counter = 0
+
+    # Render simulation. Jobs render one after the other at ``backend.render_fps``
+    # frames per second of (simulated) wall clock.
+
+    def _job_status(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        now = self._backend.clock()
+        start: Optional[float] = job.get("_start")
+        cancelled: Optional[float] = job.get("_cancelled")
+        if start is None:
+            status = "Cancelled" if cancelled is not None else "Ready"
+            return {"JobStatus": status, "CompletionPercentage": 0}
+        end: float = job["_end"]
+        if cancelled is not None and cancelled < end:
+            done = max(cancelled - start, 0) / (end - start)
+            return {"JobStatus": "Cancelled", "CompletionPercentage": int(done * 100)}
+        if now < start:
+            return {"JobStatus": "Ready", "CompletionPercentage": 0}
+        if now >= end:
+            return {
+                "JobStatus": "Complete",
+                "CompletionPercentage": 100,
+                "TimeTakenToRenderInMs": int(round((end - start) * 1000)),
+            }
+        return {
+            "JobStatus": "Rendering",
+            "CompletionPercentage": int((now - start) / (end - start) * 100),
+            "EstimatedTimeRemainingInMs": int(round((end - now) * 1000)),
+        }
+
+    def _queue_end(self) -> float:
+        ends = [
+            job["_end"]
+            for job in self.render_jobs
+            if job.get("_end") is not None and job.get("_cancelled") is None
+        ]
+        return max([self._backend.clock(), *ends])
+
+    # API
+
+    def GetMediaPool(self) -> FakeMediaPool:
+        return self.media_pool
+
+    def GetTimelineCount(self) -> int:
+        return len(self.timelines)
+
+    def GetTimelineByIndex(self, idx: int) -> Optional[FakeTimeline]:
+        if 1 <= idx <= len(self.timelines):
+            return self.timelines[idx - 1]
+        return None
+
+    def GetCurrentTimeline(self) -> Optional[FakeTimeline]:
+        return self.current_timeline
+
+    def SetCurrentTimeline(self, timeline: FakeTimeline) -> bool:
+        if timeline not in self.timelines:
+            return False
+        self.current_timeline = timeline
+        return True
+
+    def GetGallery(self) -> FakeGallery:
+        return self.gallery
+
+    def GetName(self) -> str:
+        return self.name
+
+    def SetName(self, projectName: str) -> bool:
+        if not projectName:
+            return False
+        self.name = projectName
+        return True
+
+    def GetPresetList(self) -> List[str]:
+        return list(self.presets)
+
+    def SetPreset(self, presetName: str) -> bool:
+        return presetName in self.presets
+
+    def AddRenderJob(self) -> str:
+        timeline = self.current_timeline
+        if timeline is None:
+            return ""
+        self._job_counter += 1
+        job_id = str(uuid.uuid4())
+        settings = self.render_settings
+        if settings.get("SelectAllFrames", True) or "MarkIn" not in settings:
+            mark_in, mark_out = timeline.start_frame, max(
+                timeline.end_frame - 1, timeline.start_frame
+            )
+        else:
+            mark_in, mark_out = int(settings["MarkIn"]), int(
+                settings.get("MarkOut", settings["MarkIn"])
+            )
+        job = {
+            "JobId": job_id,
+            "RenderJobName": f"Job {self._job_counter}",
+            "TimelineName": timeline.name,
+            "TargetDir": settings.get("TargetDir", ""),
+            "OutputFilename": (settings.get("CustomName") or timeline.name)
+            + f".{self.render_format}",
+            "IsExportVideo": settings.get("ExportVideo", True),
+            "IsExportAudio": settings.get("ExportAudio", True),
+            "FormatWidth": int(
+                settings.get("FormatWidth", timeline.settings()["timelineResolutionWidth"])
+            ),
+            "FormatHeight": int(
+                settings.get("FormatHeight", timeline.settings()["timelineResolutionHeight"])
+            ),
+            "FrameRate": str(settings.get("FrameRate", timeline.fps)),
+            "PixelAspectRatio": 1.0,
+            "MarkIn": mark_in,
+            "MarkOut": mark_out,
+            "AudioBitDepth": int(settings.get("AudioBitDepth", 24)),
+            "AudioSampleRate": int(settings.get("AudioSampleRate", 48000)),
+            "ExportAlpha": settings.get("ExportAlpha", False),
+            "RenderMode": "Single clip" if self.render_mode == 1 else "Individual clips",
+            "PresetName": settings.get("PresetName", "Custom"),
+            "VideoFormat": self.render_format,
+            "VideoCodec": self.render_codec,
+            "AudioCodec": settings.get("AudioCodec", "lpcm"),
+            "_frames": mark_out - mark_in + 1,
+        }
+        if self._backend.dropped_job_ids > 0:
+            # Reproduces the Resolve bug where AddRenderJob() comes back empty-handed.
+            # With ghost_jobs the job still lands in the queue.
+            self._backend.dropped_job_ids -= 1
+            if self._backend.ghost_jobs:
+                self.render_jobs.append(job)
+            return ""
+        self.render_jobs.append(job)
+        return job_id
+
+    def DeleteRenderJob(self, jobId: str) -> bool:
+        for job in self.render_jobs:
+            if job["JobId"] == jobId:
+                if self._job_status(job)["JobStatus"] == "Rendering":
+                    return False
+                self.render_jobs.remove(job)
+                return True
+        return False
+
+    def DeleteAllRenderJobs(self) -> bool:
+        if self.IsRenderingInProgress():
+            return False
+        self.render_jobs.clear()
+        return True
+
+    def GetRenderJobList(self) -> List[Dict[str, Any]]:
+        return [
+            {key: value for key, value in job.items() if not key.startswith("_")}
+            for job in self.render_jobs
+        ]
+
+    def GetRenderPresetList(self) -> List[str]:
+        return list(self.render_presets)
+
+    def StartRendering(self, *jobids: Any, isInteractiveMode: bool = False) -> bool:
+        ids: List[str] = []
+        for job_id in jobids:
+            if isinstance(job_id, (list, tuple)):
+                ids.extend(job_id)
+            else:
+                ids.append(job_id)
+        jobs = [
+            job
+            for job in self.render_jobs
+            if (not ids or job["JobId"] in ids)
+            and self._job_status(job)["JobStatus"] in ("Ready", "Cancelled", "Failed")
+        ]
+        if not jobs:
+            return False
+        cursor = self._queue_end()
+        for job in jobs:
+            job["_start"] = cursor
+            cursor += job["_frames"] / self._backend.render_fps
+            job["_end"] = cursor
+            job.pop("_cancelled", None)
+        return True
+
+    def StopRendering(self) -> None:
+        now = self._backend.clock()
+        for job in self.render_jobs:
+            if job.get("_end") is not None and job["_end"] > now and job.get("_cancelled") is None:
+                job["_cancelled"] = now
+
+    def IsRenderingInProgress(self) -> bool:
+        return any(self._job_status(job)["JobStatus"] == "Rendering" for job in self.render_jobs)
+
+    def LoadRenderPreset(self, presetName: str) -> bool:
+        if presetName not in self.render_presets:
+            return False
+        self.render_settings["PresetName"] = presetName
+        return True
+
+    def SaveAsNewRenderPreset(self, presetName: str) -> bool:
+        if presetName in self.render_presets:
+            return False
+        self.render_presets.append(presetName)
+        return True
+
+    def SetRenderSettings(self, settings: Dict[str, Any]) -> bool:
+        self.render_settings.update(settings)
+        return True
+
+    def GetRenderJobStatus(self, jobId: str) -> Dict[str, Any]:
+        for job in self.render_jobs:
+            if job["JobId"] == jobId:
+                return self._job_status(job)
+        return {}
+
+    def GetSetting(self, settingName: Optional[str] = None) -> Any:
+        if settingName:
+            return self.settings.get(settingName, "")
+        return dict(self.settings)
+
+    def SetSetting(self, settingName: str, settingValue: Any) -> bool:
+        if settingName not in self.settings:
+            return False
+        self.settings[settingName] = _setting_value(settingName, settingValue)
+        return True
+
+    def GetRenderFormats(self) -> Dict[str, str]:
+        return dict(RENDER_FORMATS)
+
+    def GetRenderCodecs(self, renderFormat: str) -> Dict[str, str]:
+        return dict(RENDER_CODECS.get(RENDER_FORMATS.get(renderFormat, renderFormat), {}))
+
+    def GetCurrentRenderFormatAndCodec(self) -> Dict[str, str]:
+        return {"format": self.render_format, "codec": self.render_codec}
+
+    def SetCurrentRenderFormatAndCodec(self, format: str, codec: str) -> bool:
+        if codec not in RENDER_CODECS.get(format, {}).values():
+            return False
+        self.render_format, self.render_codec = format, codec
+        return True
+
+    def GetCurrentRenderMode(self) -> int:
+        return self.render_mode
+
+    def SetCurrentRenderMode(self, renderMode: int) -> bool:
+        if renderMode not in (0, 1):
+            return False
+        self.render_mode = renderMode
+        return True
+
+    def GetRenderResolutions(
+        self, format: Optional[str] = None, codec: Optional[str] = None
+    ) -> List[Dict[str, int]]:
+        return [dict(resolution) for resolution in RENDER_RESOLUTIONS]
+
+    def RefreshLUTList(self) -> bool:
+        return True
+
+
+class FakeProjectManager(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend") -> None:
+        super().__init__(backend)
+        # Folders are nested dicts, projects live in the "projects" key of their folder
+        self.root: Dict[str, Any] = {"folders": {}, "projects": {}}
+        self.path: List[str] = []
+        self.current_project = self._create("Untitled Project")
+        self.database = {"DbType": "Disk", "DbName": "Local Database"}
+
+    def _folder(self) -> Dict[str, Any]:
+        folder = self.root
+        for name in self.path:
+            folder = folder["folders"][name]
+        return folder
+
+    def _create(self, name: str) -> FakeProject:
+        project = FakeProject(self._backend, name)
+        self._folder()["projects"][name] = project
+        return project
+
+    def CreateProject(self, projectName: str) -> Optional[FakeProject]:
+        if not projectName or projectName in self._folder()["projects"]:
+            return None
+        self.current_project = self._create(projectName)
+        return self.current_project
+
+    def DeleteProject(self, projectName: str) -> bool:
+        projects = self._folder()["projects"]
+        if projectName not in projects or projects[projectName] is self.current_project:
+            return False
+        del projects[projectName]
+        return True
+
+    def LoadProject(self, projectName: str) -> Optional[FakeProject]:
+        project = self._folder()["projects"].get(projectName)
+        if project is not None:
+            self.current_project = project
+        return project
+
+    def GetCurrentProject(self) -> FakeProject:
+        return self.current_project
+
+    def SaveProject(self) -> bool:
+        return True
+
+    def CloseProject(self, project: FakeProject) -> bool:
+        if project is not self.current_project:
+            return False
+        # Resolve always falls back to an untitled project
+        path, self.path = self.path, []
+        self.current_project = self.root["projects"].get("Untitled Project") or self._create(
+            "Untitled Project"
+        )
+        self.path = path
+        return True
+
+    def CreateFolder(self, folderName: str) -> bool:
+        folders = self._folder()["folders"]
+        if not folderName or folderName in folders:
+            return False
+        folders[folderName] = {"folders": {}, "projects": {}}
+        return True
+
+    def DeleteFolder(self, folderName: str) -> bool:
+        return self._folder()["folders"].pop(folderName, None) is not None
+
+    def GetProjectListInCurrentFolder(self) -> List[str]:
+        return list(self._folder()["projects"])
+
+    def GetFolderListInCurrentFolder(self) -> List[str]:
+        return list(self._folder()["folders"])
+
+    def GotoRootFolder(self) -> bool:
+        self.path = []
+        return True
+
+    def GotoParentFolder(self) -> bool:
+        if not self.path:
+            return False
+        self.path.pop()
+        return True
+
+    def GetCurrentFolder(self) -> str:
+        return self.path[-1] if self.path else ""
+
+    def OpenFolder(self, folderName: str) -> bool:
+        if folderName not in self._folder()["folders"]:
+            return False
+        self.path.append(folderName)
+        return True
+
+    def ImportProject(self, filePath: str) -> bool:
+        name = os.path.splitext(os.path.basename(filePath))[0]
+        if not name or name in self._folder()["projects"]:
+            return False
+        self._create(name)
+        return True
+
+    def ExportProject(
+        self, projectName: str, filePath: str, withStillsAndLUTs: bool = True
+    ) -> bool:
+        return projectName in self._folder()["projects"]
+
+    def RestoreProject(self, filePath: str) -> bool:
+        return self.ImportProject(filePath)
+
+    def GetCurrentDatabase(self) -> Dict[str, str]:
+        return dict(self.database)
+
+    def GetDatabaseList(self) -> List[Dict[str, str]]:
+        return [dict(self.database)]
+
+    def SetCurrentDatabase(self, dbInfo: Dict[str, str]) -> bool:
+        return dbInfo.get("DbName") == self.database["DbName"]
+
+
+class FakeMediaStorage(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend", resolve: "FakeResolve") -> None:
+        super().__init__(backend)
+        self.resolve = resolve
+
+    def _media_pool(self) -> FakeMediaPool:
+        return self.resolve.project_manager.current_project.media_pool
+
+    def GetMountedVolumeList(self) -> List[str]:
+        return [os.path.abspath(os.sep)]
+
+    def GetSubFolderList(self, folderPath: str) -> List[str]:
+        if not os.path.isdir(folderPath):
+            return []
+        return sorted(
+            os.path.join(folderPath, name)
+            for name in os.listdir(folderPath)
+            if os.path.isdir(os.path.join(folderPath, name))
+        )
+
+    def GetFileList(self, folderPath: str) -> List[str]:
+        if not os.path.isdir(folderPath):
+            return []
+        return sorted(
+            os.path.join(folderPath, name)
+            for name in os.listdir(folderPath)
+            if os.path.isfile(os.path.join(folderPath, name))
+        )
+
+    def RevealInStorage(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def AddItemListToMediaPool(self, items: Union[str, List[Any]]) -> List[FakeMediaPoolItem]:
+        return self._media_pool().ImportMedia(items)
+
+    def AddClipMattesToMediaPool(
+        self, MediaPoolItem: FakeMediaPoolItem, paths: List[str], stereoEye: str = ""
+    ) -> bool:
+        self._media_pool().mattes.setdefault(MediaPoolItem.GetUniqueId(), []).extend(paths)
+        return True
+
+    def AddTimelineMattesToMediaPool(self, paths: List[str]) -> List[FakeMediaPoolItem]:
+        folder = self._media_pool().current_folder
+        return [
+            folder.add_clip(os.path.basename(path), file_path=path, clip_type="Matte")
+            for path in paths
+        ]
+
+
+class FakeFusion(FakeRemoteObject):
+    pass
+
+
+class FakeResolve(FakeRemoteObject):
+    def __init__(self, backend: "FakeBackend") -> None:
+        super().__init__(backend)
+        self.project_manager = FakeProjectManager(backend)
+        self.media_storage = FakeMediaStorage(backend, self)
+        self.fusion = FakeFusion(backend)
+        self.page = "media"
+        self.layouts: Dict[str, str] = {}
+        self.quit = False
+
+    @property
+    def project(self) -> FakeProject:
+        return self.project_manager.current_project
+
+    def Fusion(self) -> FakeFusion:
+        return self.fusion
+
+    def GetMediaStorage(self) -> FakeMediaStorage:
+        return self.media_storage
+
+    def GetProjectManager(self) -> FakeProjectManager:
+        return self.project_manager
+
+    def OpenPage(self, pageName: str) -> bool:
+        if pageName not in PAGES:
+            return False
+        self.page = pageName
+        return True
+
+    def GetCurrentPage(self) -> str:
+        return self.page
+
+    def GetProductName(self) -> str:
+        return "DaVinci Resolve Studio"
+
+    def GetVersion(self) -> List[Any]:
+        return [18, 1, 4, 6, ""]
+
+    def GetVersionString(self) -> str:
+        return "18.1.4.0006"
+
+    def LoadLayoutPreset(self, presetName: str) -> bool:
+        return presetName in self.layouts
+
+    def UpdateLayoutPreset(self, presetName: str) -> bool:
+        if presetName not in self.layouts:
+            return False
+        self.layouts[presetName] = self.page
+        return True
+
+    def ExportLayoutPreset(self, presetName: str, presetFilePath: str) -> bool:
+        return presetName in self.layouts
+
+    def DeleteLayoutPreset(self, presetName: str) -> bool:
+        return self.layouts.pop(presetName, None) is not None
+
+    def SaveLayoutPreset(self, presetName: str) -> bool:
+        if presetName in self.layouts:
+            return False
+        self.layouts[presetName] = self.page
+        return True
+
+    def ImportLayoutPreset(self, presetFilePath: str, presetName: str = "") -> bool:
+        name = presetName or os.path.splitext(os.path.basename(presetFilePath))[0]
+        if name in self.layouts:
+            return False
+        self.layouts[name] = self.page
+        return True
+
+    def Quit(self) -> None:
+        self.quit = True
+
+
+class FakeBackend(Backend):
+    """
+    In-memory simulated Resolve.
+
+    Args:
+        latency (float, optional): seconds every remote call takes. Defaults to ``0``.
+        latencies (dict, optional): per-method latency overrides, e.g. ``{"GetMarkers": 0.002}``
+        max_workers (int, optional): how many threads may call in at once. Defaults to ``8``.
+        render_fps (float, optional): simulated render speed in frames per second
+        clock (Callable[[], float], optional): clock driving the render simulation.
+            Defaults to ``time.monotonic``.
+        dropped_job_ids (int, optional): number of ``AddRenderJob()`` calls that return
+            an empty job id, like Resolve sometimes does
+        ghost_jobs (bool, optional): whether those dropped jobs are still queued
+
+    Counting Calls:
+        Every remote call is counted by method name in ``FakeBackend.calls``:
+        ```python
+        backend = FakeBackend(latency=0.001)
+        pydavinci.main.connection.use_backend(backend)
+        resolve.media_pool.root_folder.clips
+        backend.calls["GetClipList"]
+        ```
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latencies: Optional[Dict[str, float]] = None,
+        max_workers: int = 8,
+        render_fps: float = 240.0,
+        clock: Callable[[], float] = time.monotonic,
+        dropped_job_ids: int = 0,
+        ghost_jobs: bool = False,
+    ) -> None:
+        self.latency = latency
+        self.latencies: Dict[str, float] = dict(latencies or {})
+        self.max_workers = max_workers
+        self.render_fps = render_fps
+        self.clock = clock
+        self.dropped_job_ids = dropped_job_ids
+        self.ghost_jobs = ghost_jobs
+        self.calls: Counter[str] = Counter()
+        self._lock = threading.RLock()
+        self._id_counter = 0
+        self.resolve = FakeResolve(self)
+
+    def new_id(self) -> str:
+        with self._lock:
+            self._id_counter += 1
+            return str(uuid.UUID(int=self._id_counter))
+
+    def remote_call(self, name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        def call(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                self.calls[name] += 1
+            delay = self.latencies.get(name, self.latency)
+            if delay:
+                time.sleep(delay)
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return instrumentation.timed(name, call)
+
+    def reset_calls(self) -> None:
+        """Sets every call count back to zero."""
+        with self._lock:
+            self.calls.clear()
+
+    @property
+    def total_calls(self) -> int:
+        """Total number of remote calls made so far."""
+        return sum(self.calls.values())
+
+    def connect(self) -> FakeResolve:  # type: ignore[override]
+        return self.resolve
+
+    def is_remote(self, obj: Any) -> bool:
+        return isinstance(obj, FakeRemoteObject)
+
+    def populate(
+        self,
+        clips: int = 100,
+        folders: int = 0,
+        depth: int = 1,
+        markers_per_clip: int = 0,
+    ) -> FakeFolder:
+        """
+        Fills the current project's media pool with generated clips.
+
+        ``folders`` subfolders are created per level, ``depth`` levels deep, and the clips
+        are spread evenly across the root and every subfolder.
+
+        Returns:
+            (FakeFolder): media pool root folder
+        """
+        pool = self.resolve.project.media_pool
+        all_folders = [pool.root]
+        level = [pool.root]
+        for d in range(depth if folders else 0):
+            next_level = []
+            for parent in level:
+                for i in range(folders):
+                    next_level.append(parent.add_subfolder(f"Bin {d + 1}.{i + 1}"))
+            all_folders.extend(next_level)
+            level = next_level
+        for i in range(clips):
+            folder = all_folders[i % len(all_folders)]
+            clip = folder.add_clip(
+                f"A{i // 100 + 1:03d}C{i % 100 + 1:03d}.mov",
+                file_path=f"/media/A{i // 100 + 1:03d}/A{i // 100 + 1:03d}C{i % 100 + 1:03d}.mov",
+            )
+            for m in range(markers_per_clip):
+                clip.add_marker(m * 2, MARKER_COLORS[m % len(MARKER_COLORS)], f"Marker {m + 1}")
+        return pool.root
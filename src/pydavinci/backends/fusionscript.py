@@ -0,0 +1,45 @@
+from typing import TYPE_CHECKING, Any, Optional
+
+from pydavinci import instrumentation
+from pydavinci.backends import Backend
+from pydavinci.connect import load_fusionscript
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteResolve
+
+
+class FusionscriptBackend(Backend):
+    """
+    Talks to a running DaVinci Resolve through Blackmagic's ``fusionscript`` library.
+
+    ``fusionscript`` objects are native, so the root object is handed out in a
+    [``RemoteProxy``][pydavinci.instrumentation.RemoteProxy], the path every call then goes
+    through, for [``profile``][pydavinci.instrumentation.profile] to record them. Outside a
+    ``profile`` block the proxy only passes calls, attributes and items through, so Fusion
+    scripting works on it like on the native objects.
+    """
+
+    name = "fusionscript"
+
+    # fusionscript calls are marshalled to Resolve one at a time anyway
+    max_workers = 1
+
+    def __init__(self) -> None:
+        self._remote_type: Optional[type] = None
+
+    def connect(self) -> "PyRemoteResolve":
+        load_fusionscript()  # type: ignore
+        import fusionscript as dvr_script  # type: ignore
+
+        obj = dvr_script.scriptapp("Resolve")
+        if obj is None:
+            return obj  # type: ignore
+        self._remote_type = type(obj)
+        return instrumentation.RemoteProxy(obj, self._is_native)  # type: ignore
+
+    def _is_native(self, obj: Any) -> bool:
+        return self._remote_type is not None and type(obj) == self._remote_type  # noqa: E721
+
+    def is_remote(self, obj: Any) -> bool:
+        # Every object fusionscript hands out shares the same type
+        return self._is_native(instrumentation.unwrap(obj))
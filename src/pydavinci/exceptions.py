@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 import pydavinci.logger as log
 
@@ -14,3 +14,34 @@ class TimelineNotFound(BaseException):
             log.error(extra)
 
         super().__init__(*args, self.message)
+
+
+class ResolveNotFound(BaseException):
+    def __init__(self, *args: object) -> None:
+        self.message = "Couldn't connect to DaVinci Resolve. Make sure it's running."
+
+        super().__init__(*args, self.message)
+
+
+class MetadataNotSaved(BaseException):
+    def __init__(self, clip: str, keys: List[str]) -> None:
+        self.keys = keys
+        self.message = f"Resolve refused metadata {', '.join(keys)} for clip {clip}."
+
+        super().__init__(self.message)
+
+
+class RenderJobNotAdded(BaseException):
+    def __init__(self, *args: object) -> None:
+        self.message = "Couldn't add render job."
+
+        super().__init__(*args, self.message)
+
+
+class SettingsNotApplied(BaseException):
+    def __init__(self, setting: str, value: object) -> None:
+        self.setting = setting
+        self.value = value
+        self.message = f"Resolve refused setting '{setting}' = {value!r}. Changes rolled back."
+
+        super().__init__(self.message)
@@ -0,0 +1,168 @@
+"""
+Optional identity map for wrappers.
+
+With the identity map enabled, wrapping the same remote entity twice (same class, same
+``GetUniqueId()``) hands back the same wrapper instance, so per-wrapper caches such as
+``markers`` or ``settings`` survive between accesses:
+
+```python
+from pydavinci import identitymap
+
+identitymap.enable(maxsize=5000)
+resolve.media_pool.root_folder.clips[0] is resolve.media_pool.root_folder.clips[0]  # True
+```
+
+Wrappers are held weakly, so the map never keeps one alive by itself, except for the
+``maxsize`` most recently used ones, which are held strongly so that repeatedly walking
+the same media pool keeps hitting the map. Older entries are evicted least recently used
+first.
+
+The identity map costs one ``GetUniqueId()`` call per wrapper created, so it's disabled by
+default. It pays off in long-running scripts that visit the same items over and over.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+Key = Tuple[type, str]
+
+
+class IdentityMap(object):
+    """
+    Maps ``(wrapper class, unique id)`` to the one wrapper instance for it.
+
+    Args:
+        maxsize (int, optional): how many of the most recently used wrappers are kept
+            alive by the map. Defaults to ``1024``.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._refs: "weakref.WeakValueDictionary[Hashable, Any]" = weakref.WeakValueDictionary()
+        self._recent: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Key) -> Optional[Any]:
+        with self._lock:
+            wrapper = self._refs.get(key)
+            if wrapper is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touch(key, wrapper)
+            return wrapper
+
+    def add(self, key: Key, wrapper: Any) -> Any:
+        """
+        Stores ``wrapper`` under ``key``. If another thread stored one first, that one wins.
+
+        Returns:
+            (Any): the wrapper now mapped to ``key``
+        """
+        with self._lock:
+            existing = self._refs.get(key)
+            if existing is not None:
+                wrapper = existing
+            else:
+                self._refs[key] = wrapper
+            self._touch(key, wrapper)
+            return wrapper
+
+    def discard(self, key: Key) -> None:
+        with self._lock:
+            self._recent.pop(key, None)
+            self._refs.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._recent.clear()
+            self._refs.clear()
+
+    def _touch(self, key: Key, wrapper: Any) -> None:
+        self._recent[key] = wrapper
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._refs
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __repr__(self) -> str:
+        return (
+            f"IdentityMap({len(self)} wrappers, {len(self._recent)}/{self.maxsize} pinned, "
+            f"hits: {self.hits}, misses: {self.misses})"
+        )
+
+
+_identity_map: Optional[IdentityMap] = None
+
+
+def enable(maxsize: int = 1024) -> IdentityMap:
+    """
+    Turns the identity map on. Wrappers created from then on are shared.
+
+    Args:
+        maxsize (int, optional): how many recently used wrappers the map keeps alive.
+            Defaults to ``1024``.
+
+    Returns:
+        (IdentityMap): the identity map in use
+    """
+    global _identity_map
+    _identity_map = IdentityMap(maxsize)
+    return _identity_map
+
+
+def disable() -> None:
+    """Turns the identity map off and forgets every wrapper in it."""
+    global _identity_map
+    _identity_map = None
+
+
+def get_identity_map() -> Optional[IdentityMap]:
+    """
+    Returns:
+        (Optional[IdentityMap]): the identity map in use, ``None`` if disabled
+    """
+    return _identity_map
+
+
+def clear() -> None:
+    """Forgets every wrapper in the identity map, if enabled."""
+    if _identity_map is not None:
+        _identity_map.clear()
+
+
+class IdentityMapped(type):
+    """
+    Metaclass for wrappers of remote objects with a ``GetUniqueId()``.
+
+    While the identity map is enabled, calling the class returns the existing wrapper for
+    that remote entity when there is one. ``__init__`` only runs for new wrappers.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        identity_map = _identity_map
+        if identity_map is None:
+            return super().__call__(*args, **kwargs)
+
+        from pydavinci.utils import is_resolve_obj
+
+        if args and args[-1] is not None and is_resolve_obj(args[-1]):
+            key: Key = (cls, args[-1].GetUniqueId())
+            wrapper = identity_map.get(key)
+            if wrapper is not None:
+                return wrapper
+            return identity_map.add(key, super().__call__(*args, **kwargs))
+
+        # Wrappers that look up their own remote object, like ``Timeline()``
+        wrapper = super().__call__(*args, **kwargs)
+        key = (cls, wrapper._obj.GetUniqueId())
+        return identity_map.get(key) or identity_map.add(key, wrapper)
@@ -0,0 +1,455 @@
+"""
+Opt-in instrumentation of the calls pydavinci makes to Resolve.
+
+While a [``profile``][pydavinci.instrumentation.profile] block is active, every remote
+method call is timed by the backend carrying it and recorded in the active
+[``ProfileStats``][pydavinci.instrumentation.ProfileStats]. Outside a ``profile`` block
+calls aren't timed and nothing is recorded.
+"""
+
+import json
+import math
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Upper bounds, in seconds, of the latency histogram buckets
+BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_recorders: List["ProfileStats"] = []
+_recorders_lock = threading.Lock()
+
+
+class MethodStats(object):
+    """Calls, errors and latencies recorded for a single remote method."""
+
+    def __init__(self, method: str) -> None:
+        self.method = method
+        self.count = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.samples = array("d")
+        self.buckets = [0] * len(BUCKETS)
+
+    def record(self, seconds: float, failed: bool = False) -> None:
+        self.count += 1
+        self.errors += failed
+        self.total_time += seconds
+        self.samples.append(seconds)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+                break
+
+    def percentile(self, q: float) -> float:
+        """
+        Latency percentile, nearest-rank.
+
+        Args:
+            q (float): percentile, between ``0`` and ``100``
+
+        Returns:
+            float: latency in seconds. ``0.0`` if nothing was recorded.
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(math.ceil(q * len(ordered) / 100), 1)
+        return ordered[min(rank, len(ordered)) - 1]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+    @property
+    def p99(self) -> float:
+        return self.percentile(99)
+
+    @property
+    def mean(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return max(self.samples, default=0.0)
+
+    def histogram(self) -> List[Tuple[float, int]]:
+        """
+        Cumulative latency histogram.
+
+        Returns:
+            (List[Tuple[float, int]]): ``(upper bound, calls at or under it)`` pairs. The
+                last bound is ``inf``.
+        """
+        cumulative = []
+        running = 0
+        for bound, count in zip(BUCKETS, self.buckets, strict=True):
+            running += count
+            cumulative.append((bound, running))
+        cumulative.append((float("inf"), self.count))
+        return cumulative
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "mean": self.mean,
+            "p50": self.p50,
+            "p95": self.p95,
+            "p99": self.p99,
+            "max": self.max,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"MethodStats({self.method}: {self.count} calls, "
+            f"p50 {self.p50 * 1000:.3f} ms, p99 {self.p99 * 1000:.3f} ms)"
+        )
+
+
+class ProfileStats(object):
+    """
+    Remote calls recorded during a [``profile``][pydavinci.instrumentation.profile] block,
+    by remote method name.
+
+    ```python
+    with pydavinci.profile() as stats:
+        timeline = resolve.active_timeline
+
+    stats["GetMarkers"].count
+    stats.hot_paths(5)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.methods: Dict[str, MethodStats] = {}
+        self.started: Optional[float] = None
+        self.stopped: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def record(self, method: str, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            stats = self.methods.get(method)
+            if stats is None:
+                stats = self.methods[method] = MethodStats(method)
+            stats.record(seconds, failed)
+
+    @property
+    def calls(self) -> Dict[str, int]:
+        """Call count by remote method name."""
+        return {method: stats.count for method, stats in self.methods.items()}
+
+    @property
+    def total_calls(self) -> int:
+        return sum(stats.count for stats in self.methods.values())
+
+    @property
+    def total_time(self) -> float:
+        """Seconds spent inside remote calls."""
+        return sum(stats.total_time for stats in self.methods.values())
+
+    @property
+    def wall_time(self) -> float:
+        """Seconds the ``profile`` block has been running for."""
+        if self.started is None:
+            return 0.0
+        stopped = self.stopped if self.stopped is not None else time.perf_counter()
+        return stopped - self.started
+
+    def hot_paths(self, n: Optional[int] = None) -> List[MethodStats]:
+        """
+        Remote methods sorted by the total time spent in them, slowest first.
+
+        Args:
+            n (int, optional): only return the first ``n``
+
+        Returns:
+            (List[MethodStats]): per-method stats
+        """
+        ordered = sorted(self.methods.values(), key=lambda s: s.total_time, reverse=True)
+        return ordered[:n] if n is not None else ordered
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total_calls": self.total_calls,
+            "total_time": self.total_time,
+            "wall_time": self.wall_time,
+            "methods": {method: self.methods[method].to_dict() for method in sorted(self.methods)},
+        }
+
+    def to_json(self, path: Optional[str] = None, indent: Optional[int] = 2) -> str:
+        """
+        Exports the stats as JSON. Latencies are in seconds.
+
+        Args:
+            path (str, optional): also write the JSON to this file
+            indent (int, optional): JSON indentation. Defaults to ``2``.
+
+        Returns:
+            str: JSON document
+        """
+        text = json.dumps(self.to_dict(), indent=indent)
+        if path:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def to_prometheus(self, prefix: str = "pydavinci") -> str:
+        """
+        Exports the stats in the Prometheus text exposition format: a call counter, an
+        error counter and a latency histogram, all labelled by ``method``.
+
+        Args:
+            prefix (str, optional): metric name prefix. Defaults to ``pydavinci``.
+
+        Returns:
+            str: Prometheus text
+        """
+        calls = f"{prefix}_remote_calls_total"
+        errors = f"{prefix}_remote_call_errors_total"
+        duration = f"{prefix}_remote_call_duration_seconds"
+        methods = sorted(self.methods.items())
+
+        lines = [
+            f"# HELP {calls} Remote calls made to DaVinci Resolve.",
+            f"# TYPE {calls} counter",
+        ]
+        lines += [f'{calls}{{method="{m}"}} {s.count}' for m, s in methods]
+        lines += [
+            f"# HELP {errors} Remote calls that raised an exception.",
+            f"# TYPE {errors} counter",
+        ]
+        lines += [f'{errors}{{method="{m}"}} {s.errors}' for m, s in methods]
+        lines += [
+            f"# HELP {duration} Latency of remote calls made to DaVinci Resolve.",
+            f"# TYPE {duration} histogram",
+        ]
+        for m, s in methods:
+            for bound, count in s.histogram():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{duration}_bucket{{method="{m}",le="{le}"}} {count}')
+            lines.append(f'{duration}_sum{{method="{m}"}} {s.total_time!r}')
+            lines.append(f'{duration}_count{{method="{m}"}} {s.count}')
+        return "\n".join(lines) + "\n"
+
+    def __getitem__(self, method: str) -> MethodStats:
+        return self.methods[method]
+
+    def __contains__(self, method: object) -> bool:
+        return method in self.methods
+
+    def __iter__(self) -> Iterator[MethodStats]:
+        return iter(self.hot_paths())
+
+    def __len__(self) -> int:
+        return len(self.methods)
+
+    def __repr__(self) -> str:
+        return (
+            f"ProfileStats({self.total_calls} calls to {len(self.methods)} methods, "
+            f"{self.total_time * 1000:.1f} ms in Resolve)"
+        )
+
+
+def active() -> bool:
+    """``True`` while at least one ``profile`` block is running."""
+    return bool(_recorders)
+
+
+def record(method: str, seconds: float, failed: bool = False) -> None:
+    for recorder in tuple(_recorders):
+        recorder.record(method, seconds, failed)
+
+
+def timed(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Wraps the remote method ``name`` so its calls are recorded while a ``profile`` block
+    is active. Backends use it in the path every remote call goes through.
+
+    Args:
+        name (str): remote method name
+        method (Callable): the method making the remote call
+
+    Returns:
+        (Callable): ``method``, recorded when profiling
+    """
+
+    def call(*args: Any, **kwargs: Any) -> Any:
+        if not _recorders:
+            return method(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        except BaseException:
+            record(name, time.perf_counter() - start, failed=True)
+            raise
+        record(name, time.perf_counter() - start)
+        return result
+
+    return call
+
+
+@contextmanager
+def profile() -> Iterator[ProfileStats]:
+    """
+    Records every remote call made while the block runs, from any thread.
+
+    ```python
+    import pydavinci
+
+    with pydavinci.profile() as stats:
+        resolve.media_pool.root_folder.clips
+
+    print(stats.to_prometheus())
+    ```
+
+    Calls are recorded whenever the wrapper making them was created, before or inside the
+    block, and nothing is left behind once it ends.
+
+    Yields:
+        (ProfileStats): the recorded calls, filled in as the block runs
+    """
+    stats = ProfileStats()
+    stats.started = time.perf_counter()
+    with _recorders_lock:
+        _recorders.append(stats)
+    try:
+        yield stats
+    finally:
+        with _recorders_lock:
+            _recorders.remove(stats)
+        stats.stopped = time.perf_counter()
+
+
+class RemoteProxy(object):
+    """
+    Stands in for a remote object whose calls can't be hooked otherwise, such as the ones
+    ``fusionscript`` hands out, and records its method calls while profiling.
+
+    Everything else, attributes, items, ``dir()``, calling, truth and length, is passed
+    straight through, so the proxy can be used like the object it stands in for. Arguments
+    are unwrapped before they're sent to Resolve, and remote objects coming back are
+    wrapped, so the whole object graph reached from a proxy goes through it.
+    """
+
+    __slots__ = ("_remote", "_is_remote", "_name")
+
+    def __init__(self, remote: Any, is_remote: Callable[[Any], bool], name: str = "") -> None:
+        object.__setattr__(self, "_remote", remote)
+        object.__setattr__(self, "_is_remote", is_remote)
+        # The attribute the object was looked up as, to record calling it under
+        object.__setattr__(self, "_name", name)
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._remote, name)
+        if self._is_remote(attr):
+            return RemoteProxy(attr, self._is_remote, name)
+        if not callable(attr):
+            return self._wrap(attr)
+        method = timed(name, attr)
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self._wrap(method(*unwrap(args), **unwrap(kwargs)))
+
+        return call
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._remote, name, unwrap(value))
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._remote, name)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        method = timed(self._name or "__call__", self._remote)
+        return self._wrap(method(*unwrap(args), **unwrap(kwargs)))
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._wrap(self._remote[unwrap(key)])
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._remote[unwrap(key)] = unwrap(value)
+
+    def __delitem__(self, key: Any) -> None:
+        del self._remote[unwrap(key)]
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._wrap(value) for value in self._remote)
+
+    def __contains__(self, value: Any) -> bool:
+        return unwrap(value) in self._remote
+
+    def __len__(self) -> int:
+        return len(self._remote)
+
+    def __bool__(self) -> bool:
+        return bool(self._remote)
+
+    def __dir__(self) -> Iterable[str]:
+        return dir(self._remote)
+
+    def _wrap(self, value: Any) -> Any:
+        if type(value) in _PLAIN:
+            return value
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._wrap(v) for k, v in value.items()}
+        if self._is_remote(value):
+            return RemoteProxy(value, self._is_remote)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        return bool(self._remote == unwrap(other))
+
+    def __hash__(self) -> int:
+        return hash(self._remote)
+
+    def __str__(self) -> str:
+        return str(self._remote)
+
+    def __repr__(self) -> str:
+        return f"RemoteProxy({self._remote!r})"
+
+
+# Values that are never remote and hold nothing remote, so they're passed through as is
+_PLAIN = frozenset((str, int, float, bool, type(None), bytes))
+
+
+def unwrap(value: Any) -> Any:
+    """
+    Swaps every [``RemoteProxy``][pydavinci.instrumentation.RemoteProxy] in ``value`` for
+    the remote object it stands in for. Looks inside lists, tuples and dicts.
+    """
+    if type(value) in _PLAIN:
+        return value
+    if isinstance(value, RemoteProxy):
+        return value._remote
+    if isinstance(value, (list, tuple)):
+        return type(value)(unwrap(v) for v in value)
+    if isinstance(value, dict):
+        return {k: unwrap(v) for k, v in value.items()}
+    return value
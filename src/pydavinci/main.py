@@ -1,16 +1,142 @@
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any, Optional, Union
 
-from pydavinci.connect import load_fusionscript
+from pydavinci import identitymap, instrumentation
+from pydavinci.backends import Backend, get_backend
+from pydavinci.exceptions import ResolveNotFound
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteResolve
 
 
-def get_resolve() -> "PyRemoteResolve":
-    load_fusionscript()  # type: ignore
-    import fusionscript as dvr_script  # type: ignore
+def get_resolve(backend: Union[str, Backend, None] = None) -> "PyRemoteResolve":
+    """
+    Connects to Resolve through ``backend``. If no ``backend`` is provided, uses the one
+    selected by the ``PYDAVINCI_BACKEND`` environment variable, ``fusionscript`` by default.
 
-    return dvr_script.scriptapp("Resolve")  # type: ignore
+    Args:
+        backend (Union[str, Backend], optional): backend name or instance
 
+    Returns:
+        (PyRemoteResolve): remote Resolve object
+    """
+    if not isinstance(backend, Backend):
+        backend = get_backend(backend)
+    return backend.connect()
 
-resolve_obj: "PyRemoteResolve" = get_resolve()
+
+class ResolveConnection:
+    """Lazy handle to the remote Resolve object.
+
+    Nothing is loaded or connected until the first remote attribute is looked up,
+    so importing any wrapper module is free of remote I/O. Connecting is guarded by a
+    lock, so concurrent first calls from several threads only connect once.
+    """
+
+    def __init__(self, backend: Union[str, Backend, None] = None) -> None:
+        self._backend_name = backend if isinstance(backend, str) else None
+        self._backend: Optional[Backend] = backend if isinstance(backend, Backend) else None
+        self._obj: Optional["PyRemoteResolve"] = None
+        self._lock = threading.RLock()
+
+    @property
+    def backend(self) -> Backend:
+        """The [``Backend``][pydavinci.backends.Backend] used to reach Resolve."""
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = get_backend(self._backend_name)
+        return self._backend
+
+    def use_backend(self, backend: Union[str, Backend, None] = None, **options: Any) -> Backend:
+        """
+        Switches to ``backend`` and drops the current connection.
+
+        Args:
+            backend (Union[str, Backend], optional): backend name or instance. If not provided,
+                uses the ``PYDAVINCI_BACKEND`` environment variable.
+            **options: passed on to the backend constructor when ``backend`` is a name
+
+        Returns:
+            (Backend): the backend now in use
+        """
+        if not isinstance(backend, Backend):
+            backend = get_backend(backend, **options)
+        with self._lock:
+            self._backend = backend
+            self.reset()
+        return backend
+
+    @property
+    def connected(self) -> bool:
+        """``True`` if a connection to Resolve has already been made."""
+        return self._obj is not None
+
+    def connect(self) -> "PyRemoteResolve":
+        """
+        Returns the remote Resolve object, connecting first if needed.
+
+        Raises:
+            ResolveNotFound: couldn't get a Resolve object back from the backend
+
+        Returns:
+            (PyRemoteResolve): remote Resolve object
+        """
+        obj = self._obj
+        if obj is None:
+            with self._lock:
+                if self._obj is None:
+                    created = self.backend.connect()
+                    if created is None:
+                        raise ResolveNotFound()
+                    self._obj = created
+                obj = self._obj
+        return obj  # type: ignore
+
+    def reset(self) -> None:
+        """Drops the current connection. The next remote call connects again."""
+        with self._lock:
+            self._obj = None
+            identitymap.clear()
+
+    def reconnect(self) -> "PyRemoteResolve":
+        """
+        Drops the current connection and connects again straight away.
+
+        Returns:
+            (PyRemoteResolve): the new remote Resolve object
+        """
+        with self._lock:
+            self.reset()
+            return self.connect()
+
+    def is_remote(self, obj: Any) -> bool:
+        """
+        Checks if ``obj`` is a remote object from the backend in use.
+
+        Args:
+            obj (Any): object to check
+
+        Returns:
+            bool: ``True`` if it is, ``False`` otherwise
+        """
+        self.connect()
+        return self.backend.is_remote(instrumentation.unwrap(obj))
+
+    def __getattr__(self, name: str) -> Any:
+        # Dunder lookups come from copy, pickle, inspect and friends. They shouldn't
+        # connect to Resolve behind the user's back.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.connect(), name)
+
+    def __repr__(self) -> str:
+        state = "connected" if self.connected else "not connected"
+        return f"ResolveConnection({state})"
+
+
+connection = ResolveConnection()
+
+# Typed as the remote object so wrappers keep their autocompletion. Every attribute
+# lookup goes through ``connection`` and connects on first use.
+resolve_obj: "PyRemoteResolve" = connection  # type: ignore
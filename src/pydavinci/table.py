@@ -0,0 +1,167 @@
+"""
+Columnar tables of remote properties.
+
+A [``PropertyTable``][pydavinci.table.PropertyTable] stores one list per property instead
+of one dict per item, with repeated strings interned, so tables of thousands of clips
+stay small and can be grouped and filtered without touching Resolve again.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+
+class PropertyTable(object):
+    """
+    Columns of properties, one row per item.
+
+    ```python
+    table = resolve.media_pool.snapshot_properties(clips, keys=["Resolution", "FPS"])
+    table["Resolution"]  # ["1920x1080", "3840x2160", ...]
+    for resolution, group in table.group_by("Resolution").items():
+        print(resolution, len(group), [clip.name for clip in group.items])
+    ```
+
+    Args:
+        columns (Dict[str, List[Any]]): equally long value lists, keyed by property
+        items (List[Any], optional): objects the rows belong to, in row order
+    """
+
+    def __init__(self, columns: Dict[str, List[Any]], items: Optional[List[Any]] = None) -> None:
+        lengths = {len(column) for column in columns.values()}
+        if items is not None:
+            lengths.add(len(items))
+        if len(lengths) > 1:
+            raise ValueError("All columns of a PropertyTable must have the same length")
+        self.columns = columns
+        self.items: List[Any] = items if items is not None else []
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Optional[Mapping[str, Any]]],
+        keys: Optional[Sequence[str]] = None,
+        items: Optional[List[Any]] = None,
+    ) -> "PropertyTable":
+        """
+        Builds a table from one property dict per item.
+
+        Args:
+            rows (Iterable[Dict[str, Any]]): properties of each item. ``None`` counts as
+                an item with no properties.
+            keys (List[str], optional): only keep these properties, in this order. Defaults
+                to every property found, in order of appearance.
+            items (List[Any], optional): objects the rows belong to, in row order
+
+        Returns:
+            (PropertyTable): table with a ``None`` wherever an item lacks a property
+        """
+        filled: List[Mapping[str, Any]] = [row or {} for row in rows]
+        if keys is None:
+            seen: Dict[str, None] = {}
+            for row in filled:
+                seen.update(dict.fromkeys(row))
+            keys = list(seen)
+        columns = {key: [_intern(row.get(key)) for row in filled] for key in keys}
+        table = cls(columns, items)
+        table._length = len(filled)
+        return table
+
+    @property
+    def keys(self) -> List[str]:
+        """Property names, in column order."""
+        return list(self.columns)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """
+        Args:
+            index (int): row number
+
+        Returns:
+            (Dict[str, Any]): properties of one item
+        """
+        return {key: column[index] for key, column in self.columns.items()}
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields:
+            (Dict[str, Any]): properties of each item, in row order
+        """
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def take(self, indices: Sequence[int]) -> "PropertyTable":
+        """
+        Args:
+            indices (List[int]): row numbers to keep, in the order wanted
+
+        Returns:
+            (PropertyTable): new table with only those rows
+        """
+        columns = {key: [column[i] for i in indices] for key, column in self.columns.items()}
+        items = [self.items[i] for i in indices] if self.items else None
+        table = PropertyTable(columns, items)
+        table._length = len(indices)
+        return table
+
+    def where(self, key: str, match: Any) -> "PropertyTable":
+        """
+        Filters rows on one property:
+        ```python
+        uhd = table.where("Resolution", "3840x2160")
+        long_clips = table.where("Frames", lambda frames: int(frames) > 1000)
+        ```
+
+        Args:
+            key (str): property to look at
+            match (Any): value to compare to, or a callable returning ``True`` for the
+                values to keep
+
+        Returns:
+            (PropertyTable): new table with the matching rows
+        """
+        column = self.columns[key]
+        if callable(match):
+            return self.take([i for i, value in enumerate(column) if match(value)])
+        return self.take([i for i, value in enumerate(column) if value == match])
+
+    def group_by(self, key: str) -> Dict[Any, "PropertyTable"]:
+        """
+        Splits the table on the values of one property.
+
+        Args:
+            key (str): property to group on
+
+        Returns:
+            (Dict[Any, PropertyTable]): one table per distinct value, in order of appearance
+        """
+        groups: Dict[Any, List[int]] = {}
+        for index, value in enumerate(self.columns[key]):
+            groups.setdefault(value, []).append(index)
+        return {value: self.take(indices) for value, indices in groups.items()}
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """
+        Returns:
+            (Dict[str, List[Any]]): a copy of the columns
+        """
+        return {key: list(column) for key, column in self.columns.items()}
+
+    def __getitem__(self, key: str) -> List[Any]:
+        return self.columns[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"PropertyTable({len(self)} rows, columns: {self.keys})"
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
@@ -1,7 +1,11 @@
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, TypeVar
 
 import pydavinci.main
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 # import psutil
 
 
@@ -13,6 +17,56 @@ TRACK_TYPES = ["video", "audio", "subtitle"]
 TRACK_ERROR = "Track type must be: 'video', 'audio', or 'subtitle"
 
 
+def frames_to_timecode(frames: int, fps: float, drop: bool = False) -> str:
+    """
+    Args:
+        frames (int): frame count from ``00:00:00:00``
+        fps (float): frame rate, such as ``24`` or ``29.97``
+        drop (bool, optional): drop frame timecode, for 29.97 and 59.94. Defaults to ``False``.
+
+    Returns:
+        (str): ``HH:MM:SS:FF`` timecode, ``HH:MM:SS;FF`` if drop frame
+    """
+    base = int(round(fps)) or 24
+    frames = max(int(frames), 0)
+    if drop:
+        # Frame numbers 0 and 1 (0 to 3 at 60) are skipped every minute but every tenth
+        dropped = base // 15
+        per_ten_minutes = base * 600 - dropped * 9
+        tens, rest = divmod(frames, per_ten_minutes)
+        frames += dropped * 9 * tens
+        if rest > dropped:
+            frames += dropped * ((rest - dropped) // (base * 60 - dropped))
+    seconds = frames // base
+    separator = ";" if drop else ":"
+    return (
+        f"{seconds // 3600:02d}:{(seconds // 60) % 60:02d}:"
+        f"{seconds % 60:02d}{separator}{frames % base:02d}"
+    )
+
+
+def timecode_to_frames(timecode: str, fps: float, drop: Optional[bool] = None) -> int:
+    """
+    Args:
+        timecode (str): ``HH:MM:SS:FF`` timecode
+        fps (float): frame rate, such as ``24`` or ``29.97``
+        drop (bool, optional): drop frame timecode. Defaults to ``True`` if ``timecode``
+            has a ``;`` before the frames.
+
+    Returns:
+        (int): frame count from ``00:00:00:00``
+    """
+    if drop is None:
+        drop = ";" in timecode
+    base = int(round(fps)) or 24
+    hh, mm, ss, ff = (int(x) for x in timecode.strip().replace(";", ":").split(":"))
+    frames = ((hh * 60 + mm) * 60 + ss) * base + ff
+    if drop:
+        minutes = hh * 60 + mm
+        frames -= (base // 15) * (minutes - minutes // 10)
+    return frames
+
+
 default_resolve_install = {
     "win": r"C:\\Program Files\\Blackmagic Design\\DaVinci Resolve\\Resolve.exe",
     "mac": "/Applications/DaVinci Resolve/DaVinci Resolve.app/Contents/MacOS/Resolve",
@@ -21,10 +75,33 @@ default_resolve_install = {
 
 
 def is_resolve_obj(obj: Any) -> bool:
-    if type(obj) == type(pydavinci.main.resolve_obj):  # noqa: E721
-        return True
-    else:
-        return False
+    return pydavinci.main.connection.is_remote(obj)
+
+
+def remote_map(
+    func: Callable[[T], R], items: Iterable[T], max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Calls ``func`` on every item, from up to ``max_workers`` threads at once, and returns
+    the results in the order of ``items``. The first exception raised is re-raised.
+
+    Args:
+        func (Callable): function making the remote calls for one item
+        items (Iterable): items to call ``func`` on
+        max_workers (int, optional): thread count. Defaults to what the current backend
+            allows, which is a single thread for fusionscript.
+
+    Returns:
+        (List): ``func`` results
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = pydavinci.main.connection.backend.max_workers
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(workers, thread_name_prefix="pydavinci") as pool:
+        return list(pool.map(func, items))
 
 
 # def get_proc_pid(name: str) -> Union[None, int]:
@@ -1,13 +1,20 @@
-from typing import TYPE_CHECKING, List
+from collections import deque
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Callable, Deque, Iterator, List, Optional, Tuple, Union
 
+from typing_extensions import Literal
+
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.utils import is_resolve_obj
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteFolder
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
 
+NameFilter = Union[str, Callable[[str], bool]]
+
 
-class Folder:
+class Folder(metaclass=IdentityMapped):
     def __init__(self, obj: "PyRemoteFolder") -> None:
         if is_resolve_obj(obj):
             self._obj: "PyRemoteFolder" = obj
@@ -57,5 +64,86 @@ class Folder:
         """
         return self._obj.GetUniqueId()
 
+    def walk(
+        self,
+        order: Literal["depth", "breadth"] = "depth",
+        max_depth: Optional[int] = None,
+        name: Optional[NameFilter] = None,
+        folders: Optional[NameFilter] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[str, MediaPoolItem]]:
+        """
+        Walks this folder and its subfolders, yielding ``(folder_path, MediaPoolItem)``
+        for every clip found:
+        ```python
+        for path, clip in resolve.media_pool.root_folder.walk(name="*.mov"):
+            print(path, clip.name)  # Master/Day 1/A001C003.mov
+        ```
+
+        Folders are fetched one at a time as the walk reaches them and clips are only
+        wrapped when yielded, so memory stays bounded by the size of one folder. Breaking out
+        of the loop stops the walk without fetching anything else.
+
+        Args:
+            order (str, optional): ``depth`` for depth-first or ``breadth`` for breadth-first.
+                Defaults to ``depth``.
+            max_depth (int, optional): how many levels of subfolders to go down. ``0`` only
+                walks this folder. Defaults to no limit.
+            name (Union[str, Callable[[str], bool]], optional): only yield clips whose name
+                matches this glob pattern or for which this callable returns ``True``
+            folders (Union[str, Callable[[str], bool]], optional): only go into subfolders
+                whose name matches this glob pattern or callable
+            limit (int, optional): stop after yielding this many clips
+
+        Raises:
+            ValueError: ``order`` isn't ``depth`` or ``breadth``
+
+        Yields:
+            (Tuple[str, MediaPoolItem]): ``/``-separated folder path and clip
+        """
+        clip_match = _name_matcher(name)
+        count = 0
+        if limit is not None and limit <= 0:
+            return
+        for path, folder in self._walk_folders(order, max_depth, _name_matcher(folders)):
+            for obj in folder.GetClipList():
+                if clip_match is not None and not clip_match(obj.GetName()):
+                    continue
+                yield path, MediaPoolItem(obj)
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def _walk_folders(
+        self,
+        order: str,
+        max_depth: Optional[int],
+        folder_match: Optional[Callable[[str], bool]],
+    ) -> Iterator[Tuple[str, "PyRemoteFolder"]]:
+        if order not in ("depth", "breadth"):
+            raise ValueError(f'Walk order must be "depth" or "breadth", not "{order}"')
+
+        pending: Deque[Tuple[str, int, "PyRemoteFolder"]] = deque()
+        pending.append((self._obj.GetName(), 0, self._obj))
+        while pending:
+            path, depth, folder = pending.pop() if order == "depth" else pending.popleft()
+            yield path, folder
+
+            # Subfolders are only listed once the caller is done with this folder
+            if max_depth is not None and depth >= max_depth:
+                continue
+            children = []
+            for sub in folder.GetSubFolderList():
+                sub_name = sub.GetName()
+                if folder_match is None or folder_match(sub_name):
+                    children.append((f"{path}/{sub_name}", depth + 1, sub))
+            pending.extend(reversed(children) if order == "depth" else children)
+
     def __repr__(self) -> str:
         return f'Folder(Name:"{self.name})"'
+
+
+def _name_matcher(pattern: Optional[NameFilter]) -> Optional[Callable[[str], bool]]:
+    if pattern is None or callable(pattern):
+        return pattern
+    return lambda name: fnmatchcase(name, pattern)  # type: ignore
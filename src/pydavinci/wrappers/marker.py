@@ -1,15 +1,21 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import time
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
-from typing_extensions import Literal, TypeAlias, TypedDict
+from typing_extensions import Literal, TypeAlias, TypedDict, get_args
 
 import pydavinci.logger as log
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pydavinci.wrappers._resolve_stubs import (
         PyRemoteMediaPoolItem,
         PyRemoteTimeline,
         PyRemoteTimelineItem,
     )
+    from pydavinci.wrappers.markerio import MarkerFormat, Timebase
     from pydavinci.wrappers.mediapoolitem import MediaPoolItem
     from pydavinci.wrappers.timeline import Timeline
     from pydavinci.wrappers.timelineitem import TimelineItem
@@ -43,6 +49,9 @@ class MarkerData(TypedDict):
 
 ATTRS = Literal["frameid", "customdata", "color", "name", "duration", "note"]
 
+# Fields MarkerCollection.find and find_all can look up
+INDEXED: Tuple[str, ...] = ("note", "name", "customdata", "color")
+
 COLORS = Literal[
     "Blue",
     "Cyan",
@@ -63,11 +72,76 @@ COLORS = Literal[
 ]
 
 
+# Fields MarkerCollection.bulk_apply edits can set
+FIELDS = ("color", "name", "note", "duration", "customdata")
+# Fields a marker can't be updated in place with, only deleted and added again
+READDED = ("color", "name", "note", "duration")
+
+
+class MarkerEdit(TypedDict, total=False):
+    action: Literal["add", "update", "delete"]
+    frameid: int
+    new_frameid: int
+    color: str
+    name: str
+    note: str
+    duration: int
+    customdata: str
+
+
+class MarkerResult(TypedDict):
+    edit: MarkerEdit
+    ok: bool
+    error: Optional[str]
+
+
 class MarkerCollection:
-    def __init__(self, obj: "PydavinciParent") -> None:
+    """
+    Markers of a [``Timeline``][pydavinci.wrappers.timeline.Timeline],
+    [``TimelineItem``][pydavinci.wrappers.timelineitem.TimelineItem] or
+    [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem].
+
+    Reading the markers (``all``, iterating, ``repr``) fetches them from Resolve again, to
+    pick up markers added or deleted in the GUI. Set ``ttl`` to reuse markers fetched less
+    than ``ttl`` seconds ago instead, or to ``math.inf`` to only fetch again after
+    [``invalidate``][pydavinci.wrappers.marker.MarkerCollection.invalidate]:
+
+    ```python
+    MarkerCollection.default_ttl = 5.0  # For every collection created from now on
+    timeline.markers.ttl = math.inf  # For this one
+    ```
+
+    Markers are kept sorted by frame, so time queries are binary searches over the
+    markers already fetched, without remote calls:
+
+    ```python
+    markers.in_range(86400, 86500)  # Markers from frame 86400 up to 86500
+    markers.overlapping(86400, 86500)  # Also the ones starting earlier but lasting into it
+    markers.next_after(86400)  # Next review marker
+    ```
+
+    Args:
+        obj (Union[Timeline, TimelineItem, MediaPoolItem]): markers' parent
+        ttl (float, optional): seconds fetched markers stay fresh. Defaults to
+            ``MarkerCollection.default_ttl``, which is ``None``: always fetch.
+    """
+
+    default_ttl: Optional[float] = None
+
+    def __init__(self, obj: "PydavinciParent", ttl: Optional[float] = None) -> None:
         self._obj: "PydavinciParent" = obj
         self._parent_obj: "RemoteMarkerParent" = obj._obj
         self._cache: Dict[int, Marker] = {}
+        # Frames of the cached markers, sorted, and the longest duration seen
+        self._frames = array("q")
+        self._max_duration = 0
+        # field -> value -> frameids, and value of any field -> frameids, as ordered sets
+        self._index: Dict[str, Dict[str, Dict[int, None]]] = {field: {} for field in INDEXED}
+        self._any: Dict[str, Dict[int, None]] = {}
+        # frameid -> indexed values, as they were when indexed
+        self._indexed: Dict[int, Tuple[str, ...]] = {}
+        self.ttl = ttl if ttl is not None else self.default_ttl
+        self._fetched_at: Optional[float] = None
         self.fetch()
 
     def add(
@@ -133,42 +207,125 @@ class MarkerCollection:
             )
             return None  # type: ignore
 
-    def find(self, needle: str) -> Optional["Marker"]:
+    def find(
+        self,
+        needle: Optional[str] = None,
+        *,
+        note: Optional[str] = None,
+        name: Optional[str] = None,
+        customdata: Optional[str] = None,
+        color: Optional[str] = None,
+    ) -> Optional["Marker"]:
         """Finds the first marker that matches `needle` for the `Marker's` `note`, `name`, `customdata` or `color`.
 
+        Or, with keyword arguments, the first marker matching all of them:
+        ```python
+        markers.find(customdata="note-1234")
+        markers.find(name="VFX", color="Red")
+        ```
+
+        Lookups use indexes kept up to date as markers are added, deleted and fetched,
+        so they don't depend on the number of markers.
+
         Returns:
             (Marker): first marker found with matching query
         """
+        frameids = self._lookup(needle, note=note, name=name, customdata=customdata, color=color)
+        return self._cache[min(frameids)] if frameids else None
 
-        for marker in self._cache.values():
-            if (
-                needle == marker.note
-                or needle == marker.name
-                or needle == marker.customdata
-                or needle == marker.color
-            ):
-                return marker
-
-        return None
-
-    def find_all(self, needle: str) -> Optional[List["Marker"]]:
+    def find_all(
+        self,
+        needle: Optional[str] = None,
+        *,
+        note: Optional[str] = None,
+        name: Optional[str] = None,
+        customdata: Optional[str] = None,
+        color: Optional[str] = None,
+    ) -> Optional[List["Marker"]]:
         """Finds all markers that match `needle` for the `Marker's` `note`, `name`, `customdata` or `color`.
 
+        Or, with keyword arguments, all markers matching all of them. See
+        [``find``][pydavinci.wrappers.marker.MarkerCollection.find].
+
         Returns:
             (Optional[List[Marker]]): all markers found or if none found, returns `None`
         """
-        _ret: List[Marker] = []
+        frameids = self._lookup(needle, note=note, name=name, customdata=customdata, color=color)
+        return [self._cache[frameid] for frameid in sorted(frameids)] or None
+
+    def _lookup(self, needle: Optional[str], **fields: Optional[str]) -> List[int]:
+        # Matching frames, in no particular order
+        candidates = [
+            self._index[field].get(value, {})
+            for field, value in fields.items()
+            if value is not None
+        ]
+        if needle is not None:
+            candidates.append(self._any.get(needle, {}))
+        if not candidates:
+            raise ValueError(
+                "You need to provide a needle or one of 'note', 'name', 'customdata' or 'color'"
+            )
+        candidates.sort(key=len)
+        smallest, others = candidates[0], candidates[1:]
+        return [f for f in smallest if all(f in other for other in others)]
 
-        for marker in self._cache.values():
-            if (
-                needle == marker.note
-                or needle == marker.name
-                or needle == marker.customdata
-                or needle == marker.color
-            ):
-                _ret.append(marker)
+    def in_range(self, start: int, end: int) -> List["Marker"]:
+        """
+        Markers at frames ``start`` (included) to ``end`` (excluded).
+
+        Args:
+            start (int): first frame
+            end (int): frame after the last one
+
+        Returns:
+            (List[Marker]): markers, by frame
+        """
+        lo, hi = bisect_left(self._frames, start), bisect_left(self._frames, end)
+        return [self._cache[frameid] for frameid in self._frames[lo:hi]]
 
-        return _ret if _ret else None
+    def overlapping(self, start: int, end: int) -> List["Marker"]:
+        """
+        Markers lasting into frames ``start`` (included) to ``end`` (excluded), counting
+        their ``duration``: a 100 frame marker at frame 0 overlaps frames 50 to 60.
+
+        Args:
+            start (int): first frame
+            end (int): frame after the last one
+
+        Returns:
+            (List[Marker]): markers, by frame
+        """
+        # No marker starting before start - max duration can last into the range
+        lo = bisect_right(self._frames, start - max(self._max_duration, 1))
+        hi = bisect_left(self._frames, end)
+        return [
+            self._cache[frameid]
+            for frameid in self._frames[lo:hi]
+            if frameid + max(self._cache[frameid]._data["duration"], 1) > start
+        ]
+
+    def next_after(self, frame: int) -> Optional["Marker"]:
+        """
+        Args:
+            frame (int): frame
+
+        Returns:
+            (Optional[Marker]): first marker after ``frame``, ``None`` if there are none
+        """
+        i = bisect_right(self._frames, frame)
+        return self._cache[self._frames[i]] if i < len(self._frames) else None
+
+    def prev_before(self, frame: int) -> Optional["Marker"]:
+        """
+        Args:
+            frame (int): frame
+
+        Returns:
+            (Optional[Marker]): last marker before ``frame``, ``None`` if there are none
+        """
+        i = bisect_left(self._frames, frame)
+        return self._cache[self._frames[i - 1]] if i > 0 else None
 
     def get_custom(self, customdata: str) -> Dict[Any, Any]:
         """
@@ -185,7 +342,7 @@ class MarkerCollection:
     def delete(
         self,
         *,
-        frameid: int = 0,
+        frameid: Optional[int] = None,
         color: COLORS = "",  # type: ignore
         customdata: str = "",
     ) -> bool:
@@ -211,55 +368,324 @@ class MarkerCollection:
             When selecting by ``customdata``, will delete first marker with matching custom data
         """
 
-        if frameid:
-            del self._cache[frameid]
+        if frameid is not None:
+            self._cache_del(self._cache[frameid])
             return self._parent_obj.DeleteMarkerAtFrame(frameid)
         elif color:
-            # Delete all entries in the cache that are not the specified color
             # DeleteMarkersByColor() deletes all with that specified color
-            self._cache = {
-                frame: marker for frame, marker in self._cache.items() if marker.color != color
-            }
+            for marker in self.find_all(color=color) or []:
+                self._cache_del(marker)
             return self._parent_obj.DeleteMarkersByColor(color)
 
         elif customdata:
-            # DeleteMarkerByCustomData deletes the first frame entry with the specified customdata,
-            # so we're grabbing the keys and sorting them to ensure we delete the right entry in our
-            # cache
-
-            sorted = list(self._cache.keys())
-            sorted.sort()
+            # DeleteMarkerByCustomData deletes the first frame entry with the specified customdata
+            marker = self.find(customdata=customdata)
             self._parent_obj.DeleteMarkerByCustomData(customdata)
-            del self._cache[sorted[0]]
+            if marker is not None:
+                self._cache_del(marker)
             return True
 
         raise ValueError("You need to provide either 'frameid', 'color' or 'customdata'")
 
     def delete_all(self) -> None:
-        """Deletes all markers"""
-        for marker in self.all:
-            marker.delete()
+        """Deletes all markers, with one ``DeleteMarkersByColor("All")`` call"""
+        self._parent_obj.DeleteMarkersByColor("All")
+        for marker in list(self._cache.values()):
+            self._cache_del(marker)
+
+    def bulk_apply(self, edits: List[MarkerEdit]) -> List[MarkerResult]:
+        """
+        Adds, updates and deletes many markers at once:
+
+        ```python
+        results = timeline.markers.bulk_apply([
+            {"action": "add", "frameid": 100, "color": "Red", "name": "Fix", "note": "Flicker"},
+            {"action": "update", "frameid": 200, "note": "Approved", "color": "Green"},
+            {"action": "update", "frameid": 300, "new_frameid": 310},
+            {"action": "delete", "frameid": 400},
+        ])
+        [result["edit"] for result in results if not result["ok"]]
+        ```
+
+        Edits are applied in order to a copy of the markers first, so an edit can build on an
+        earlier one and an invalid edit fails alone, without a remote call. Then only the net
+        difference is sent: a marker updated twice and one added then deleted cost nothing
+        more than once, a colour whose markers are all deleted goes in one
+        ``DeleteMarkersByColor()`` call (``"All"`` when every marker goes), and a
+        ``customdata`` only change is one ``UpdateMarkerCustomData()`` call. Resolve can't
+        update markers otherwise, so other changed markers are deleted and added again, and
+        put back as they were if Resolve refuses the change. The markers are fetched before
+        the edits are planned, whatever the ``ttl``, so a colour-wide delete never goes by a
+        stale cache, and once at the end to reconcile the cache.
+
+        Args:
+            edits (List[MarkerEdit]): ``action`` (``add``, ``update`` or ``delete``) and
+                ``frameid`` of the marker, plus for ``add`` and ``update`` any of ``color``,
+                ``name``, ``note``, ``duration`` and ``customdata``, and ``new_frameid``
+                to move it. ``add`` needs ``color`` and ``name``.
+
+        Returns:
+            (List[MarkerResult]): the ``edit``, whether it's ``ok`` and the ``error``, in the
+                order of ``edits``
+        """
+        # Deleting by colour removes markers the cache may not know about yet
+        self.fetch()
+        before: Dict[int, MarkerData] = {
+            f: m._data.copy() for f, m in self._cache.items()  # type: ignore
+        }
+        after: Dict[int, MarkerData] = {f: data.copy() for f, data in before.items()}  # type: ignore
+        results: List[MarkerResult] = []
+        # frame -> results of the edits it depends on, and result -> frames it changed
+        touched: Dict[int, List[MarkerResult]] = {}
+        changed: Dict[int, List[int]] = {}
+
+        for edit in edits:
+            result: MarkerResult = {"edit": edit, "ok": True, "error": None}
+            results.append(result)
+            try:
+                frames = self._simulate(edit, after)
+            except KeyError as e:
+                result["ok"], result["error"] = False, f"Missing {e}"
+                continue
+            except ValueError as e:
+                result["ok"], result["error"] = False, str(e)
+                continue
+            changed[id(result)] = frames
+            for frameid in frames:
+                touched.setdefault(frameid, []).append(result)
+
+        readded = [
+            f
+            for f in before
+            if f in after and any(before[f][key] != after[f][key] for key in READDED)  # type: ignore
+        ]
+        deleted = sorted([f for f in before if f not in after] + readded)
+        added = sorted([f for f in after if f not in before] + readded)
+        customdata = [
+            f
+            for f in before
+            if f in after and f not in readded and before[f]["customdata"] != after[f]["customdata"]
+        ]
+
+        failed: List[int] = []
+        gone = set(deleted)
+        for frames, ok in self._delete_frames(before, deleted):
+            if not ok:
+                failed.extend(frames)
+                gone.difference_update(frames)
+        for f in customdata:
+            if not self._parent_obj.UpdateMarkerCustomData(f, after[f]["customdata"]):
+                failed.append(f)
+        for f in added:
+            if self._add_remote(f, after[f]):
+                gone.discard(f)
+            else:
+                failed.append(f)
+
+        lost = set()
+        for f in failed:
+            for result in touched.get(f, []):
+                result["ok"], result["error"] = False, f"Resolve refused the change at frame {f}"
+                lost.update(changed[id(result)])
+        # Put back the markers deleted for a failed edit, such as a refused update
+        for f in sorted(lost & gone):
+            self._add_remote(f, before[f])
+
+        self.fetch()
+        failures = sum(not result["ok"] for result in results)
+        if failures:
+            log.warn(f"{failures} of {len(results)} marker edit(s) couldn't be applied")
+        return results
+
+    def export(
+        self,
+        path: Union[str, "Path"],
+        format: Optional["MarkerFormat"] = None,
+        *,
+        timebase: Optional["Timebase"] = None,
+    ) -> int:
+        """
+        Writes the markers to a CSV, JSON Lines, EDL or Avid marker text file, one marker
+        at a time, with timecodes from the parent's frame rate. See
+        [``export_markers``][pydavinci.wrappers.markerio.export_markers].
+
+        Args:
+            path (Union[str, Path]): file to write
+            format (str, optional): ``csv``, ``jsonl``, ``edl`` or ``avid``. Defaults to
+                the one matching the extension of ``path``.
+            timebase (Timebase, optional): frame rate and start timecode. Defaults to the
+                parent's.
+
+        Returns:
+            (int): number of markers written
+        """
+        from pydavinci.wrappers.markerio import export_markers
+
+        return export_markers(self, path, format, timebase)
+
+    def import_(
+        self,
+        path: Union[str, "Path"],
+        format: Optional["MarkerFormat"] = None,
+        *,
+        timebase: Optional["Timebase"] = None,
+        overwrite: bool = False,
+    ) -> List[MarkerResult]:
+        """
+        Adds the markers of a CSV, JSON Lines, EDL or Avid marker text file, read one line
+        at a time, with a single [``bulk_apply``][pydavinci.wrappers.marker.MarkerCollection.bulk_apply].
+        See [``import_markers``][pydavinci.wrappers.markerio.import_markers].
+
+        Args:
+            path (Union[str, Path]): file to read
+            format (str, optional): ``csv``, ``jsonl``, ``edl`` or ``avid``. Defaults to
+                the one matching the extension of ``path``.
+            timebase (Timebase, optional): frame rate and start timecode. Defaults to the
+                parent's.
+            overwrite (bool, optional): replace markers already at the same frames.
+                Defaults to ``False``.
+
+        Returns:
+            (List[MarkerResult]): result of every marker read, in file order
+        """
+        from pydavinci.wrappers.markerio import import_markers
+
+        return import_markers(self, path, format, timebase, overwrite)
+
+    def _add_remote(self, frameid: int, data: MarkerData) -> bool:
+        return bool(
+            self._parent_obj.AddMarker(
+                frameid,
+                data["color"],
+                data["name"],
+                data["note"],
+                data["duration"],
+                data["customdata"],
+            )
+        )
+
+    @staticmethod
+    def _simulate(edit: MarkerEdit, markers: Dict[int, MarkerData]) -> List[int]:
+        # Applies edit to markers, returns the frames it changed
+        action, frameid = edit["action"], int(edit["frameid"])
+        fields: Dict[str, Any] = {key: edit[key] for key in FIELDS if key in edit}  # type: ignore
+        if "color" in fields and fields["color"] not in get_args(COLORS):
+            raise ValueError(f"Invalid marker color: {fields['color']}")
+        if int(fields.get("duration", 1)) < 1:
+            raise ValueError("Marker duration must be at least 1 frame")
+
+        if action == "add":
+            if frameid in markers:
+                raise ValueError(f"Marker at frame {frameid} already exists")
+            if "color" not in fields or "name" not in fields:
+                raise ValueError("Adding a marker needs a 'color' and a 'name'")
+            defaults = {"frameid": frameid, "note": "", "duration": 1, "customdata": ""}
+            markers[frameid] = {**defaults, **fields}  # type: ignore
+            return [frameid]
+
+        if frameid not in markers:
+            raise ValueError(f"No marker at frame {frameid}")
+        if action == "delete":
+            del markers[frameid]
+            return [frameid]
+        if action != "update":
+            raise ValueError(f"Invalid marker action: {action}")
+
+        new_frameid = int(edit.get("new_frameid", frameid))
+        if new_frameid != frameid and new_frameid in markers:
+            raise ValueError(f"Marker at frame {new_frameid} already exists")
+        markers[frameid].update(fields)  # type: ignore
+        if new_frameid == frameid:
+            return [frameid]
+        markers[new_frameid] = markers.pop(frameid)
+        markers[new_frameid]["frameid"] = new_frameid
+        return [frameid, new_frameid]
+
+    def _delete_frames(
+        self, markers: Dict[int, MarkerData], frames: List[int]
+    ) -> List[Tuple[List[int], bool]]:
+        # Deletes frames of markers with as few calls as possible, returns (frames, success)
+        # of each call
+        if not frames:
+            return []
+        if len(frames) == len(markers) and len(frames) > 1:
+            return [(frames, bool(self._parent_obj.DeleteMarkersByColor("All")))]
+
+        by_color: Dict[str, List[int]] = {}
+        for f in markers:
+            by_color.setdefault(markers[f]["color"], []).append(f)
+        going = set(frames)
+        calls: List[Tuple[List[int], bool]] = []
+        for color, group in by_color.items():
+            if len(group) > 1 and going.issuperset(group):
+                calls.append((group, bool(self._parent_obj.DeleteMarkersByColor(color))))
+                going.difference_update(group)
+        for f in sorted(going):
+            calls.append(([f], bool(self._parent_obj.DeleteMarkerAtFrame(f))))
+        return calls
 
     @property
     def all(self) -> List["Marker"]:
-        """Returns a list with all `Marker`'s
+        """Returns a list with all `Marker`'s, by frame
 
         Returns:
             (List[Marker])
         """
-        self.fetch()
-        return list(self._cache.values())
+        self._refresh()
+        return [self._cache[frameid] for frameid in self._frames]
+
+    @property
+    def stale(self) -> bool:
+        """``True`` if the markers will be fetched again the next time they're read."""
+        if self._fetched_at is None or self.ttl is None:
+            return True
+        return time.monotonic() - self._fetched_at >= self.ttl
+
+    def invalidate(self) -> None:
+        """Marks the markers as stale, so they're fetched again the next time they're read."""
+        self._fetched_at = None
+
+    def _refresh(self) -> None:
+        if self.stale:
+            self.fetch()
 
     def _cache_add(self, marker: "Marker") -> None:
-        self._cache.update({marker._frameid: marker})
+        frameid = marker._frameid
+        if frameid in self._indexed:
+            self._unindex(frameid)
+        if frameid not in self._cache:
+            insort(self._frames, frameid)
+        self._cache.update({frameid: marker})
+        self._max_duration = max(self._max_duration, marker._data["duration"])
+        values = tuple(str(marker._data[field]) for field in INDEXED)  # type: ignore
+        self._indexed[frameid] = values
+        for field, value in zip(INDEXED, values, strict=True):
+            self._index[field].setdefault(value, {})[frameid] = None
+            self._any.setdefault(value, {})[frameid] = None
 
     def _cache_del(self, marker: "Marker") -> None:
         del self._cache[marker.frameid]
+        del self._frames[bisect_left(self._frames, marker.frameid)]
+        if not self._frames:
+            self._max_duration = 0
+        self._unindex(marker.frameid)
+
+    def _unindex(self, frameid: int) -> None:
+        values = self._indexed.pop(frameid, None)
+        if values is None:
+            return
+        for field, value in zip(INDEXED, values, strict=True):
+            for index in (self._index[field], self._any):
+                frameids = index.get(value)
+                if frameids is not None:
+                    frameids.pop(frameid, None)
+                    if not frameids:
+                        del index[value]
 
     def __iter__(self):  # type: ignore
-        self.fetch()
+        self._refresh()
         cache = self._cache.copy()
-        yield from cache.values()
+        yield from [cache[frameid] for frameid in self._frames]
 
     def __repr__(self) -> str:
         markers = [str(x.frameid) for x in self.all]
@@ -280,20 +706,31 @@ class MarkerCollection:
             You would only use this if during the middle of the script execution a user manually added a marker. Otherwise, a `MarkerCollection` knows about all the markers
             it has deleted, added or updated, and `.fetch() ` is run on the class initialization.
 
+        The cache is reconciled with what Resolve returns: markers deleted in Resolve are
+        dropped, changed ones are updated in place and the same `Marker` objects are kept
+        for the others.
         """
-        markers: RemoteMarkerData = self._parent_obj.GetMarkers()
-        if markers:
-            for frameid in markers:
-                marker: MarkerData = {
-                    "frameid": frameid,
-                    "color": markers[frameid]["color"],
-                    "duration": markers[frameid]["duration"],
-                    "name": markers[frameid]["name"],
-                    "customdata": markers[frameid]["customData"],
-                    "note": markers[frameid]["note"],
-                }
-                self._cache_add(Marker(self, self._parent_obj, marker, frameid))
+        markers: RemoteMarkerData = self._parent_obj.GetMarkers() or {}
+        for frameid in [f for f in self._cache if f not in markers]:
+            self._cache_del(self._cache[frameid])
 
+        for frameid, remote in markers.items():
+            data: MarkerData = {
+                "frameid": frameid,
+                "color": remote["color"],
+                "duration": remote["duration"],
+                "name": remote["name"],
+                "customdata": remote["customData"],
+                "note": remote["note"],
+            }
+            cached = self._cache.get(frameid)
+            if cached is None:
+                self._cache_add(Marker(self, self._parent_obj, data, frameid))
+            elif cached._data != data:
+                cached._data.update(data)  # type: ignore
+                self._cache_add(cached)
+
+        self._fetched_at = time.monotonic()
         return
 
 
@@ -355,9 +792,7 @@ class Marker:
 
     @color.setter
     def color(self, color: Literal[COLORS]) -> None:
-        # we don't have get_items on 3.6,
-        # TODO update when support Davinci v18 and Python > 3.7
-        if color not in COLORS.__values__:  # type: ignore
+        if color not in get_args(COLORS):
             return
         self.delete()
         self._update("color", color)
@@ -0,0 +1,405 @@
+import csv
+import json
+import re
+from functools import partial
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import Literal, get_args
+
+import pydavinci.logger as log
+from pydavinci.utils import frames_to_timecode, timecode_to_frames
+from pydavinci.wrappers.marker import COLORS, MarkerEdit, MarkerResult
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.marker import Marker, MarkerCollection
+
+MarkerFormat = Literal["csv", "jsonl", "edl", "avid"]
+
+FORMATS: Dict[str, MarkerFormat] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".edl": "edl",
+    ".txt": "avid",
+}
+
+# Fields of a marker replaced on import, when the file doesn't have them
+REPLACED = {"note": "", "duration": 1, "customdata": ""}
+
+COLUMNS = ["frameid", "timecode", "color", "name", "note", "duration", "customdata"]
+
+# Avid has fewer marker colours than Resolve
+TO_AVID = {
+    "Blue": "blue",
+    "Cyan": "cyan",
+    "Green": "green",
+    "Yellow": "yellow",
+    "Red": "red",
+    "Pink": "magenta",
+    "Purple": "magenta",
+    "Fuchsia": "magenta",
+    "Rose": "magenta",
+    "Lavender": "blue",
+    "Sky": "cyan",
+    "Mint": "green",
+    "Lemon": "yellow",
+    "Sand": "yellow",
+    "Cocoa": "black",
+    "Cream": "white",
+}
+FROM_AVID = {
+    "blue": "Blue",
+    "cyan": "Cyan",
+    "green": "Green",
+    "yellow": "Yellow",
+    "red": "Red",
+    "magenta": "Pink",
+    "black": "Cocoa",
+    "white": "Cream",
+}
+
+_TC = r"\d\d:\d\d:\d\d[:;]\d\d"
+_EDL_EVENT = re.compile(rf"^\d+\s+\S+\s+\S+\s+\S+\s+{_TC}\s+{_TC}\s+({_TC})\s+{_TC}")
+_EDL_MARKER = re.compile(r"\|C:ResolveColor(\w+)\s+\|M:(.*?)\s+\|D:(\d+)")
+_EDL_LOC = re.compile(rf"^\*\s*LOC:\s+({_TC})\s+(\w+)\s*(.*)$")
+
+
+class Timebase(object):
+    """
+    Converts marker frames to and from timecode.
+
+    Args:
+        fps (float): frame rate
+        drop (bool): drop frame timecode
+        start (int): frame count of the timecode marker frame ``0`` is at
+    """
+
+    def __init__(self, fps: float, drop: bool = False, start: int = 0) -> None:
+        self.fps = fps
+        self.drop = drop
+        self.start = start
+
+    @classmethod
+    def of(cls, markers: "MarkerCollection") -> "Timebase":
+        """
+        Timebase of the markers' parent: a timeline's frame rate and start timecode, a
+        clip's frame rate and start timecode, or for a timeline item, the current
+        timeline's frame rate and the item's start.
+
+        Args:
+            markers (MarkerCollection): markers
+
+        Returns:
+            (Timebase): timebase
+        """
+        from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+        from pydavinci.wrappers.timeline import Timeline
+
+        parent = markers._obj
+        if isinstance(parent, MediaPoolItem):
+            properties: Dict[str, Any] = parent._obj.GetClipProperty() or {}  # type: ignore
+            fps = float(properties.get("FPS") or 24)
+            start_tc = str(properties.get("Start TC") or "00:00:00:00")
+            return cls(fps, ";" in start_tc, timecode_to_frames(start_tc, fps))
+
+        timeline = parent if isinstance(parent, Timeline) else Timeline()
+        fps = float(str(timeline._obj.GetSetting("timelineFrameRate") or 24))
+        drop = str(timeline._obj.GetSetting("timelineDropFrameTimecode")) == "1"
+        if parent is timeline:
+            return cls(fps, drop, timeline._obj.GetStartFrame())
+        return cls(fps, drop, parent._obj.GetStart())  # type: ignore
+
+    def timecode(self, frameid: int) -> str:
+        return frames_to_timecode(self.start + frameid, self.fps, self.drop)
+
+    def frameid(self, timecode: str) -> int:
+        if not re.fullmatch(_TC, timecode.strip()):
+            raise ValueError(f"Invalid timecode: {timecode!r}")
+        return timecode_to_frames(timecode, self.fps, self.drop) - self.start
+
+
+def _color(color: str) -> str:
+    # Resolve or Avid colour name to a Resolve one
+    if color.capitalize() in get_args(COLORS):
+        return color.capitalize()
+    return FROM_AVID.get(color.lower(), color)
+
+
+def _row(marker: "Marker", timebase: Timebase) -> Dict[str, Any]:
+    return {
+        "frameid": marker.frameid,
+        "timecode": timebase.timecode(marker.frameid),
+        "color": marker.color,
+        "name": marker.name,
+        "note": marker.note,
+        "duration": marker.duration,
+        "customdata": marker.customdata,
+    }
+
+
+def _edit(row: Dict[str, Any], timebase: Timebase) -> MarkerEdit:
+    # CSV or JSONL row to an add edit. ``frameid`` wins over ``timecode``.
+    frameid, timecode = row.get("frameid"), row.get("timecode")
+    if frameid not in (None, ""):
+        frameid = int(frameid)
+    elif timecode:
+        frameid = timebase.frameid(timecode)
+    else:
+        raise ValueError("Needs a 'frameid' or a 'timecode'")
+    edit: MarkerEdit = {"action": "add", "frameid": frameid}
+    for key in ("color", "name", "note", "customdata"):
+        if row.get(key) is not None:
+            edit[key] = str(row[key])  # type: ignore
+    if row.get("duration") not in (None, ""):
+        edit["duration"] = int(row["duration"])
+    if "color" in edit:
+        edit["color"] = _color(edit["color"])
+    return edit
+
+
+def _json_line(line: str, timebase: Timebase) -> Optional[MarkerEdit]:
+    if not line.strip():
+        return None
+    row = json.loads(line)
+    if not isinstance(row, dict):
+        raise ValueError("Not a JSON object")
+    return _edit(row, timebase)
+
+
+def _write(f: IO[str], markers: List["Marker"], fmt: MarkerFormat, timebase: Timebase) -> None:
+    if fmt == "csv":
+        writer = csv.DictWriter(f, COLUMNS)
+        writer.writeheader()
+        for marker in markers:
+            writer.writerow(_row(marker, timebase))
+
+    elif fmt == "jsonl":
+        for marker in markers:
+            f.write(json.dumps(_row(marker, timebase)) + "\n")
+
+    elif fmt == "edl":
+        f.write(f"TITLE: Markers\nFCM: {'DROP FRAME' if timebase.drop else 'NON-DROP FRAME'}\n")
+        for event, marker in enumerate(markers, start=1):
+            tc_in = timebase.timecode(marker.frameid)
+            tc_out = timebase.timecode(marker.frameid + marker.duration)
+            f.write(f"\n{event:03d}  001      V     C        {tc_in} {tc_out} {tc_in} {tc_out}  \n")
+            f.write(f" |C:ResolveColor{marker.color} |M:{marker.name} |D:{marker.duration}\n")
+
+    elif fmt == "avid":
+        for marker in markers:
+            columns = [
+                marker.name,
+                timebase.timecode(marker.frameid),
+                "V1",
+                TO_AVID.get(marker.color, "red"),
+                marker.note.replace("\t", " ").replace("\n", " "),
+                str(marker.duration),
+            ]
+            f.write("\t".join(columns) + "\n")
+
+
+def _edl_parser(timebase: Timebase) -> Callable[[str], Optional[MarkerEdit]]:
+    # Markers follow the event they're on, so the parser keeps the last record in
+    record_in: Optional[str] = None
+
+    def parse(line: str) -> Optional[MarkerEdit]:
+        nonlocal record_in
+        event = _EDL_EVENT.match(line)
+        if event:
+            record_in = event.group(1)
+            return None
+        marker = _EDL_MARKER.search(line)
+        if marker and record_in is not None:
+            color, name, duration = marker.groups()
+            return {
+                "action": "add",
+                "frameid": timebase.frameid(record_in),
+                "color": _color(color),
+                "name": name,
+                "duration": int(duration),
+            }
+        loc = _EDL_LOC.match(line.strip())
+        if loc:
+            timecode, color, name = loc.groups()
+            return {
+                "action": "add",
+                "frameid": timebase.frameid(timecode),
+                "color": _color(color),
+                "name": name.strip(),
+            }
+        return None
+
+    return parse
+
+
+def _avid_line(line: str, timebase: Timebase) -> Optional[MarkerEdit]:
+    columns = line.rstrip("\r\n").split("\t")
+    if len(columns) < 5:
+        return None
+    edit: MarkerEdit = {
+        "action": "add",
+        "frameid": timebase.frameid(columns[1]),
+        "color": _color(columns[3]),
+        "name": columns[0],
+        "note": columns[4],
+    }
+    if len(columns) > 5 and columns[5].strip():
+        edit["duration"] = int(columns[5])
+    return edit
+
+
+def _read(f: IO[str], fmt: MarkerFormat, timebase: Timebase) -> Iterator[Union[MarkerEdit, str]]:
+    # Yields the edit of every marker line, or why a line couldn't be read
+    lines: Iterator[Tuple[int, Any]]
+    parse: Callable[[Any], Optional[MarkerEdit]]
+    if fmt == "csv":
+        reader = csv.DictReader(f)
+        lines = ((reader.line_num, row) for row in reader)
+        parse = partial(_edit, timebase=timebase)
+    elif fmt == "jsonl":
+        lines = enumerate(f, start=1)
+        parse = partial(_json_line, timebase=timebase)
+    elif fmt == "edl":
+        lines = enumerate(f, start=1)
+        parse = _edl_parser(timebase)
+    else:
+        lines = enumerate(f, start=1)
+        parse = partial(_avid_line, timebase=timebase)
+
+    for number, line in lines:
+        try:
+            edit = parse(line)
+        except KeyError as e:
+            yield f"Line {number}: missing {e}"
+            continue
+        except (AttributeError, TypeError, ValueError) as e:
+            yield f"Line {number}: {e}"
+            continue
+        if edit is not None:
+            yield edit
+
+
+def _format(path: Union[str, Path], fmt: Optional[str]) -> MarkerFormat:
+    if fmt is None:
+        fmt = FORMATS.get(Path(path).suffix.lower())
+        if fmt is None:
+            raise ValueError(
+                f"Can't tell the marker format of {path}, pass one of: csv, jsonl, edl, avid"
+            )
+    if fmt not in get_args(MarkerFormat):
+        raise ValueError(f"Invalid marker format: {fmt}. Use one of: csv, jsonl, edl, avid")
+    return fmt  # type: ignore
+
+
+def export_markers(
+    markers: "MarkerCollection",
+    path: Union[str, Path],
+    format: Optional[MarkerFormat] = None,
+    timebase: Optional[Timebase] = None,
+) -> int:
+    """
+    Writes markers to a file, one marker at a time.
+
+    Formats:
+        ``csv``: ``frameid``, ``timecode``, ``color``, ``name``, ``note``, ``duration``
+            and ``customdata`` columns, with a header
+
+        ``jsonl``: one JSON object per marker, with the same keys
+
+        ``edl``: an EDL with one event per marker, as Resolve exports timeline markers.
+            Keeps the colour, name and duration.
+
+        ``avid``: Avid Media Composer marker text, tab separated name, timecode, track,
+            colour, comment (the note) and duration. Colours are mapped to Avid's.
+
+    Args:
+        markers (MarkerCollection): markers to write
+        path (Union[str, Path]): file to write
+        format (str, optional): ``csv``, ``jsonl``, ``edl`` or ``avid``. Defaults to
+            the one matching the extension of ``path``: ``.csv``, ``.jsonl``, ``.edl``
+            or ``.txt``.
+        timebase (Timebase, optional): frame rate and start timecode. Defaults to the
+            markers' parent's.
+
+    Raises:
+        ValueError: unknown format
+
+    Returns:
+        (int): number of markers written
+    """
+    fmt = _format(path, format)
+    timebase = timebase or Timebase.of(markers)
+    all_markers = markers.all
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        _write(f, all_markers, fmt, timebase)
+    return len(all_markers)
+
+
+def import_markers(
+    markers: "MarkerCollection",
+    path: Union[str, Path],
+    format: Optional[MarkerFormat] = None,
+    timebase: Optional[Timebase] = None,
+    overwrite: bool = False,
+) -> List[MarkerResult]:
+    """
+    Reads markers from a file written by
+    [``export_markers``][pydavinci.wrappers.markerio.export_markers] or another tool, one
+    line at a time, and adds them all with a single
+    [``bulk_apply``][pydavinci.wrappers.marker.MarkerCollection.bulk_apply].
+
+    Markers are placed by ``frameid`` if the file has one, else by timecode. Colours
+    can be Resolve's or Avid's. A line that can't be read fails alone: its result has
+    the line number in ``error``, and the other markers are still added.
+
+    Args:
+        markers (MarkerCollection): markers to add to
+        path (Union[str, Path]): file to read
+        format (str, optional): ``csv``, ``jsonl``, ``edl`` or ``avid``. Defaults to
+            the one matching the extension of ``path``.
+        timebase (Timebase, optional): frame rate and start timecode. Defaults to the
+            markers' parent's.
+        overwrite (bool, optional): replace markers already at the same frames instead of
+            failing those. Fields the file doesn't have are reset, not kept. Defaults to
+            ``False``.
+
+    Raises:
+        ValueError: unknown format
+
+    Returns:
+        (List[MarkerResult]): result of every marker read, in file order
+    """
+    fmt = _format(path, format)
+    timebase = timebase or Timebase.of(markers)
+    existing = {marker.frameid for marker in markers.all} if overwrite else set()
+    edits: List[MarkerEdit] = []
+    # Index in edits of every marker line, or the result of a line that couldn't be read
+    slots: List[Union[int, MarkerResult]] = []
+    with open(path, encoding="utf-8", newline="") as f:
+        for edit in _read(f, fmt, timebase):
+            if isinstance(edit, str):
+                slots.append({"edit": {}, "ok": False, "error": edit})
+                continue
+            if edit["frameid"] in existing and "color" in edit and "name" in edit:
+                # Replaced as a whole, fields missing from the file aren't kept
+                edit = {**REPLACED, **edit, "action": "update"}  # type: ignore
+            slots.append(len(edits))
+            edits.append(edit)
+
+    unread = len(slots) - len(edits)
+    if unread:
+        log.warn(f"{unread} line(s) of {path} couldn't be read")
+    results = markers.bulk_apply(edits)
+    return [results[slot] if isinstance(slot, int) else slot for slot in slots]
@@ -1,17 +1,26 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
+from typing_extensions import Literal
+
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.main import resolve_obj
-from pydavinci.utils import get_resolveobjs
+from pydavinci.table import PropertyTable
+from pydavinci.utils import get_resolveobjs, remote_map
+from pydavinci.wrappers import mediapoolindex
 from pydavinci.wrappers.folder import Folder
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+from pydavinci.wrappers.metadata import commit_metadata
 from pydavinci.wrappers.timeline import Timeline
 from pydavinci.wrappers.timelineitem import TimelineItem
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPool
+    from pydavinci.wrappers.folder import NameFilter
+    from pydavinci.wrappers.mediapoolindex import MediaPoolIndex
+    from pydavinci.wrappers.metadata import MetadataReport
 
 
-class MediaPool:
+class MediaPool(metaclass=IdentityMapped):
     def __init__(self) -> None:
 
         self._obj: PyRemoteMediaPool = (
@@ -29,6 +38,97 @@ class MediaPool:
 
         return Folder(self._obj.GetRootFolder())
 
+    def iter_clips(
+        self,
+        order: Literal["depth", "breadth"] = "depth",
+        max_depth: Optional[int] = None,
+        name: Optional["NameFilter"] = None,
+        folders: Optional["NameFilter"] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Tuple[str, "MediaPoolItem"]]:
+        """
+        Streams every clip in the media pool as ``(folder_path, MediaPoolItem)``. Same as
+        [``Folder.walk``][pydavinci.wrappers.folder.Folder.walk] on the root folder.
+
+        Args:
+            order (str, optional): ``depth`` for depth-first or ``breadth`` for breadth-first.
+                Defaults to ``depth``.
+            max_depth (int, optional): how many levels of subfolders to go down
+            name (Union[str, Callable[[str], bool]], optional): clip name glob pattern or filter
+            folders (Union[str, Callable[[str], bool]], optional): subfolder name glob pattern
+                or filter
+            limit (int, optional): stop after yielding this many clips
+
+        Yields:
+            (Tuple[str, MediaPoolItem]): ``/``-separated folder path and clip
+        """
+        return self.root_folder.walk(order, max_depth, name, folders, limit)
+
+    def index(self) -> "MediaPoolIndex":
+        """
+        Builds a [``MediaPoolIndex``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex] of
+        every clip in the media pool, for O(1) lookups by name, media id, file path or
+        unique id.
+
+        Returns:
+            (MediaPoolIndex): media pool index
+        """
+        return mediapoolindex.MediaPoolIndex(self)
+
+    def snapshot_properties(
+        self,
+        items: List["MediaPoolItem"],
+        keys: Optional[List[str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> "PropertyTable":
+        """
+        Fetches the clip properties of many clips at once, into a columnar
+        [``PropertyTable``][pydavinci.table.PropertyTable]:
+        ```python
+        clips = [clip for _, clip in resolve.media_pool.iter_clips()]
+        table = resolve.media_pool.snapshot_properties(clips, keys=["Resolution", "FPS"])
+        by_resolution = table.group_by("Resolution")
+        ```
+
+        Each clip costs one remote call. Calls run concurrently when the backend allows it.
+
+        Args:
+            items (List[MediaPoolItem]): clips to fetch properties of
+            keys (List[str], optional): only keep these properties. Defaults to all of them.
+            max_workers (int, optional): how many calls to run at the same time. Defaults to
+                the backend's ``max_workers``.
+
+        Returns:
+            (PropertyTable): one column per property and one row per clip, in ``items`` order
+        """
+        objs = get_resolveobjs(items)
+        rows = remote_map(lambda obj: obj.GetClipProperty(), objs, max_workers)
+        return PropertyTable.from_rows(rows, keys, list(items))
+
+    def commit_metadata(
+        self, clips: List["MediaPoolItem"], max_workers: Optional[int] = None
+    ) -> "MetadataReport":
+        """
+        Saves the pending ``metadata`` changes of many clips, with one remote call per
+        changed clip:
+        ```python
+        for clip in clips:
+            clip.metadata["Scene"] = scenes[clip.name]
+        report = resolve.media_pool.commit_metadata(clips)
+        for failure in report["failed"]:
+            print(failure["item"].name, failure["keys"])
+        ```
+
+        Args:
+            clips (List[MediaPoolItem]): clips whose ``metadata`` was changed
+            max_workers (int, optional): how many calls to run at the same time. Defaults to
+                the backend's ``max_workers``.
+
+        Returns:
+            (MetadataReport): ``saved``, ``unchanged`` and ``failed`` clips
+        """
+        return commit_metadata(clips, max_workers)
+
     def add_subfolder(self, folder_name: str, parent_folder: "Folder") -> "Folder":
         """
         Adds subfolder ``folder_name`` into ``parent_folder``
@@ -166,7 +266,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.DeleteClips(get_resolveobjs(clips))
+        objs = get_resolveobjs(clips)
+        deleted = self._obj.DeleteClips(objs)
+        if deleted and mediapoolindex.tracking():
+            mediapoolindex.clips_removed(self._obj, objs)
+        return deleted
 
     def delete_folders(self, folders: List["Folder"]) -> bool:
         """
@@ -178,7 +282,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.DeleteFolders(get_resolveobjs(folders))
+        objs = get_resolveobjs(folders)
+        deleted = self._obj.DeleteFolders(objs)
+        if deleted and mediapoolindex.tracking():
+            mediapoolindex.folders_removed(self._obj, objs)
+        return deleted
 
     def move_clips(self, clips: List["MediaPoolItem"], folder: "Folder") -> bool:
         """
@@ -191,7 +299,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.MoveClips(get_resolveobjs(clips), folder._obj)
+        objs = get_resolveobjs(clips)
+        moved = self._obj.MoveClips(objs, folder._obj)
+        if moved and mediapoolindex.tracking():
+            mediapoolindex.clips_moved(self._obj, objs, folder._obj)
+        return moved
 
     def move_folders(self, folders: List["Folder"], target_folder: "Folder") -> bool:
         """
@@ -204,7 +316,11 @@ class MediaPool:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.MoveFolders(get_resolveobjs(folders), target_folder._obj)
+        objs = get_resolveobjs(folders)
+        moved = self._obj.MoveFolders(objs, target_folder._obj)
+        if moved and mediapoolindex.tracking():
+            mediapoolindex.folders_moved(self._obj, objs, target_folder._obj)
+        return moved
 
     def clip_mattes(self, clip: "MediaPoolItem") -> List[str]:
         """
@@ -284,6 +400,8 @@ class MediaPool:
         # / TODO: Implement image sequence using ImportMedia({ClipInfo})
 
         imported = self._obj.ImportMedia(paths)
+        if imported and mediapoolindex.tracking():
+            mediapoolindex.clips_added(self._obj, imported)
         return [MediaPoolItem(x) for x in imported]
 
     def export_metadata(
@@ -0,0 +1,431 @@
+import json
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from typing_extensions import TypedDict
+
+import pydavinci.logger as log
+from pydavinci.wrappers.folder import Folder
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import (
+        PyRemoteFolder,
+        PyRemoteMediaPool,
+        PyRemoteMediaPoolItem,
+    )
+    from pydavinci.wrappers.mediapool import MediaPool
+
+
+INDEX_VERSION = 2
+
+# Folder names from the root folder down. Names can contain "/", so they aren't joined.
+FolderPath = Tuple[str, ...]
+
+
+class IndexEntry(TypedDict):
+    id: str
+    name: str
+    media_id: str
+    file_path: str
+    folder: FolderPath
+
+
+class MediaPoolIndex:
+    """
+    Hash indexes over every clip in a media pool, for O(1) lookups by name, media id,
+    ``File Path`` and unique id.
+
+    The index is built from a single walk of the media pool. Clips imported, moved or
+    deleted through the wrappers (``MediaPool.import_media``, ``MediaPool.delete_clips``,
+    ``MediaStorage.addclips_to_mediapool``...) are picked up as they happen. Changes made
+    in Resolve's UI need a [``refresh``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex.refresh].
+
+    ```python
+    index = resolve.media_pool.index()
+    clip = index.find_by_path("/media/A001/A001C003.mov")[0]
+
+    index.save("pool.index.json")
+    # Later, without walking the media pool again
+    index = MediaPoolIndex.load("pool.index.json")
+    ```
+
+    Args:
+        media_pool (MediaPool, optional): media pool to index. Defaults to the current
+            project's media pool.
+        build (bool, optional): walk the media pool straight away. Defaults to ``True``.
+    """
+
+    def __init__(self, media_pool: Optional["MediaPool"] = None, build: bool = True) -> None:
+        if media_pool is None:
+            from pydavinci.wrappers.mediapool import MediaPool
+
+            media_pool = MediaPool()
+        self._media_pool = media_pool
+        self.media_pool_id: str = media_pool._obj.GetUniqueId()
+
+        self._entries: Dict[str, IndexEntry] = {}
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_media_id: Dict[str, List[str]] = {}
+        self._by_path: Dict[str, List[str]] = {}
+        # Folder unique id -> folder path
+        self._folders: Dict[str, FolderPath] = {}
+        # Live remote objects. Empty for entries loaded from disk until they're looked up.
+        self._objs: Dict[str, "PyRemoteMediaPoolItem"] = {}
+
+        if build:
+            self.refresh()
+        _live_indexes.add(self)
+
+    # Building
+
+    def refresh(self, folder: Optional[Folder] = None) -> None:
+        """
+        Re-indexes the whole media pool, or only the clips directly inside ``folder``.
+
+        Args:
+            folder (Folder, optional): only re-index this folder
+
+        Raises:
+            KeyError: ``folder`` isn't in the media pool
+        """
+        if folder is not None:
+            path = self._folder_path(folder._obj)
+            for clip_id in [i for i, e in self._entries.items() if e["folder"] == path]:
+                self._remove(clip_id)
+            for obj in folder._obj.GetClipList():
+                self._add(obj, path)
+            return
+
+        self._entries.clear()
+        self._by_name.clear()
+        self._by_media_id.clear()
+        self._by_path.clear()
+        self._folders.clear()
+        self._objs.clear()
+        for path, remote_folder in self._walk_folders():
+            self._folders[remote_folder.GetUniqueId()] = path
+            for obj in remote_folder.GetClipList():
+                self._add(obj, path)
+
+    def _walk_folders(self) -> Iterator[Tuple[FolderPath, "PyRemoteFolder"]]:
+        # Depth first, like Folder.walk, with paths kept as tuples of names
+        root = self._media_pool._obj.GetRootFolder()
+        pending: List[Tuple[FolderPath, "PyRemoteFolder"]] = [((root.GetName(),), root)]
+        while pending:
+            path, folder = pending.pop()
+            yield path, folder
+            subfolders = folder.GetSubFolderList()
+            pending.extend((path + (sub.GetName(),), sub) for sub in reversed(subfolders))
+
+    def _add(self, obj: "PyRemoteMediaPoolItem", folder_path: FolderPath) -> None:
+        properties = obj.GetClipProperty()
+        file_path = properties.get("File Path", "") if isinstance(properties, dict) else ""
+        entry: IndexEntry = {
+            "id": obj.GetUniqueId(),
+            "name": obj.GetName(),
+            "media_id": obj.GetMediaId(),
+            "file_path": file_path,
+            "folder": folder_path,
+        }
+        if entry["id"] in self._entries:
+            self._remove(entry["id"])
+        self._insert(entry)
+        self._objs[entry["id"]] = obj
+
+    def _insert(self, entry: IndexEntry) -> None:
+        clip_id = entry["id"]
+        self._entries[clip_id] = entry
+        self._by_name.setdefault(entry["name"], []).append(clip_id)
+        self._by_media_id.setdefault(entry["media_id"], []).append(clip_id)
+        if entry["file_path"]:
+            self._by_path.setdefault(entry["file_path"], []).append(clip_id)
+
+    def _remove(self, clip_id: str) -> None:
+        entry = self._entries.pop(clip_id, None)
+        self._objs.pop(clip_id, None)
+        if entry is None:
+            return
+        for index, key in (
+            (self._by_name, entry["name"]),
+            (self._by_media_id, entry["media_id"]),
+            (self._by_path, entry["file_path"]),
+        ):
+            ids = index.get(key)
+            if ids and clip_id in ids:
+                ids.remove(clip_id)
+                if not ids:
+                    del index[key]
+
+    def _folder_path(self, folder: "PyRemoteFolder") -> FolderPath:
+        folder_id = folder.GetUniqueId()
+        if folder_id not in self._folders:
+            # Created after the index was built, so walk the folders (not the clips) again
+            for path, remote_folder in self._walk_folders():
+                self._folders[remote_folder.GetUniqueId()] = path
+        if folder_id not in self._folders:
+            raise KeyError(f"Folder {folder_id} isn't in the media pool")
+        return self._folders[folder_id]
+
+    # Updates coming from the wrappers
+
+    def _clips_added(
+        self, clips: List["PyRemoteMediaPoolItem"], folder: Optional["PyRemoteFolder"]
+    ) -> None:
+        if folder is None:
+            folder = self._media_pool._obj.GetCurrentFolder()
+        try:
+            path = self._folder_path(folder)
+        except KeyError:
+            # Nowhere to file them, so read the media pool again
+            self.refresh()
+            return
+        for obj in clips:
+            self._add(obj, path)
+
+    def _clips_removed(self, clips: List["PyRemoteMediaPoolItem"]) -> None:
+        for obj in clips:
+            self._remove(obj.GetUniqueId())
+
+    def _clips_moved(self, clips: List["PyRemoteMediaPoolItem"], folder: "PyRemoteFolder") -> None:
+        try:
+            path = self._folder_path(folder)
+        except KeyError:
+            self.refresh()
+            return
+        for obj in clips:
+            entry = self._entries.get(obj.GetUniqueId())
+            if entry is not None:
+                entry["folder"] = path
+
+    def _folders_removed(self, folders: List["PyRemoteFolder"]) -> None:
+        for folder in folders:
+            path = self._folders.pop(folder.GetUniqueId(), None)
+            if path is None:
+                continue
+            for folder_id, folder_path in list(self._folders.items()):
+                if folder_path[: len(path)] == path:
+                    del self._folders[folder_id]
+            for clip_id, entry in list(self._entries.items()):
+                if entry["folder"][: len(path)] == path:
+                    self._remove(clip_id)
+
+    def _folders_moved(self, folders: List["PyRemoteFolder"], target: "PyRemoteFolder") -> None:
+        # Paths from before the move, then the target's, which may walk the folders again
+        moved = [self._folders.get(folder.GetUniqueId()) for folder in folders]
+        try:
+            target_path = self._folder_path(target)
+        except KeyError:
+            self.refresh()
+            return
+        for old in moved:
+            if not old:
+                continue
+            new = target_path + old[-1:]
+            for folder_id, folder_path in list(self._folders.items()):
+                if folder_path[: len(old)] == old:
+                    self._folders[folder_id] = new + folder_path[len(old) :]
+            for entry in self._entries.values():
+                if entry["folder"][: len(old)] == old:
+                    entry["folder"] = new + entry["folder"][len(old) :]
+
+    # Lookups
+
+    def find_by_id(self, unique_id: str) -> Optional[MediaPoolItem]:
+        """
+        Args:
+            unique_id (str): clip unique id
+
+        Returns:
+            (Optional[MediaPoolItem]): clip, ``None`` if not in the index
+        """
+        return self._item(unique_id)
+
+    def find_by_media_id(self, media_id: str) -> Optional[MediaPoolItem]:
+        """
+        Args:
+            media_id (str): clip media id
+
+        Returns:
+            (Optional[MediaPoolItem]): clip, ``None`` if not in the index
+        """
+        items = self._items(self._by_media_id.get(media_id, []))
+        return items[0] if items else None
+
+    def find_by_name(self, name: str) -> List[MediaPoolItem]:
+        """
+        Args:
+            name (str): clip name
+
+        Returns:
+            (List[MediaPoolItem]): every clip with that name, empty if none
+        """
+        return self._items(self._by_name.get(name, []))
+
+    def find_by_path(self, file_path: str) -> List[MediaPoolItem]:
+        """
+        Args:
+            file_path (str): clip ``File Path`` property
+
+        Returns:
+            (List[MediaPoolItem]): every clip pointing to that file, empty if none
+        """
+        return self._items(self._by_path.get(file_path, []))
+
+    def entry(self, unique_id: str) -> Optional[IndexEntry]:
+        """
+        Indexed data for a clip. Doesn't make any remote calls.
+
+        Args:
+            unique_id (str): clip unique id
+
+        Returns:
+            (Optional[IndexEntry]): ``id``, ``name``, ``media_id``, ``file_path`` and
+                ``folder`` path of the clip, ``None`` if not in the index
+        """
+        return self._entries.get(unique_id)
+
+    def _items(self, clip_ids: List[str]) -> List[MediaPoolItem]:
+        items = [self._item(clip_id) for clip_id in list(clip_ids)]
+        return [item for item in items if item is not None]
+
+    def _item(self, clip_id: str) -> Optional[MediaPoolItem]:
+        if clip_id not in self._entries:
+            return None
+        if clip_id not in self._objs:
+            self._attach(self._entries[clip_id]["folder"])
+        obj = self._objs.get(clip_id)
+        if obj is None:
+            log.warn(f"Clip {clip_id} is gone from the media pool. Dropping it from the index.")
+            self._remove(clip_id)
+            return None
+        return MediaPoolItem(obj)
+
+    def _attach(self, folder_path: FolderPath) -> None:
+        # Finds the remote objects of an index loaded from disk, one folder at a time
+        folder: Optional["PyRemoteFolder"] = self._media_pool._obj.GetRootFolder()
+        for name in folder_path[1:]:
+            subfolders = folder.GetSubFolderList() if folder is not None else []
+            folder = next((f for f in subfolders if f.GetName() == name), None)
+        if folder is None:
+            return
+        for obj in folder.GetClipList():
+            clip_id = obj.GetUniqueId()
+            if clip_id in self._entries:
+                self._objs[clip_id] = obj
+
+    # Persistence
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to ``path`` as JSON, so it can be loaded back without walking the
+        media pool.
+
+        Args:
+            path (str): file path
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "media_pool": self.media_pool_id,
+            "folders": self._folders,
+            "clips": list(self._entries.values()),
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+
+    @classmethod
+    def load(cls, path: str, media_pool: Optional["MediaPool"] = None) -> "MediaPoolIndex":
+        """
+        Loads an index written by [``save``][pydavinci.wrappers.mediapoolindex.MediaPoolIndex.save].
+
+        Lookups work straight away. Remote objects are fetched one folder at a time, the
+        first time a clip in that folder is looked up. Clips that no longer exist are
+        dropped as they're found.
+
+        Args:
+            path (str): file path
+            media_pool (MediaPool, optional): media pool the index belongs to. Defaults to the
+                current project's media pool.
+
+        Raises:
+            ValueError: the file isn't a media pool index, or it belongs to another media pool
+
+        Returns:
+            (MediaPoolIndex): loaded index
+        """
+        with open(path) as f:
+            data: Dict[str, Any] = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"{path} isn't a version {INDEX_VERSION} media pool index")
+
+        index = cls(media_pool, build=False)
+        if data["media_pool"] != index.media_pool_id:
+            raise ValueError(f"{path} is an index of another media pool")
+        index._folders = {folder_id: tuple(path) for folder_id, path in data["folders"].items()}
+        for entry in data["clips"]:
+            entry["folder"] = tuple(entry["folder"])
+            index._insert(entry)
+        return index
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._entries
+
+    def __iter__(self) -> Iterator[IndexEntry]:
+        return iter(list(self._entries.values()))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"MediaPoolIndex(clips: {len(self)}, folders: {len(self._folders)})"
+
+
+_live_indexes: "weakref.WeakSet[MediaPoolIndex]" = weakref.WeakSet()
+
+
+def tracking() -> bool:
+    """``True`` if any ``MediaPoolIndex`` needs to hear about media pool changes."""
+    return bool(_live_indexes)
+
+
+def _indexes_of(media_pool: "PyRemoteMediaPool") -> List[MediaPoolIndex]:
+    media_pool_id = media_pool.GetUniqueId()
+    return [index for index in list(_live_indexes) if index.media_pool_id == media_pool_id]
+
+
+def clips_added(
+    media_pool: "PyRemoteMediaPool",
+    clips: List["PyRemoteMediaPoolItem"],
+    folder: Optional["PyRemoteFolder"] = None,
+) -> None:
+    """Adds ``clips`` to every index of ``media_pool``. ``folder`` defaults to the current one."""
+    for index in _indexes_of(media_pool):
+        index._clips_added(clips, folder)
+
+
+def clips_removed(media_pool: "PyRemoteMediaPool", clips: List["PyRemoteMediaPoolItem"]) -> None:
+    for index in _indexes_of(media_pool):
+        index._clips_removed(clips)
+
+
+def clips_moved(
+    media_pool: "PyRemoteMediaPool",
+    clips: List["PyRemoteMediaPoolItem"],
+    folder: "PyRemoteFolder",
+) -> None:
+    for index in _indexes_of(media_pool):
+        index._clips_moved(clips, folder)
+
+
+def folders_removed(media_pool: "PyRemoteMediaPool", folders: List["PyRemoteFolder"]) -> None:
+    for index in _indexes_of(media_pool):
+        index._folders_removed(folders)
+
+
+def folders_moved(
+    media_pool: "PyRemoteMediaPool",
+    folders: List["PyRemoteFolder"],
+    target: "PyRemoteFolder",
+) -> None:
+    for index in _indexes_of(media_pool):
+        index._folders_moved(folders, target)
@@ -1,25 +1,47 @@
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.utils import is_resolve_obj
 from pydavinci.wrappers.marker import MarkerCollection
+from pydavinci.wrappers.metadata import ClipMetadata
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteMediaPoolItem
 
 
-class MediaPoolItem:
-    # TODO:
-    # Implement a way to acess metadata such as mediapoolitem.metadata['Good Take'] = True
-    # Meed to mess around with a private dict that uses
-    # the SetMetadata() when internal dict updates
-
+class MediaPoolItem(metaclass=IdentityMapped):
     def __init__(self, obj: "PyRemoteMediaPoolItem") -> None:
         if is_resolve_obj(obj):
             self._obj: "PyRemoteMediaPoolItem" = obj
         else:
             raise TypeError(f"{type(obj)} is not a valid {self.__class__.__name__} type")
 
-        self.markers = MarkerCollection(self)
+    @cached_property
+    def markers(self) -> MarkerCollection:
+        """
+        Markers of this ``MediaPoolItem``. Fetched from Resolve the first time they're accessed.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        return MarkerCollection(self)
+
+    @cached_property
+    def metadata(self) -> ClipMetadata:
+        """
+        Metadata of this ``MediaPoolItem`` as a ``dict``, fetched once and saved in one call:
+        ```python
+        with clip.metadata as metadata:
+            metadata["Good Take"] = "1"
+        ```
+
+        See [``ClipMetadata``][pydavinci.wrappers.metadata.ClipMetadata].
+
+        Returns:
+            (ClipMetadata): metadata
+        """
+        return ClipMetadata(self)
 
     @property
     def name(self) -> str:
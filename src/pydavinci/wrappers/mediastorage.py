@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING, Any, List
 
 from pydavinci.main import resolve_obj
+from pydavinci.wrappers import mediapoolindex
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
 
 if TYPE_CHECKING:
@@ -82,7 +83,9 @@ class MediaStorage(object):
         Returns:
             List[MediaPoolItem]: list of timeline mattes ``MediaPoolItem``s
         """
-        return [MediaPoolItem(x) for x in self._obj.AddTimelineMattesToMediaPool(paths)]
+        added = self._obj.AddTimelineMattesToMediaPool(paths)
+        self._index_added(added)
+        return [MediaPoolItem(x) for x in added]
 
     def addclips_to_mediapool(self, item: List[str]) -> List["MediaPoolItem"]:
         """
@@ -112,5 +115,13 @@ class MediaStorage(object):
         # else:
         #     return [MediaPoolItem(self._obj.AddItemListToMediaPool(item)[0])]
 
-        objs_added = [MediaPoolItem(x) for x in self._obj.AddItemListToMediaPool(item)]
+        added = self._obj.AddItemListToMediaPool(item)
+        self._index_added(added)
+        objs_added = [MediaPoolItem(x) for x in added]
         return objs_added
+
+    def _index_added(self, added: List[Any]) -> None:
+        # Clips land in the current folder of the current project's media pool
+        if added and mediapoolindex.tracking():
+            media_pool = resolve_obj.GetProjectManager().GetCurrentProject().GetMediaPool()
+            mediapoolindex.clips_added(media_pool, added)
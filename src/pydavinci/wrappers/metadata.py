@@ -0,0 +1,199 @@
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, MutableMapping, Optional, Type
+
+from typing_extensions import TypedDict
+
+import pydavinci.logger as log
+from pydavinci.exceptions import MetadataNotSaved
+from pydavinci.utils import remote_map
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+
+
+class MetadataFailure(TypedDict):
+    item: "MediaPoolItem"
+    keys: List[str]
+    error: Optional[str]
+
+
+class MetadataReport(TypedDict):
+    saved: List["MediaPoolItem"]
+    unchanged: List["MediaPoolItem"]
+    failed: List[MetadataFailure]
+
+
+class ClipMetadata(MutableMapping[str, str]):
+    """
+    Metadata of a [``MediaPoolItem``][pydavinci.wrappers.mediapoolitem.MediaPoolItem],
+    usable as a ``dict``:
+
+    ```python
+    with clip.metadata as metadata:
+        metadata["Scene"] = "12"
+        metadata["Good Take"] = "1"
+    # Both keys were sent to Resolve in one SetMetadata() call
+    ```
+
+    Every metadata field is fetched with one ``GetMetadata()`` call the first time one is
+    read. Assignments are kept locally until [``commit``][pydavinci.wrappers.metadata.ClipMetadata.commit]
+    or the end of the ``with`` block, which sends only the keys that actually changed.
+    Leaving the ``with`` block on an exception discards the changes instead.
+
+    Values are stored as strings, like Resolve does. Deleting a key clears it.
+    """
+
+    def __init__(self, item: "MediaPoolItem") -> None:
+        self._item = item
+        self._remote: Optional[Dict[str, str]] = None
+        self._changes: Dict[str, str] = {}
+
+    def _fetch(self) -> Dict[str, str]:
+        if self._remote is None:
+            self._remote = dict(self._item._obj.GetMetadata() or {})  # type: ignore[arg-type]
+        return self._remote
+
+    @property
+    def dirty(self) -> Dict[str, str]:
+        """Changes not sent to Resolve yet."""
+        return dict(self._changes)
+
+    def refresh(self) -> None:
+        """Fetches metadata again on next read. Pending changes are kept."""
+        self._remote = None
+
+    def discard(self) -> None:
+        """Drops every pending change."""
+        self._changes.clear()
+
+    def commit(self) -> bool:
+        """
+        Sends pending changes to Resolve in a single ``SetMetadata()`` call.
+
+        If Resolve refuses them, each key is retried on its own so the valid ones still
+        get saved. Refused keys stay pending.
+
+        Returns:
+            bool: ``True`` if every change was saved, ``False`` otherwise
+        """
+        return not self._flush()
+
+    def _flush(self) -> List[str]:
+        # Returns the keys Resolve refused
+        if not self._changes:
+            return []
+        changes = dict(self._changes)
+        if self._item._obj.SetMetadata(changes):
+            self._saved(changes)
+            return []
+        if len(changes) == 1:
+            return list(changes)
+
+        failed = []
+        for key, value in changes.items():
+            if self._item._obj.SetMetadata({key: value}):
+                self._saved({key: value})
+            else:
+                failed.append(key)
+        return failed
+
+    def _saved(self, changes: Dict[str, str]) -> None:
+        if self._remote is not None:
+            self._remote.update(changes)
+        for key, value in changes.items():
+            if self._changes.get(key) == value:
+                del self._changes[key]
+
+    def __getitem__(self, key: str) -> str:
+        if key in self._changes:
+            return self._changes[key]
+        return self._fetch()[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        value = str(value)
+        if self._remote is not None and self._remote.get(key) == value:
+            self._changes.pop(key, None)
+        else:
+            self._changes[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self[key] = ""
+
+    def __iter__(self) -> Iterator[str]:
+        keys = dict.fromkeys(self._fetch())
+        keys.update(dict.fromkeys(self._changes))
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return len(set(self._fetch()) | set(self._changes))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._changes or key in self._fetch()
+
+    def __enter__(self) -> "ClipMetadata":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.discard()
+            return
+        failed = self._flush()
+        if failed:
+            raise MetadataNotSaved(self._item.name, failed)
+
+    def __repr__(self) -> str:
+        return f"ClipMetadata({self._item!r}, {len(self._changes)} pending)"
+
+
+def commit_metadata(
+    items: List["MediaPoolItem"], max_workers: Optional[int] = None
+) -> MetadataReport:
+    """
+    Sends the pending metadata changes of many clips, one ``SetMetadata()`` call per
+    changed clip. Clips without changes cost nothing. Calls run concurrently when the
+    backend allows it.
+
+    A clip failing doesn't stop the others. Its refused keys stay pending and are listed
+    in the report.
+
+    Args:
+        items (List[MediaPoolItem]): clips whose ``metadata`` was changed
+        max_workers (int, optional): how many calls to run at the same time. Defaults to
+            the backend's ``max_workers``.
+
+    Returns:
+        (MetadataReport): ``saved``, ``unchanged`` and ``failed`` clips
+    """
+    report: MetadataReport = {"saved": [], "unchanged": [], "failed": []}
+    changed = []
+    for item in items:
+        if item.metadata._changes:
+            changed.append(item)
+        else:
+            report["unchanged"].append(item)
+
+    def flush(item: "MediaPoolItem") -> Optional[MetadataFailure]:
+        try:
+            failed = item.metadata._flush()
+        except Exception as e:
+            return {"item": item, "keys": list(item.metadata._changes), "error": str(e)}
+        if failed:
+            return {"item": item, "keys": failed, "error": None}
+        return None
+
+    for item, failure in zip(changed, remote_map(flush, changed, max_workers), strict=True):
+        if failure is None:
+            report["saved"].append(item)
+        else:
+            report["failed"].append(failure)
+
+    if report["failed"]:
+        log.warn(f"Metadata of {len(report['failed'])} clip(s) couldn't be saved")
+    return report
@@ -1,9 +1,13 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Set, Union
 
-from pydavinci.exceptions import ObjectNotFound
+from pydavinci.exceptions import ObjectNotFound, RenderJobNotAdded
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.main import resolve_obj
 from pydavinci.utils import is_resolve_obj
-from pydavinci.wrappers.settings.constructor import get_prj_settings
+from pydavinci.wrappers.render import AddRenderJobResult, RenderEvents, add_renderjob_stats
+from pydavinci.wrappers.settings.constructor import get_prj_settings, invalidate_prj_settings
+from pydavinci.wrappers.settings.snapshot import SettingsSnapshot, apply_settings
 
 from pydavinci.wrappers.gallery import Gallery
 
@@ -11,10 +15,11 @@ if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteProject
     from pydavinci.wrappers.mediapool import MediaPool
     from pydavinci.wrappers.settings.constructor import ProjectSettings
+    from pydavinci.wrappers.settings.snapshot import SettingsReport
     from pydavinci.wrappers.timeline import Timeline
 
 
-class Project:
+class Project(metaclass=IdentityMapped):
     def __init__(self, *args: Any) -> None:
         if args:
             if is_resolve_obj(args[0]):
@@ -119,28 +124,75 @@ class Project:
         """
         return self._obj.SetPreset(preset_name)
 
-    def add_renderjob(self, block: bool = True) -> str:
+    def add_renderjob(
+        self,
+        block: bool = True,
+        timeout: float = 30.0,
+        backoff: float = 0.05,
+        max_backoff: float = 2.0,
+    ) -> str:
         """
         Adds current render settings to a render job.
 
         If there are already rendered jobs in the render queue and you're executing a lot of commands, there's a bug on
         the Davinci API that there's a chance it will return an empty string instead of the job ID.
 
-        ``block`` blocks the program until we get a job id back from Davinci Resolve. It's ``True`` by default.
+        ``block`` retries until we get a job id back from Davinci Resolve. It's ``True`` by default.
+        Retries wait ``backoff`` seconds, doubling up to ``max_backoff``, and give up after ``timeout``
+        seconds. As the job sometimes gets queued even though no id came back, the render job list
+        is checked before every retry so the job is never added twice.
 
-        Returns:
-            str: render job id
-        """
-        job_id = self._obj.AddRenderJob()
-
-        if block and job_id == "":
-            while job_id == "":
-
-                job_id = self._obj.AddRenderJob()
+        Attempts and time spent waiting are added to
+        [``add_renderjob_stats``][pydavinci.wrappers.render.AddRenderJobStats].
 
-            return job_id
-
-        return job_id
+        Args:
+            block (bool, optional): retry until a job id comes back. Defaults to ``True``.
+            timeout (float, optional): seconds to keep retrying for. Defaults to ``30.0``.
+            backoff (float, optional): seconds to wait before the first retry. Defaults to ``0.05``.
+            max_backoff (float, optional): longest wait between retries. Defaults to ``2.0``.
+
+        Raises:
+            RenderJobNotAdded: no job id after ``timeout`` seconds, when blocking
+
+        Returns:
+            str: render job id, or an empty string if it failed and ``block`` is ``False``
+        """
+        if not block:
+            return self._obj.AddRenderJob()
+
+        before: Set[str] = {job["JobId"] for job in self._obj.GetRenderJobList()}
+        deadline = time.monotonic() + timeout
+        result: AddRenderJobResult = {
+            "job_id": self._obj.AddRenderJob(),
+            "attempts": 1,
+            "wait_time": 0.0,
+            "recovered": False,
+        }
+        delay = backoff
+        while result["job_id"] == "":
+            queued = [job["JobId"] for job in self._obj.GetRenderJobList()]
+            added = [job_id for job_id in queued if job_id not in before]
+            if added:
+                result["job_id"] = added[-1]
+                result["recovered"] = True
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                add_renderjob_stats.record(result, timed_out=True)
+                raise RenderJobNotAdded(
+                    f"No render job id after {result['attempts']} attempts in {timeout}s"
+                )
+            wait = min(delay, remaining)
+            time.sleep(wait)
+            result["wait_time"] += wait
+            delay = min(delay * 2, max_backoff)
+
+            result["job_id"] = self._obj.AddRenderJob()
+            result["attempts"] += 1
+
+        add_renderjob_stats.record(result)
+        return result["job_id"]
 
     def delete_renderjob(self, job_id: str) -> bool:
         """
@@ -164,15 +216,37 @@ class Project:
         return self._obj.DeleteAllRenderJobs()
 
     @property
-    def render_jobs(self) -> List[str]:
+    def render_jobs(self) -> List[Dict[str, Any]]:
         """
         Gets current list of render jobs
 
         Returns:
-            list: render job list
+            list: render job list, one dict of job details per job
         """
         return self._obj.GetRenderJobList()
 
+    def render_events(
+        self, job_ids: Optional[List[str]] = None, **poller_options: Any
+    ) -> RenderEvents:
+        """
+        Follows render jobs and yields an event each time one starts, progresses, updates
+        its ETA, completes or fails. Works with ``for`` and ``async for``:
+        ```python
+        for event in project.render_events():
+            print(event["type"], event["job_id"], event["percentage"])
+        ```
+
+        All jobs are polled together, see [``RenderEvents``][pydavinci.wrappers.render.RenderEvents].
+
+        Args:
+            job_ids (List[str], optional): jobs to follow. Defaults to every job in the queue.
+            **poller_options: passed on to [``RenderPoller``][pydavinci.wrappers.render.RenderPoller]
+
+        Returns:
+            (RenderEvents): event stream
+        """
+        return RenderEvents(self, job_ids, **poller_options)
+
     @property
     def render_presets(self) -> List[str]:
         """
@@ -419,6 +493,9 @@ class Project:
         """
         Set project setting.
 
+        The cached [``settings``][pydavinci.wrappers.project.Project.settings] are dropped,
+        so they're read again from Resolve next time.
+
         Args:
             setting (str): setting name
             value (Any): setting value
@@ -426,7 +503,43 @@ class Project:
         Returns:
             bool: ``True`` if successful, ``False`` otherwise
         """
-        return self._obj.SetSetting(setting, value)
+        result = self._obj.SetSetting(setting, value)
+        if result:
+            self._settings = None
+            invalidate_prj_settings(self)
+        return result
+
+    def snapshot_settings(self) -> "SettingsSnapshot":
+        """
+        Takes an immutable [``SettingsSnapshot``][pydavinci.wrappers.settings.snapshot.SettingsSnapshot]
+        of every project setting, with one ``GetSetting()`` call.
+
+        Returns:
+            (SettingsSnapshot): settings snapshot
+        """
+        return SettingsSnapshot.capture(self)
+
+    def apply_settings(
+        self, template: Mapping[str, Any], current: Optional[Mapping[str, Any]] = None
+    ) -> "SettingsReport":
+        """
+        Sets project settings to the ones in ``template``, sending only the settings that
+        differ from the current ones. See
+        [``apply_settings``][pydavinci.wrappers.settings.snapshot.apply_settings].
+
+        Args:
+            template (Mapping[str, Any]): snapshot or ``dict`` of settings by Resolve name
+            current (Mapping[str, Any], optional): current settings, if already known
+
+        Returns:
+            (SettingsReport): settings sent, number of settings already matching and
+                settings Resolve refused
+        """
+        report = apply_settings(self, template, current)
+        if report["sent"]:
+            self._settings = None
+            invalidate_prj_settings(self)
+        return report
 
     def save(self) -> bool:
         """
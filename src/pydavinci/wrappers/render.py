@@ -0,0 +1,534 @@
+import asyncio
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from typing_extensions import Literal, TypedDict
+
+import pydavinci.logger as log
+from pydavinci.exceptions import RenderJobNotAdded
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.project import Project
+    from pydavinci.wrappers.timeline import Timeline
+
+
+FINISHED = ("Complete", "Failed", "Cancelled")
+"""Job statuses that don't change anymore."""
+
+
+class RenderJobSpec(TypedDict, total=False):
+    timeline: Union["Timeline", str]
+    preset: str
+    format: str
+    codec: str
+    settings: Dict[str, Any]
+
+
+class RenderProgress(TypedDict):
+    job_id: str
+    status: str
+    percentage: int
+    eta_ms: Optional[int]
+    time_taken_ms: Optional[int]
+
+
+class RenderEvent(TypedDict):
+    type: Literal["started", "progress", "eta", "completed", "failed"]
+    job_id: str
+    status: str
+    percentage: int
+    eta_ms: Optional[int]
+    time_taken_ms: Optional[int]
+
+
+class AddRenderJobResult(TypedDict):
+    job_id: str
+    attempts: int
+    wait_time: float
+    recovered: bool
+
+
+class AddRenderJobStats(object):
+    """
+    Running totals of [``Project.add_renderjob``][pydavinci.wrappers.project.Project.add_renderjob]
+    calls, for metrics:
+
+    ```python
+    from pydavinci.wrappers.render import add_renderjob_stats
+
+    print(add_renderjob_stats.retries, add_renderjob_stats.wait_time)
+    ```
+
+    ``recovered`` counts jobs that Resolve queued without returning their id, found by
+    comparing render job lists instead of adding the job again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets every total back to zero."""
+        with self._lock:
+            self.jobs = 0
+            self.attempts = 0
+            self.retries = 0
+            self.recovered = 0
+            self.timeouts = 0
+            self.wait_time = 0.0
+            self.last: Optional[AddRenderJobResult] = None
+
+    def record(self, result: AddRenderJobResult, timed_out: bool = False) -> None:
+        with self._lock:
+            self.jobs += not timed_out
+            self.attempts += result["attempts"]
+            self.retries += result["attempts"] - 1
+            self.recovered += result["recovered"]
+            self.timeouts += timed_out
+            self.wait_time += result["wait_time"]
+            self.last = result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns:
+            (Dict[str, Any]): every total, plus the ``last`` call
+        """
+        with self._lock:
+            return {
+                "jobs": self.jobs,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "recovered": self.recovered,
+                "timeouts": self.timeouts,
+                "wait_time": self.wait_time,
+                "last": self.last,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            f"AddRenderJobStats(jobs: {self.jobs}, retries: {self.retries}, "
+            f"recovered: {self.recovered}, timeouts: {self.timeouts}, "
+            f"wait_time: {self.wait_time:.3f}s)"
+        )
+
+
+add_renderjob_stats = AddRenderJobStats()
+
+
+def _progress(job_id: str, status: Dict[Any, Any]) -> RenderProgress:
+    return {
+        "job_id": job_id,
+        "status": status.get("JobStatus", "Failed") if status else "Failed",
+        "percentage": int(status.get("CompletionPercentage", 0) or 0) if status else 0,
+        "eta_ms": status.get("EstimatedTimeRemainingInMs") if status else None,
+        "time_taken_ms": status.get("TimeTakenToRenderInMs") if status else None,
+    }
+
+
+class RenderPoller(object):
+    """
+    Tracks the status of many render jobs with as few ``GetRenderJobStatus()`` calls as
+    possible.
+
+    Resolve renders its queue one job at a time, so each round only asks about the jobs
+    up to the first one that isn't finished yet: usually a single call, plus one per job
+    that finished since the last round. Every job is only checked when that job is still
+    waiting while Resolve is rendering something, in case the queue was reordered from
+    the UI, and at most once every ``sweep_interval`` seconds.
+
+    The time to wait between rounds grows with the ``EstimatedTimeRemainingInMs`` of the
+    job being rendered, between ``min_interval`` and ``max_interval`` seconds.
+
+    Args:
+        project (Project): project the jobs belong to
+        job_ids (Iterable[str]): jobs to track, in render order
+        min_interval (float, optional): shortest wait between rounds. Defaults to ``0.5``.
+        max_interval (float, optional): longest wait between rounds. Defaults to ``5.0``.
+        sweep_interval (float, optional): minimum seconds between rounds that check every
+            job. Defaults to ``30.0``.
+        idle_timeout (float, optional): stop tracking once nothing has been rendering and
+            no status has changed for this many seconds. Defaults to ``10.0``.
+        clock (Callable[[], float], optional): clock used for the intervals. Defaults to
+            ``time.monotonic``.
+        sleep (Callable[[float], Any], optional): function waiting between rounds. Defaults
+            to ``time.sleep``.
+    """
+
+    def __init__(
+        self,
+        project: "Project",
+        job_ids: Iterable[str],
+        min_interval: float = 0.5,
+        max_interval: float = 5.0,
+        sweep_interval: float = 30.0,
+        idle_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ) -> None:
+        self.project = project
+        self.job_ids = list(job_ids)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.sweep_interval = sweep_interval
+        self.idle_timeout = idle_timeout
+        self.clock = clock
+        self.sleep = sleep
+        self.statuses: Dict[str, RenderProgress] = {}
+        self.interval = min_interval
+        self.status_calls = 0
+        self._last_sweep: Optional[float] = None
+        self._last_activity = clock()
+
+    @property
+    def pending(self) -> List[str]:
+        """Jobs that haven't finished, in render order."""
+        return [
+            job_id
+            for job_id in self.job_ids
+            if job_id not in self.statuses or self.statuses[job_id]["status"] not in FINISHED
+        ]
+
+    @property
+    def done(self) -> bool:
+        """``True`` once every job finished, or nothing happened for ``idle_timeout``."""
+        if not self.pending:
+            return True
+        return self.clock() - self._last_activity >= self.idle_timeout
+
+    def _update(self, job_id: str, changed: List[RenderProgress]) -> RenderProgress:
+        self.status_calls += 1
+        progress = _progress(job_id, self.project.render_status(job_id))
+        if progress != self.statuses.get(job_id):
+            self.statuses[job_id] = progress
+            changed.append(progress)
+        return progress
+
+    def poll(self) -> List[RenderProgress]:
+        """
+        Runs one polling round and works out how long to wait before the next one.
+
+        Returns:
+            (List[RenderProgress]): jobs whose status or progress changed
+        """
+        now = self.clock()
+        changed: List[RenderProgress] = []
+        sweep = self._last_sweep is None
+        pending = self.pending
+        active: Optional[RenderProgress] = None
+        for job_id in pending:
+            if self._update(job_id, changed)["status"] not in FINISHED:
+                active = self.statuses[job_id]
+                break
+
+        rendering = active is not None and active["status"] == "Rendering"
+        waiting = active is not None and not rendering and self.project.is_rendering()
+        if waiting and self._last_sweep is not None:
+            # Something else is rendering: maybe another job, maybe one of ours moved up
+            sweep = now - self._last_sweep >= self.sweep_interval
+        if sweep and active is not None:
+            self._last_sweep = now
+            for job_id in pending[pending.index(active["job_id"]) + 1 :]:
+                self._update(job_id, changed)
+
+        if changed or rendering or waiting:
+            self._last_activity = now
+
+        if rendering and active is not None and active["eta_ms"] is not None:
+            wait = active["eta_ms"] / 1000 / 10
+        elif rendering:
+            wait = self.min_interval
+        else:
+            wait = self.max_interval
+        self.interval = min(max(wait, self.min_interval), self.max_interval)
+        return changed
+
+    def __iter__(self) -> Iterator[List[RenderProgress]]:
+        """
+        Polls until every job finished, sleeping ``interval`` seconds between rounds.
+
+        Yields:
+            (List[RenderProgress]): jobs that changed in each round
+        """
+        while True:
+            changed = self.poll()
+            if changed:
+                yield changed
+            if self.done:
+                return
+            self.sleep(self.interval)
+
+
+class RenderScheduler(object):
+    """
+    Submits many render jobs and follows them with a single
+    [``RenderPoller``][pydavinci.wrappers.render.RenderPoller]:
+
+    ```python
+    scheduler = RenderScheduler(project, on_complete=lambda p: print(p["job_id"], "done"))
+    scheduler.submit([
+        {"timeline": "Reel 1", "preset": "H.264 Master"},
+        {"timeline": "Reel 2", "format": "mov", "codec": "ProRes422HQ",
+         "settings": {"TargetDir": "/renders"}},
+    ])
+    scheduler.start()
+    for progress in scheduler.progress():
+        print(progress["job_id"], progress["status"], progress["percentage"])
+    ```
+
+    Args:
+        project (Project, optional): project to render in. Defaults to the current one.
+        on_progress (Callable[[RenderProgress], Any], optional): called on every change
+        on_complete (Callable[[RenderProgress], Any], optional): called when a job completes
+        on_failed (Callable[[RenderProgress], Any], optional): called when a job fails or
+            is cancelled
+        **poller_options: passed on to ``RenderPoller``
+    """
+
+    def __init__(
+        self,
+        project: Optional["Project"] = None,
+        on_progress: Optional[Callable[[RenderProgress], Any]] = None,
+        on_complete: Optional[Callable[[RenderProgress], Any]] = None,
+        on_failed: Optional[Callable[[RenderProgress], Any]] = None,
+        **poller_options: Any,
+    ) -> None:
+        if project is None:
+            from pydavinci.wrappers.project import Project
+
+            project = Project()
+        self.project = project
+        self.on_progress = on_progress
+        self.on_complete = on_complete
+        self.on_failed = on_failed
+        self.job_ids: List[str] = []
+        self._poller_options = poller_options
+        self._poller: Optional[RenderPoller] = None
+
+    def submit(self, specs: Iterable[RenderJobSpec]) -> List[str]:
+        """
+        Adds a render job for each spec. Each spec is applied on top of the current render
+        settings, in this order: ``timeline``, ``preset``, ``format``/``codec``, ``settings``.
+
+        Args:
+            specs (Iterable[RenderJobSpec]): job specs
+
+        Raises:
+            RenderJobNotAdded: Resolve refused part of a spec or didn't add the job
+
+        Returns:
+            (List[str]): ids of the added jobs
+        """
+        added = []
+        for spec in specs:
+            job_id = self._add(spec)
+            added.append(job_id)
+            self.job_ids.append(job_id)
+        return added
+
+    def _add(self, spec: RenderJobSpec) -> str:
+        project = self.project
+        timeline = spec.get("timeline")
+        if timeline is not None:
+            if isinstance(timeline, str):
+                ok = project.open_timeline(timeline)
+            else:
+                ok = project._obj.SetCurrentTimeline(timeline._obj)
+            if not ok:
+                raise RenderJobNotAdded(f"Couldn't open timeline {timeline}")
+        if "preset" in spec and not project.load_render_preset(spec["preset"]):
+            raise RenderJobNotAdded(f"Couldn't load render preset {spec['preset']}")
+        if "format" in spec or "codec" in spec:
+            render_format = spec.get("format") or project.current_render_format_and_codec["format"]
+            codec = spec.get("codec") or project.current_render_format_and_codec["codec"]
+            if not project.set_render_format_and_codec(render_format, codec):
+                raise RenderJobNotAdded(f"Couldn't set render format {render_format}/{codec}")
+        if spec.get("settings") and not project.set_render_settings(spec["settings"]):
+            raise RenderJobNotAdded(f"Couldn't apply render settings {spec['settings']}")
+
+        job_id = project.add_renderjob()
+        if not job_id:
+            raise RenderJobNotAdded("Resolve didn't return a render job id")
+        return job_id
+
+    def start(self, interactive: bool = False) -> bool:
+        """
+        Starts rendering the submitted jobs.
+
+        Args:
+            interactive (bool, optional): enable error feedback in the UI. Defaults to ``False``.
+
+        Returns:
+            bool: ``True`` if successful, ``False`` otherwise
+        """
+        if not self.job_ids:
+            return False
+        return self.project.render(self.job_ids, interactive=interactive)
+
+    @property
+    def poller(self) -> RenderPoller:
+        """Poller following the submitted jobs, restarted when more jobs are submitted."""
+        if self._poller is None or self._poller.job_ids != self.job_ids:
+            self._poller = RenderPoller(self.project, self.job_ids, **self._poller_options)
+        return self._poller
+
+    @property
+    def statuses(self) -> Dict[str, RenderProgress]:
+        """Last known progress of each job."""
+        return dict(self.poller.statuses)
+
+    def _notify(self, progress: RenderProgress) -> None:
+        if self.on_progress is not None:
+            self.on_progress(progress)
+        if progress["status"] == "Complete" and self.on_complete is not None:
+            self.on_complete(progress)
+        elif progress["status"] in ("Failed", "Cancelled") and self.on_failed is not None:
+            self.on_failed(progress)
+
+    def _follow(self, rounds: Iterable[List[RenderProgress]]) -> Iterator[RenderProgress]:
+        for changed in rounds:
+            for progress in changed:
+                self._notify(progress)
+                yield progress
+
+    def progress(self) -> Iterator[RenderProgress]:
+        """
+        Follows the jobs until they all finish, calling the callbacks on the way.
+
+        Yields:
+            (RenderProgress): every change of status or progress
+        """
+        return self._follow(self.poller)
+
+    def wait(self) -> Dict[str, RenderProgress]:
+        """
+        Blocks until every job finished.
+
+        Returns:
+            (Dict[str, RenderProgress]): final progress of each job
+        """
+        for _ in self.progress():
+            pass
+        unfinished = self.poller.pending
+        if unfinished:
+            log.warn(f"Stopped following {len(unfinished)} render job(s) that never finished")
+        return self.statuses
+
+    def __repr__(self) -> str:
+        return f"RenderScheduler({len(self.job_ids)} jobs)"
+
+
+class RenderEvents(object):
+    """
+    Stream of [``RenderEvent``][pydavinci.wrappers.render.RenderEvent]s for many render jobs,
+    polled together by one [``RenderPoller``][pydavinci.wrappers.render.RenderPoller]. Loop
+    over it with ``for`` or ``async for``:
+
+    ```python
+    for event in project.render_events():
+        if event["type"] == "completed":
+            print(event["job_id"], event["time_taken_ms"])
+
+    async for event in project.render_events():
+        await dashboard.publish(event)
+    ```
+
+    Event ``type`` is one of:
+
+    - ``started``: the job began rendering. Also sent for jobs found already finished
+      without having been seen rendering.
+    - ``progress``: ``percentage`` changed
+    - ``eta``: ``eta_ms`` changed
+    - ``completed``: the job finished, ``time_taken_ms`` is set
+    - ``failed``: the job failed or was cancelled, see ``status``
+
+    The stream ends once every job finished, or nothing happened for the poller's
+    ``idle_timeout``. With ``async for``, polling runs on the
+    [``pydavinci.aio``][pydavinci.aio] executor and waits with ``asyncio.sleep``.
+
+    Args:
+        project (Project): project the jobs belong to
+        job_ids (List[str], optional): jobs to follow. Defaults to every job in the queue.
+        **poller_options: passed on to ``RenderPoller``
+    """
+
+    def __init__(
+        self, project: "Project", job_ids: Optional[List[str]] = None, **poller_options: Any
+    ) -> None:
+        self.project = project
+        self.job_ids = job_ids
+        self._poller_options = poller_options
+        self._seen: Dict[str, RenderProgress] = {}
+        self._started: Dict[str, bool] = {}
+
+    def _resolve_job_ids(self) -> List[str]:
+        if self.job_ids is None:
+            self.job_ids = [job["JobId"] for job in self.project.render_jobs]
+        return self.job_ids
+
+    def _events(self, changed: List[RenderProgress]) -> List[RenderEvent]:
+        events = []
+        for progress in changed:
+            before = self._seen.get(progress["job_id"])
+            self._seen[progress["job_id"]] = progress
+            status = progress["status"]
+            if status == "Ready":
+                continue
+            if not self._started.get(progress["job_id"]):
+                self._started[progress["job_id"]] = True
+                events.append(_event("started", progress))
+            if status == "Rendering":
+                if before is None or before["percentage"] != progress["percentage"]:
+                    events.append(_event("progress", progress))
+                if progress["eta_ms"] is not None and (
+                    before is None or before["eta_ms"] != progress["eta_ms"]
+                ):
+                    events.append(_event("eta", progress))
+            elif status == "Complete":
+                events.append(_event("completed", progress))
+            elif status in FINISHED:
+                events.append(_event("failed", progress))
+        return events
+
+    def __iter__(self) -> Iterator[RenderEvent]:
+        poller = RenderPoller(self.project, self._resolve_job_ids(), **self._poller_options)
+        for changed in poller:
+            yield from self._events(changed)
+
+    async def __aiter__(self) -> AsyncIterator[RenderEvent]:
+        from pydavinci import aio
+
+        job_ids = await aio.run(self._resolve_job_ids)
+        poller = RenderPoller(self.project, job_ids, **self._poller_options)
+        while True:
+            for event in self._events(await aio.run(poller.poll)):
+                yield event
+            if poller.done:
+                return
+            await asyncio.sleep(poller.interval)
+
+    def __repr__(self) -> str:
+        count = "all" if self.job_ids is None else len(self.job_ids)
+        return f"RenderEvents({count} jobs)"
+
+
+def _event(kind: Any, progress: RenderProgress) -> RenderEvent:
+    return {
+        "type": kind,
+        "job_id": progress["job_id"],
+        "status": progress["status"],
+        "percentage": progress["percentage"],
+        "eta_ms": progress["eta_ms"],
+        "time_taken_ms": progress["time_taken_ms"],
+    }
@@ -0,0 +1,131 @@
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+import pydavinci.logger as log
+from pydavinci.exceptions import SettingsNotApplied
+from pydavinci.wrappers.settings.map import SETTINGS_MAP
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.settings.validator import BaseConfig
+
+# Underscore fields carry the remote object and the validation switch, not settings
+_INTERNAL = ("_obj", "_selfvalidate")
+
+
+class _Recorder(object):
+    # Stands in for the remote object while a batch is open, so that the validator
+    # records assignments instead of sending them to Resolve
+    def __init__(self) -> None:
+        self.changes: Dict[str, Any] = {}
+
+    def SetSetting(self, name: str, value: Any) -> bool:
+        self.changes[name] = value
+        return True
+
+
+class SettingsBatch(object):
+    """
+    Groups settings assignments so they're sent to Resolve together:
+
+    ```python
+    with project.settings.batch():
+        project.settings.timeline.resolution_width = 3840
+        project.settings.timeline.resolution_height = 2160
+        project.settings.color.science_mode = "davinciYRGBColorManagedv2"
+    ```
+
+    Assignments are still validated straight away, but nothing reaches Resolve until the
+    ``with`` block ends. Only settings that ended up with a different value are sent.
+
+    If Resolve refuses one of them, the settings already sent are set back to their
+    previous values, the local settings are restored and
+    [``SettingsNotApplied``][pydavinci.exceptions.SettingsNotApplied] is raised. Leaving
+    the block on an exception restores the local settings without sending anything.
+
+    Args:
+        settings (BaseConfig): ``ProjectSettings``, ``TimelineSettings`` or one section of them
+    """
+
+    def __init__(self, settings: "BaseConfig") -> None:
+        self.settings = settings
+        self.sent: List[str] = []
+        self._models: List[Tuple["BaseConfig", Any, _Recorder, Dict[str, Any]]] = []
+
+    def _sections(self) -> List["BaseConfig"]:
+        from pydavinci.wrappers.settings.validator import BaseConfig
+
+        models = [self.settings]
+        for name, field in self.settings.__fields__.items():
+            if isinstance(field.type_, type) and issubclass(field.type_, BaseConfig):
+                # Loads sections not parsed yet, so they're held back too
+                models.append(getattr(self.settings, name))
+        return models
+
+    def __enter__(self) -> "SettingsBatch":
+        self._models = []
+        self.sent = []
+        for model in self._sections():
+            snapshot = {k: v for k, v in model.__dict__.items() if k not in _INTERNAL}
+            recorder = _Recorder()
+            # Written to __dict__ directly, as assigning it would go through the validator
+            self._models.append((model, model.__dict__.get("_obj"), recorder, snapshot))
+            model.__dict__["_obj"] = recorder
+        return self
+
+    @property
+    def changes(self) -> Dict[str, Any]:
+        """Settings changed so far in this batch, by Resolve name, as they'd be sent."""
+        changes: Dict[str, Any] = {}
+        for model, _, recorder, snapshot in self._models:
+            aliases = {field.alias: name for name, field in model.__fields__.items()}
+            for alias, value in recorder.changes.items():
+                name = aliases[alias]
+                if model.__dict__.get(name) != snapshot.get(name):
+                    changes[alias] = value
+        return changes
+
+    def _restore(self) -> None:
+        for model, _, _, snapshot in self._models:
+            model.__dict__.update(snapshot)
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        changes = self.changes
+        for model, remote, _, _ in self._models:
+            model.__dict__["_obj"] = remote
+        if exc_type is not None:
+            self._restore()
+            return
+        if not changes:
+            return
+
+        remote = self._models[0][1]
+        previous = {alias: self._previous(alias) for alias in changes}
+        for alias, value in changes.items():
+            if remote.SetSetting(alias, value):
+                self.sent.append(alias)
+                continue
+
+            log.error(
+                f"Resolve refused setting '{alias}', rolling back {len(self.sent)} setting(s)"
+            )
+            for sent in reversed(self.sent):
+                remote.SetSetting(sent, previous[sent])
+            self.sent.clear()
+            self._restore()
+            raise SettingsNotApplied(alias, value)
+
+    def _previous(self, alias: str) -> Any:
+        for model, _, _, snapshot in self._models:
+            for name, field in model.__fields__.items():
+                if field.alias == alias and name in snapshot:
+                    transform: Callable[[Any], Any] = SETTINGS_MAP[alias]  # type: ignore
+                    return transform(snapshot[name])
+        return None
+
+    def __repr__(self) -> str:
+        return f"SettingsBatch({len(self.changes)} changes)"
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, TypeVar
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, TypeVar
 
 from pydavinci.wrappers.settings.components import (
     Audio,
@@ -44,91 +45,208 @@ class TimelineSettings(TimelineUniqueSettings, TimelineMeta, CommonSettings, Com
 
 
 class ProjectSettings(_ProjectMeta, _ProjectSettings):
+    # Raw settings of the sections not parsed yet, see LazySection
+    __slots__ = ("_pending",)
+
     # putting them here so they don't appear first when user calls Proejct.settings
     _selfvalidate: Optional[bool]
     _obj: Optional[Any]
 
+    def _load_sections(self) -> None:
+        for section in PROJECT_SECTIONS:
+            if section and section not in self.__dict__:
+                getattr(self, section)
 
-def get_appropriate_keys(pydantic_model: Type["AnyModel"], data: Dict[Any, Any]) -> Dict[Any, Any]:
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        # .dict(), .json() and == see every section
+        self._load_sections()
+        return super()._iter(*args, **kwargs)
 
-    # Since our base pydantic model is set to not allow extra keys,
-    # we need to filter them since from the Davinci API they are all
-    # together
+    def __repr_args__(self) -> Any:
+        self._load_sections()
+        return super().__repr_args__()
 
-    _ret: Dict[str, str] = {}
-    data = data
-    model = pydantic_model.__fields__
-    for value in model.values():
-        if value.alias in data.keys():
-            _ret[value.alias] = data[value.alias]
 
-    return _ret
+def _aliases(pydantic_model: Type["AnyModel"]) -> Tuple[str, ...]:
+    aliases = _ALIASES.get(pydantic_model)
+    if aliases is None:
+        aliases = _ALIASES[pydantic_model] = tuple(
+            field.alias for field in pydantic_model.__fields__.values()
+        )
+    return aliases
 
 
-def get_prj_settings(obj: "Project") -> ProjectSettings:
+_ALIASES: Dict[type, Tuple[str, ...]] = {}
 
-    data = obj._obj.GetSetting()
 
-    # First setting validation to off, we just want Pydantic to infer the types for now
-    # such as transforming str: "1" into int: 1 or str: "1" to bool: True on a bool field
-    data["_selfvalidate"] = False
+def get_appropriate_keys(pydantic_model: Type["AnyModel"], data: Dict[Any, Any]) -> Dict[Any, Any]:
 
-    audio = Audio.parse_obj(get_appropriate_keys(Audio, data))
-    color = Color.parse_obj(get_appropriate_keys(Color, data))
-    perf = Perf.parse_obj(get_appropriate_keys(Perf, data))
-    deck = Deck.parse_obj(get_appropriate_keys(Deck, data))
-    capture = Capture.parse_obj(get_appropriate_keys(Capture, data))
-    playout = Playout.parse_obj(get_appropriate_keys(Playout, data))
-    timeline = TimelineMeta.parse_obj(get_appropriate_keys(TimelineMeta, data))
+    # Since our base pydantic model is set to not allow extra keys,
+    # we need to filter them since from the Davinci API they are all
+    # together
 
+    return {alias: data[alias] for alias in _aliases(pydantic_model) if alias in data}
+
+
+# Nested sections of ProjectSettings, by attribute name. "" is for the top level settings.
+PROJECT_SECTIONS: Dict[str, Type["BaseConfig"]] = {
+    "audio": Audio,
+    "color": Color,
+    "perf": Perf,
+    "deck": Deck,
+    "capture": Capture,
+    "playout": Playout,
+    "timeline": TimelineMeta,
+    "": _ProjectSettings,
+}
+
+
+def _parse_section(model: Type["AnyModel"], data: Dict[str, Any], remote: Any) -> "AnyModel":
+    # Validation to Resolve is off while parsing, we just want Pydantic to infer the types
+    # such as transforming str: "1" into int: 1 or str: "1" to bool: True on a bool field.
+    # The remote object is then set so the validator can send changes to the right project.
+    # Written to __dict__ directly, as assigning them would go through the validator.
+    section = model.parse_obj({**data, "_selfvalidate": False})
+    section.__dict__["_obj"] = remote
+    section.__dict__["_selfvalidate"] = True
+    return section
+
+
+class LazySection(object):
+    """
+    A section of ``ProjectSettings`` parsed from the project's ``GetSetting()`` snapshot
+    the first time it's used. Once parsed, it's a regular attribute of the settings.
+
+    Args:
+        name (str): attribute name on ``ProjectSettings``
+        model (Type[BaseConfig]): model of the section
+    """
+
+    def __init__(self, name: str, model: Type["BaseConfig"]) -> None:
+        self.name = name
+        self.model = model
+
+    def __get__(self, settings: Optional[ProjectSettings], owner: Any = None) -> Any:
+        if settings is None:
+            return self
+        pending: Dict[str, Dict[str, Any]] = getattr(settings, "_pending", {})
+        if self.name not in pending:
+            raise AttributeError(self.name)
+        section = _parse_section(self.model, pending[self.name], settings.__dict__.get("_obj"))
+        settings.__dict__[self.name] = section
+        pending.pop(self.name, None)
+        return section
+
+
+for _name, _model in PROJECT_SECTIONS.items():
+    if _name:
+        setattr(ProjectSettings, _name, LazySection(_name, _model))
+
+_PROJECT_ROUTES: Optional[Dict[str, Tuple[str, ...]]] = None
+
+
+def project_routes() -> Dict[str, Tuple[str, ...]]:
+    """
+    Returns:
+        (Dict[str, Tuple[str, ...]]): the ``PROJECT_SECTIONS`` each Resolve setting name
+            belongs to, worked out once
+    """
+    global _PROJECT_ROUTES
+    if _PROJECT_ROUTES is None:
+        routes: Dict[str, Tuple[str, ...]] = {}
+        for section, model in PROJECT_SECTIONS.items():
+            for alias in _aliases(model):
+                if not alias.startswith("_"):
+                    routes[alias] = routes.get(alias, ()) + (section,)
+        _PROJECT_ROUTES = routes
+    return _PROJECT_ROUTES
+
+
+def _route(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    # One pass over the settings, sorting each one into the section(s) it belongs to
+    routes = project_routes()
+    buckets: Dict[str, Dict[str, Any]] = {section: {} for section in PROJECT_SECTIONS}
+    for alias, value in data.items():
+        for section in routes.get(alias, ()):
+            buckets[section][alias] = value
+    return buckets
+
+
+# Parsed settings by (backend, project unique id), least recently used first
+_settings_cache: "OrderedDict[Tuple[Any, str], ProjectSettings]" = OrderedDict()
+SETTINGS_CACHE_SIZE = 16
+
+
+def _cache_key(obj: "Project") -> Tuple[Any, str]:
+    from pydavinci.main import connection
+
+    return (connection.backend, obj._obj.GetUniqueId())
+
+
+def _bind(settings: "ProjectSettings", remote: Any) -> None:
+    # The same project can come back as a different remote object. Written to __dict__
+    # directly, as assigning it would go through the validator.
+    settings.__dict__["_obj"] = remote
+    for section in PROJECT_SECTIONS:
+        if section in settings.__dict__:
+            settings.__dict__[section].__dict__["_obj"] = remote
+
+
+def invalidate_prj_settings(obj: Optional["Project"] = None) -> None:
+    """
+    Drops the cached settings of project ``obj``, or of every project.
+
+    Args:
+        obj (Project, optional): project whose settings changed behind the cache's back
+    """
+    if obj is None:
+        _settings_cache.clear()
+    elif _settings_cache:
+        _settings_cache.pop(_cache_key(obj), None)
+
+
+def get_prj_settings(obj: "Project", cached: bool = True) -> ProjectSettings:
+    """
+    Builds the ``ProjectSettings`` of project ``obj`` from a single ``GetSetting()`` call.
+    Sections such as ``color`` or ``perf`` are only parsed when first used.
+
+    Parsed settings are cached per project, so other ``Project`` wrappers of the same
+    project share them.
+    [``Project.set_setting``][pydavinci.wrappers.project.Project.set_setting] drops them
+    from the cache.
+
+    Args:
+        obj (Project): project
+        cached (bool, optional): use the cache. Defaults to ``True``.
+
+    Returns:
+        (ProjectSettings): project settings
+    """
+    key = _cache_key(obj) if cached else None
+    if key is not None and key in _settings_cache:
+        _settings_cache.move_to_end(key)
+        settings = _settings_cache[key]
+        _bind(settings, obj._obj)
+        return settings
+
+    data = obj._obj.GetSetting()
     data["superScale"] = super_scale_transform(data["superScale"])
+    buckets = _route(data)
 
-    _projectsettings = _ProjectSettings.parse_obj(
-        get_appropriate_keys(_ProjectSettings, data)
-    ).dict()
-
-    # From now on we set manually the resolve ._obj so we can call them from the validator
-    # later on and avoid sending the settings to the wrong Project instance for example.
-
-    # there's probably a better way to do this but I just
-    # spent about 12 hrs non stop trying to figure out how
-    # to access an instance from a validator(actually I found out about 3 or 4 ways but
-    # this one works best)
-    # and I'm not ready for the super duper meta programming yet
-
-    audio._obj = obj._obj
-    color._obj = obj._obj
-    perf._obj = obj._obj
-    deck._obj = obj._obj
-    capture._obj = obj._obj
-    playout._obj = obj._obj
-    timeline._obj = obj._obj
-    audio._selfvalidate = True
-    color._selfvalidate = True
-    perf._selfvalidate = True
-    deck._selfvalidate = True
-    capture._selfvalidate = True
-    playout._selfvalidate = True
-    timeline._selfvalidate = True
-
-    const = {
-        "audio": audio,
-        "color": color,
-        "perf": perf,
-        "deck": deck,
-        "capture": capture,
-        "playout": playout,
-        "timeline": timeline,
-        **_projectsettings,
-    }
-
-    # We assemble everything and then pass it to the main ProjectSettings class
-    # using pydantic's construct so we don't need to infer the types again
-
-    _ret = ProjectSettings.construct(_fields_set=None, **const)
-    _ret._obj = obj._obj
-    _ret._selfvalidate = True
+    # Only the top level settings are parsed now, each section is parsed from its own
+    # bucket the first time it's used. See LazySection.
+    parsed = _parse_section(_ProjectSettings, buckets.pop(""), obj._obj)
+
+    # We then pass them to the main ProjectSettings class using pydantic's construct
+    # so we don't need to infer the types again
+
+    _ret = ProjectSettings.construct(_fields_set=None, **parsed.__dict__)
+    object.__setattr__(_ret, "_pending", buckets)
 
+    if key is not None:
+        _settings_cache[key] = _ret
+        while len(_settings_cache) > SETTINGS_CACHE_SIZE:
+            _settings_cache.popitem(last=False)
     return _ret
 
 
@@ -0,0 +1,187 @@
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Mapping, Optional, Union
+
+from typing_extensions import TypedDict
+
+import pydavinci.logger as log
+from pydavinci.wrappers.settings.map import SETTINGS_MAP, bool_to_intstr, super_scale_transform
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.project import Project
+    from pydavinci.wrappers.timeline import Timeline
+
+
+class SettingsReport(TypedDict):
+    sent: List[str]
+    unchanged: int
+    failed: List[str]
+
+
+def to_resolve(name: str, value: Any) -> Any:
+    """
+    Converts a setting value to the form Resolve stores it in, with the
+    ``SETTINGS_MAP`` transform of setting ``name``.
+
+    Args:
+        name (str): Resolve setting name, such as ``timelineResolutionWidth``
+        value (Any): Python or Resolve value, such as ``3840`` or ``"3840"``
+
+    Returns:
+        (Any): value for ``SetSetting()``
+    """
+    if name == "superScale":
+        # Resolve keeps it as a number, templates may have it as "2x"
+        if isinstance(value, str):
+            return int(value) if value.isdigit() else super_scale_transform(value)
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value
+    transform: Callable[[Any], Any] = SETTINGS_MAP.get(  # type: ignore
+        name, bool_to_intstr if isinstance(value, bool) else str
+    )
+    result = transform(value)
+    return "" if result is None else result
+
+
+class SettingsSnapshot(Mapping[str, Any]):
+    """
+    Immutable copy of every setting of a project or timeline, by Resolve name, as
+    returned by ``get_setting()``:
+
+    ```python
+    house = SettingsSnapshot.load("house_standard.json")
+    for project in projects:
+        report = project.apply_settings(house)
+    ```
+
+    A snapshot can be compared with another snapshot or with any ``dict`` of settings,
+    such as a JSON template. Values are compared as Resolve stores them, so a template can
+    use ``3840`` or ``True`` instead of ``"3840"`` or ``"1"``.
+
+    Args:
+        settings (Mapping[str, Any]): settings by Resolve name
+    """
+
+    def __init__(self, settings: Mapping[str, Any]) -> None:
+        self._settings = MappingProxyType(
+            {name: to_resolve(name, value) for name, value in settings.items()}
+        )
+
+    @classmethod
+    def capture(cls, obj: Union["Project", "Timeline"]) -> "SettingsSnapshot":
+        """
+        Takes a snapshot of the current settings of ``obj`` with one ``GetSetting()`` call.
+
+        Args:
+            obj (Union[Project, Timeline]): project or timeline
+
+        Returns:
+            (SettingsSnapshot): settings snapshot
+        """
+        return cls(obj._obj.GetSetting())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SettingsSnapshot":
+        """
+        Reads a snapshot or template saved as a JSON object of settings by Resolve name.
+
+        Args:
+            path (Union[str, Path]): JSON file
+
+        Returns:
+            (SettingsSnapshot): settings snapshot
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Saves the snapshot as JSON, to be read back with
+        [``load``][pydavinci.wrappers.settings.snapshot.SettingsSnapshot.load].
+
+        Args:
+            path (Union[str, Path]): JSON file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self._settings), f, indent=4, sort_keys=True)
+
+    def diff(self, target: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Settings of ``target`` that differ from this snapshot.
+
+        Args:
+            target (Mapping[str, Any]): snapshot or ``dict`` of settings to compare with
+
+        Returns:
+            (Dict[str, Any]): the differing settings, with ``target``'s values as they'd be
+                sent to Resolve
+        """
+        changes: Dict[str, Any] = {}
+        for name, value in target.items():
+            value = to_resolve(name, value)
+            if name not in self._settings or str(self._settings[name]) != str(value):
+                changes[name] = value
+        return changes
+
+    def __getitem__(self, name: str) -> Any:
+        return self._settings[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._settings)
+
+    def __len__(self) -> int:
+        return len(self._settings)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return len(self) == len(other) and not self.diff(other)
+
+    def __hash__(self) -> int:
+        return hash(frozenset((name, str(value)) for name, value in self._settings.items()))
+
+    def __repr__(self) -> str:
+        return f"SettingsSnapshot({len(self)} settings)"
+
+
+def apply_settings(
+    obj: Union["Project", "Timeline"],
+    template: Mapping[str, Any],
+    current: Optional[Mapping[str, Any]] = None,
+) -> SettingsReport:
+    """
+    Sets the settings of ``obj`` to the ones in ``template``, sending only those that differ.
+    Use [``Project.apply_settings``][pydavinci.wrappers.project.Project.apply_settings] or
+    [``Timeline.apply_settings``][pydavinci.wrappers.timeline.Timeline.apply_settings] to
+    also refresh their ``settings``.
+
+    Args:
+        obj (Union[Project, Timeline]): project or timeline
+        template (Mapping[str, Any]): snapshot or ``dict`` of settings by Resolve name
+        current (Mapping[str, Any], optional): current settings of ``obj``, if already known.
+            Defaults to a fresh [``SettingsSnapshot``][pydavinci.wrappers.settings.snapshot.SettingsSnapshot].
+
+    Returns:
+        (SettingsReport): settings sent, number of settings already matching and settings
+            Resolve refused
+    """
+    if current is None:
+        current = SettingsSnapshot.capture(obj)
+    elif not isinstance(current, SettingsSnapshot):
+        current = SettingsSnapshot(current)
+
+    changes = current.diff(template)
+    report: SettingsReport = {"sent": [], "unchanged": len(template) - len(changes), "failed": []}
+    for name, value in changes.items():
+        if obj._obj.SetSetting(name, value):
+            report["sent"].append(name)
+        else:
+            report["failed"].append(name)
+
+    if report["failed"]:
+        log.error(f"Resolve refused setting(s) {', '.join(report['failed'])} on {obj.name}")
+    return report
@@ -9,6 +9,8 @@ from pydavinci.wrappers.settings.map import SETTINGS_MAP, super_scale_transform
 if TYPE_CHECKING:
     from pydantic.fields import ModelField
 
+    from pydavinci.wrappers.settings.batch import SettingsBatch
+
 
 # monkey patch to get underscore fields
 def is_valid_field(name: str) -> Optional[bool]:
@@ -43,6 +45,19 @@ class BaseConfig(BaseModel):  # type: ignore
 
         return resolve_transform(cls, v, values, field)
 
+    def batch(self) -> "SettingsBatch":
+        """
+        Returns a context manager that holds back every setting assigned inside it, then
+        sends the changed ones together and rolls back if Resolve refuses one. See
+        [``SettingsBatch``][pydavinci.wrappers.settings.batch.SettingsBatch].
+
+        Returns:
+            (SettingsBatch): settings batch
+        """
+        from pydavinci.wrappers.settings.batch import SettingsBatch
+
+        return SettingsBatch(self)
+
     class Config:
         extra = "forbid"
         validate_assignment = True
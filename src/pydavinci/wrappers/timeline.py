@@ -1,21 +1,29 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Union
 
 import pydavinci.logger as log
 from pydavinci.exceptions import TimelineNotFound
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.main import resolve_obj
 from pydavinci.utils import TRACK_ERROR, TRACK_TYPES, get_resolveobjs, is_resolve_obj
 from pydavinci.wrappers.marker import MarkerCollection
 from pydavinci.wrappers.settings.constructor import get_tl_settings
+from pydavinci.wrappers.settings.snapshot import SettingsSnapshot, apply_settings
+from pydavinci.wrappers.timelinediff import timeline_diff
+from pydavinci.wrappers.timelineindex import TimelineIndex
 from pydavinci.wrappers.timelineitem import TimelineItem
+from pydavinci.wrappers.timelinesnapshot import TimelineSnapshot
 
 
 if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteTimeline
     from pydavinci.wrappers.gallerystill import GalleryStill
     from pydavinci.wrappers.settings.constructor import TimelineSettings
+    from pydavinci.wrappers.settings.snapshot import SettingsReport
+    from pydavinci.wrappers.timelinediff import TimelineDiff
 
 
-class Timeline:
+class Timeline(metaclass=IdentityMapped):
     def __init__(self, *args: Any) -> None:
         if args:
             if is_resolve_obj(args[0]):
@@ -32,9 +40,18 @@ class Timeline:
                     extra="Couldn't find any active timeline. Are you sure there's any timeline in the project?"
                 )
 
-        self.markers = MarkerCollection(self)
         self._settings: Optional[TimelineSettings] = None
 
+    @cached_property
+    def markers(self) -> MarkerCollection:
+        """
+        Markers of this ``Timeline``. Fetched from Resolve the first time they're accessed.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        return MarkerCollection(self)
+
     def custom_settings(self, use: bool) -> bool:
         # Davinci only allows setting timeline settings if "useCustomSettings" is true, otherwise it returns False every time.
         """Allows this timeline to have settings independent from the project settings. See [Quickstart on Settings](../settings#project-vs-timeline-settings) for more details.
@@ -162,6 +179,54 @@ class Timeline:
 
         return [TimelineItem(x) for x in self._obj.GetItemListInTrack(track_type, track_index)]
 
+    def index(self, max_workers: Optional[int] = None) -> "TimelineIndex":
+        """
+        Reads the position of every item once into a
+        [``TimelineIndex``][pydavinci.wrappers.timelineindex.TimelineIndex], for queries
+        such as the items under a frame or overlapping a range without remote calls.
+
+        Args:
+            max_workers (int, optional): threads reading items at once. Defaults to what
+                the current backend allows.
+
+        Returns:
+            (TimelineIndex): timeline index
+        """
+        return TimelineIndex(self, max_workers=max_workers)
+
+    def snapshot(
+        self, max_workers: Optional[int] = None, index: Optional["TimelineIndex"] = None
+    ) -> "TimelineSnapshot":
+        """
+        Reads every item on every track once into a columnar
+        [``TimelineSnapshot``][pydavinci.wrappers.timelinesnapshot.TimelineSnapshot]:
+        name, start, end, duration, offsets, media id, flags and clip color.
+
+        Args:
+            max_workers (int, optional): threads reading items at once. Defaults to what
+                the current backend allows.
+            index (TimelineIndex, optional): up to date index of this timeline, to take
+                positions from instead of reading them again
+
+        Returns:
+            (TimelineSnapshot): timeline snapshot
+        """
+        return TimelineSnapshot.capture(self, max_workers, index)
+
+    def diff(self, other: Union["Timeline", "TimelineSnapshot"]) -> "TimelineDiff":
+        """
+        Items inserted, deleted, moved, trimmed and re-sourced, and markers changed, from
+        this timeline to ``other``. See
+        [``timeline_diff``][pydavinci.wrappers.timelinediff.timeline_diff].
+
+        Args:
+            other (Union[Timeline, TimelineSnapshot]): timeline or snapshot to compare to
+
+        Returns:
+            (TimelineDiff): changes
+        """
+        return timeline_diff(self, other)
+
     def grab_all_stills(self, still_frame_source: int) -> List["GalleryStill"]:
         """
         Grabs stills from all the clips of the timeline.
@@ -486,6 +551,37 @@ class Timeline:
         """
         return self._obj.SetSetting(setting_name, value)
 
+    def snapshot_settings(self) -> "SettingsSnapshot":
+        """
+        Takes an immutable [``SettingsSnapshot``][pydavinci.wrappers.settings.snapshot.SettingsSnapshot]
+        of every timeline setting, with one ``GetSetting()`` call.
+
+        Returns:
+            (SettingsSnapshot): settings snapshot
+        """
+        return SettingsSnapshot.capture(self)
+
+    def apply_settings(
+        self, template: Mapping[str, Any], current: Optional[Mapping[str, Any]] = None
+    ) -> "SettingsReport":
+        """
+        Sets timeline settings to the ones in ``template``, sending only the settings that
+        differ from the current ones. See
+        [``apply_settings``][pydavinci.wrappers.settings.snapshot.apply_settings].
+
+        Args:
+            template (Mapping[str, Any]): snapshot or ``dict`` of settings by Resolve name
+            current (Mapping[str, Any], optional): current settings, if already known
+
+        Returns:
+            (SettingsReport): settings sent, number of settings already matching and
+                settings Resolve refused
+        """
+        report = apply_settings(self, template, current)
+        if report["sent"]:
+            self._settings = None
+        return report
+
     def insert_generator(self, generator_name: str) -> "TimelineItem":
         """
         Inserts a generator in the timeline
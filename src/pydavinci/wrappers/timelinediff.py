@@ -0,0 +1,224 @@
+from collections import deque
+from difflib import SequenceMatcher
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from typing_extensions import Literal, TypedDict
+
+from pydavinci.utils import TRACK_TYPES
+from pydavinci.wrappers.timelinesnapshot import TimelineSnapshot
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers.timeline import Timeline
+
+# (media id, source in, source out): what an item shows, wherever it is on the timeline
+SourceKey = Tuple[str, int, int]
+
+
+class ItemRef(TypedDict):
+    row: int
+    track_type: str
+    track_index: int
+    name: str
+    media_id: str
+    start: int
+    end: int
+    source_in: int
+    source_out: int
+
+
+class ItemChange(TypedDict):
+    a: Optional[ItemRef]
+    b: Optional[ItemRef]
+
+
+class MarkerChange(TypedDict):
+    type: Literal["added", "removed", "changed"]
+    frame: int
+    a: Optional[Dict[str, Any]]
+    b: Optional[Dict[str, Any]]
+
+
+class TimelineDiff(TypedDict):
+    inserted: List[ItemChange]
+    deleted: List[ItemChange]
+    moved: List[ItemChange]
+    trimmed: List[ItemChange]
+    resourced: List[ItemChange]
+    markers: List[MarkerChange]
+
+
+def _ref(snapshot: TimelineSnapshot, row: int) -> ItemRef:
+    left = snapshot["left_offset"][row]
+    return {
+        "row": row,
+        "track_type": snapshot["track_type"][row],
+        "track_index": snapshot["track_index"][row],
+        "name": snapshot["name"][row],
+        "media_id": snapshot["media_id"][row],
+        "start": snapshot["start"][row],
+        "end": snapshot["end"][row],
+        "source_in": left,
+        "source_out": left + snapshot["duration"][row],
+    }
+
+
+def _by_track(snapshot: TimelineSnapshot) -> Dict[Tuple[str, int], List[ItemRef]]:
+    tracks: Dict[Tuple[str, int], List[ItemRef]] = {}
+    for row in range(len(snapshot)):
+        ref = _ref(snapshot, row)
+        tracks.setdefault((ref["track_type"], ref["track_index"]), []).append(ref)
+    return tracks
+
+
+def _key(ref: ItemRef) -> SourceKey:
+    return (ref["media_id"], ref["source_in"], ref["source_out"])
+
+
+def _take(
+    bucket: Optional[Deque[ItemRef]], used: Set[int], overlapping: Optional[ItemRef] = None
+) -> Optional[ItemRef]:
+    # First item of bucket not paired yet, with a source range overlapping the one of
+    # overlapping if given. Paired items at the front are dropped on the way.
+    if not bucket:
+        return None
+    while bucket and bucket[0]["row"] in used:
+        bucket.popleft()
+    for ref in bucket:
+        if ref["row"] in used:
+            continue
+        if overlapping is None or (
+            ref["source_in"] < overlapping["source_out"]
+            and overlapping["source_in"] < ref["source_out"]
+        ):
+            used.add(ref["row"])
+            return ref
+    return None
+
+
+def _pair(
+    a: List[ItemRef], b: List[ItemRef], diff: TimelineDiff
+) -> Tuple[List[ItemRef], List[ItemRef]]:
+    # Items of a changed stretch of a track: same media with overlapping source ranges were
+    # trimmed, other media in the same place was re-sourced. Returns the unpaired ones.
+    by_media: Dict[str, Deque[ItemRef]] = {}
+    by_place: Dict[Tuple[int, int], Deque[ItemRef]] = {}
+    for new in b:
+        by_media.setdefault(new["media_id"], deque()).append(new)
+        by_place.setdefault((new["start"], new["end"]), deque()).append(new)
+
+    used: Set[int] = set()
+    unpaired_a: List[ItemRef] = []
+    for old in a:
+        kind = "trimmed"
+        match = _take(by_media.get(old["media_id"]), used, old)
+        if match is None:
+            kind = "resourced"
+            match = _take(by_place.get((old["start"], old["end"])), used)
+        if match is None:
+            unpaired_a.append(old)
+            continue
+        diff[kind].append({"a": old, "b": match})  # type: ignore
+    return unpaired_a, [new for new in b if new["row"] not in used]
+
+
+def _markers(a: Dict[int, Dict[str, Any]], b: Dict[int, Dict[str, Any]]) -> List[MarkerChange]:
+    changes: List[MarkerChange] = []
+    for frame in sorted(set(a) | set(b)):
+        old, new = a.get(frame), b.get(frame)
+        if old == new:
+            continue
+        kind = "added" if old is None else "removed" if new is None else "changed"
+        changes.append({"type": kind, "frame": frame, "a": old, "b": new})  # type: ignore
+    return changes
+
+
+def timeline_diff(
+    a: Union["Timeline", TimelineSnapshot], b: Union["Timeline", TimelineSnapshot]
+) -> TimelineDiff:
+    """
+    Compares two timelines, such as an edit and a
+    [``duplicate_timeline``][pydavinci.wrappers.timeline.Timeline.duplicate_timeline] copy
+    of it, or two snapshots of the same timeline:
+
+    ```python
+    diff = timeline_diff(locked_cut, resolve.active_timeline)
+    for change in diff["trimmed"]:
+        print(change["a"]["name"], change["a"]["source_in"], "->", change["b"]["source_in"])
+    ```
+
+    Items are told apart by what they show: media id, source in and source out. Each track
+    of ``a`` is aligned with the same track of ``b`` on that key with ``difflib``'s
+    ``SequenceMatcher``, so a long timeline isn't compared item by item against every other
+    item. Then:
+
+    - matched items at another position were ``moved``
+    - in a changed stretch, the same media with an overlapping source range was ``trimmed``
+    - in a changed stretch, other media at the same position was ``resourced``
+    - left over items are ``moved`` if the exact same source shows up elsewhere (another
+      track, or reordered), else ``deleted`` from ``a`` or ``inserted`` in ``b``
+
+    Timeline markers are compared by frame.
+
+    Args:
+        a (Union[Timeline, TimelineSnapshot]): timeline or snapshot to compare from
+        b (Union[Timeline, TimelineSnapshot]): timeline or snapshot to compare to
+
+    Returns:
+        (TimelineDiff): ``inserted``, ``deleted``, ``moved``, ``trimmed`` and ``resourced``
+            items as ``a``/``b`` pairs of ``ItemRef``, and ``markers`` changes
+    """
+    if not isinstance(a, TimelineSnapshot):
+        a = a.snapshot()
+    if not isinstance(b, TimelineSnapshot):
+        b = b.snapshot()
+
+    diff: TimelineDiff = {
+        "inserted": [],
+        "deleted": [],
+        "moved": [],
+        "trimmed": [],
+        "resourced": [],
+        "markers": _markers(a.markers, b.markers),
+    }
+    tracks_a, tracks_b = _by_track(a), _by_track(b)
+    deleted: List[ItemRef] = []
+    inserted: List[ItemRef] = []
+    for track in sorted(
+        set(tracks_a) | set(tracks_b), key=lambda t: (TRACK_TYPES.index(t[0]), t[1])
+    ):
+        old, new = tracks_a.get(track, []), tracks_b.get(track, [])
+        matcher = SequenceMatcher(None, [_key(r) for r in old], [_key(r) for r in new], False)
+        for op, i1, i2, j1, j2 in matcher.get_opcodes():
+            if op == "equal":
+                for ref_a, ref_b in zip(old[i1:i2], new[j1:j2], strict=True):
+                    if ref_a["start"] != ref_b["start"]:
+                        diff["moved"].append({"a": ref_a, "b": ref_b})
+                continue
+            left_a, left_b = _pair(old[i1:i2], new[j1:j2], diff)
+            deleted.extend(left_a)
+            inserted.extend(left_b)
+
+    # The same source anywhere else was moved there
+    elsewhere: Dict[SourceKey, Deque[ItemRef]] = {}
+    for ref in inserted:
+        elsewhere.setdefault(_key(ref), deque()).append(ref)
+    for ref in deleted:
+        candidates = elsewhere.get(_key(ref))
+        if candidates:
+            diff["moved"].append({"a": ref, "b": candidates.popleft()})
+        else:
+            diff["deleted"].append({"a": ref, "b": None})
+    for refs in elsewhere.values():
+        diff["inserted"].extend({"a": None, "b": ref} for ref in refs)
+    diff["inserted"].sort(key=lambda change: change["b"]["row"])  # type: ignore
+    return diff
@@ -0,0 +1,261 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from pydavinci.utils import TRACK_ERROR, TRACK_TYPES, remote_map
+from pydavinci.wrappers.timelineitem import TimelineItem
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteTimelineItem  # type: ignore
+    from pydavinci.wrappers.timeline import Timeline
+
+# (track type, track index)
+Track = Tuple[str, int]
+
+
+class TrackColumns(object):
+    """
+    Positions of the items of one track, sorted by start frame, one ``array`` per field.
+    Items on a track can't overlap, so ends are sorted too.
+
+    Args:
+        items (List[Tuple[PyRemoteTimelineItem, int, int, int, int]]): remote item, start,
+            end, left offset and right offset of every item on the track
+    """
+
+    def __init__(self, items: List[Tuple[Any, int, int, int, int]]) -> None:
+        items = sorted(items, key=lambda item: item[1])
+        self.objs: List["PyRemoteTimelineItem"] = [item[0] for item in items]
+        self.starts = array("q", [item[1] for item in items])
+        self.ends = array("q", [item[2] for item in items])
+        self.left_offsets = array("q", [item[3] for item in items])
+        self.right_offsets = array("q", [item[4] for item in items])
+
+    @property
+    def durations(self) -> "array[int]":
+        return array("q", [end - start for start, end in zip(self.starts, self.ends, strict=True)])
+
+    def at(self, frame: int) -> Optional[int]:
+        i = bisect_right(self.starts, frame) - 1
+        if i >= 0 and frame < self.ends[i]:
+            return i
+        return None
+
+    def overlapping(self, start: int, end: int) -> range:
+        # First item ending after start, up to the last one starting before end
+        return range(bisect_right(self.ends, start), bisect_left(self.starts, end))
+
+    def __len__(self) -> int:
+        return len(self.objs)
+
+
+def _read_item(obj: "PyRemoteTimelineItem") -> Tuple[Any, int, int, int, int]:
+    return (obj, obj.GetStart(), obj.GetEnd(), obj.GetLeftOffset(), obj.GetRightOffset())
+
+
+class TimelineIndex(object):
+    """
+    Start, end, duration and offsets of every item of a timeline, read once, for time
+    range queries without remote calls:
+
+    ```python
+    index = resolve.active_timeline.index()
+    index.at(86400, "video")  # Items under frame 86400 on any video track
+    index.overlapping(86400, 87000)  # Items overlapping this range on any track
+    index.gaps("video", 1)  # [(start, end), ...] of the empty parts of V1
+    index.nearest_edit(86410)  # Closest cut, on any track
+    ```
+
+    Each track is kept as ``array`` columns sorted by start frame. Since items on a track
+    can't overlap, a query is a binary search per track instead of a remote call per item.
+
+    The index isn't updated when the timeline changes. Re-read the tracks that were edited
+    with [``refresh``][pydavinci.wrappers.timelineindex.TimelineIndex.refresh].
+
+    Args:
+        timeline (Timeline, optional): timeline to index. Defaults to the current timeline.
+        build (bool, optional): read the timeline straight away. Defaults to ``True``.
+        max_workers (int, optional): threads reading items at once. Defaults to what the
+            current backend allows.
+    """
+
+    def __init__(
+        self,
+        timeline: Optional["Timeline"] = None,
+        build: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if timeline is None:
+            from pydavinci.wrappers.timeline import Timeline
+
+            timeline = Timeline()
+        self.timeline = timeline
+        self.max_workers = max_workers
+        self.start_frame = 0
+        self.end_frame = 0
+        self._tracks: Dict[Track, TrackColumns] = {}
+        if build:
+            self.refresh()
+
+    def refresh(self, track_type: Optional[str] = None, track_index: Optional[int] = None) -> None:
+        """
+        Reads the timeline again, or only one type of tracks, or only one track.
+
+        Args:
+            track_type (str, optional): valid ``track_type``: ``video``, ``audio``, ``subtitle``
+            track_index (int, optional): track index, with ``track_type``. Starts at ``1``
+
+        Raises:
+            ValueError: Not a valid track type, or ``track_index`` without ``track_type``
+        """
+        if track_type is not None and track_type not in TRACK_TYPES:
+            raise ValueError(TRACK_ERROR)
+        if track_index is not None and track_type is None:
+            raise ValueError("track_index needs a track_type")
+
+        timeline = self.timeline._obj
+        if track_index is not None and track_type is not None:
+            tracks = [(track_type, track_index)]
+        else:
+            types = [track_type] if track_type is not None else TRACK_TYPES
+            tracks = [(t, i) for t in types for i in range(1, timeline.GetTrackCount(t) + 1)]
+            for track in [track for track in self._tracks if track[0] in types]:
+                del self._tracks[track]
+
+        self.start_frame = timeline.GetStartFrame()
+        self.end_frame = timeline.GetEndFrame()
+        for track in tracks:
+            objs = timeline.GetItemListInTrack(*track) or []
+            self._tracks[track] = TrackColumns(remote_map(_read_item, objs, self.max_workers))
+
+    @property
+    def tracks(self) -> List[Track]:
+        """
+        Returns:
+            (List[Tuple[str, int]]): indexed ``(track type, track index)`` pairs
+        """
+        return sorted(self._tracks, key=lambda track: (TRACK_TYPES.index(track[0]), track[1]))
+
+    def track(self, track_type: str, track_index: int) -> TrackColumns:
+        """
+        Columns of a track, to use the positions without wrapping the items.
+
+        Args:
+            track_type (str): valid ``track_type``: ``video``, ``audio``, ``subtitle``
+            track_index (int): track index. Starts at ``1``
+
+        Returns:
+            (TrackColumns): ``starts``, ``ends``, ``durations``, ``left_offsets`` and
+                ``right_offsets`` arrays, sorted by start
+        """
+        return self._tracks[(track_type, track_index)]
+
+    def _select(self, track_type: Optional[str]) -> Iterator[TrackColumns]:
+        if track_type is not None and track_type not in TRACK_TYPES:
+            raise ValueError(TRACK_ERROR)
+        for track in self.tracks:
+            if track_type is None or track[0] == track_type:
+                yield self._tracks[track]
+
+    def at(self, frame: int, track_type: Optional[str] = None) -> List[TimelineItem]:
+        """
+        Items under ``frame``, at most one per track.
+
+        Args:
+            frame (int): timeline frame
+            track_type (str, optional): only look at this type of tracks
+
+        Returns:
+            (List[TimelineItem]): items, in track order
+        """
+        found = []
+        for columns in self._select(track_type):
+            i = columns.at(frame)
+            if i is not None:
+                found.append(TimelineItem(columns.objs[i]))
+        return found
+
+    def overlapping(
+        self, start: int, end: int, track_type: Optional[str] = None
+    ) -> List[TimelineItem]:
+        """
+        Items overlapping frames ``start`` (included) to ``end`` (excluded).
+
+        Args:
+            start (int): first frame
+            end (int): frame after the last one
+            track_type (str, optional): only look at this type of tracks
+
+        Returns:
+            (List[TimelineItem]): items, in track order then by start
+        """
+        return [
+            TimelineItem(columns.objs[i])
+            for columns in self._select(track_type)
+            for i in columns.overlapping(start, end)
+        ]
+
+    def gaps(
+        self,
+        track_type: str,
+        track_index: int,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Empty parts of a track.
+
+        Args:
+            track_type (str): valid ``track_type``: ``video``, ``audio``, ``subtitle``
+            track_index (int): track index. Starts at ``1``
+            start (int, optional): look from this frame. Defaults to the timeline start.
+            end (int, optional): look up to this frame. Defaults to the timeline end.
+
+        Returns:
+            (List[Tuple[int, int]]): ``(start, end)`` of every gap, ``end`` excluded
+        """
+        columns = self.track(track_type, track_index)
+        start = self.start_frame if start is None else start
+        end = self.end_frame if end is None else end
+        gaps = []
+        position = start
+        for i in columns.overlapping(start, end):
+            if columns.starts[i] > position:
+                gaps.append((position, columns.starts[i]))
+            position = max(position, columns.ends[i])
+        if position < end:
+            gaps.append((position, end))
+        return gaps
+
+    def nearest_edit(self, frame: int, track_type: Optional[str] = None) -> Optional[int]:
+        """
+        Closest frame where an item starts or ends.
+
+        Args:
+            frame (int): timeline frame
+            track_type (str, optional): only look at this type of tracks
+
+        Returns:
+            (Optional[int]): frame of the edit, the earlier one on a tie. ``None`` if there
+                are no items.
+        """
+        nearest: Optional[int] = None
+        for columns in self._select(track_type):
+            for edits in (columns.starts, columns.ends):
+                i = bisect_left(edits, frame)
+                for j in (i - 1, i):
+                    if 0 <= j < len(edits):
+                        edit = edits[j]
+                        if (
+                            nearest is None
+                            or abs(edit - frame) < abs(nearest - frame)
+                            or (abs(edit - frame) == abs(nearest - frame) and edit < nearest)
+                        ):
+                            nearest = edit
+        return nearest
+
+    def __len__(self) -> int:
+        return sum(len(columns) for columns in self._tracks.values())
+
+    def __repr__(self) -> str:
+        return f"TimelineIndex({len(self)} items on {len(self._tracks)} tracks)"
@@ -1,7 +1,9 @@
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Dict, List, Union
 
 from typing_extensions import Literal
 
+from pydavinci.identitymap import IdentityMapped
 from pydavinci.utils import is_resolve_obj
 from pydavinci.wrappers.marker import MarkerCollection
 from pydavinci.wrappers.mediapoolitem import MediaPoolItem
@@ -10,7 +12,7 @@ if TYPE_CHECKING:
     from pydavinci.wrappers._resolve_stubs import PyRemoteTimelineItem  # type: ignore
 
 
-class TimelineItem:
+class TimelineItem(metaclass=IdentityMapped):
     def __init__(self, obj: "PyRemoteTimelineItem") -> None:
 
         if is_resolve_obj(obj):
@@ -18,7 +20,15 @@ class TimelineItem:
         else:
             raise TypeError(f"{type(obj)} is not a valid {self.__class__.__name__} type")
 
-        self.markers = MarkerCollection(self)
+    @cached_property
+    def markers(self) -> MarkerCollection:
+        """
+        Markers of this ``TimelineItem``. Fetched from Resolve the first time they're accessed.
+
+        Returns:
+            (MarkerCollection): markers
+        """
+        return MarkerCollection(self)
 
     @property
     def name(self) -> str:
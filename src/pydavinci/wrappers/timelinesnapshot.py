@@ -0,0 +1,163 @@
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from pydavinci.table import PropertyTable, _intern
+from pydavinci.utils import remote_map
+from pydavinci.wrappers.timelineindex import TimelineIndex
+from pydavinci.wrappers.timelineitem import TimelineItem
+
+if TYPE_CHECKING:
+    from pydavinci.wrappers._resolve_stubs import PyRemoteTimelineItem  # type: ignore
+    from pydavinci.wrappers.timeline import Timeline
+
+
+def _read_fields(obj: "PyRemoteTimelineItem") -> Tuple[str, Any, Tuple[str, ...], str]:
+    # Positions come from a TimelineIndex, so only what it doesn't read is left
+    return (
+        obj.GetName(),
+        obj.GetMediaPoolItem(),
+        tuple(_intern(flag) for flag in obj.GetFlagList() or []),
+        obj.GetClipColor(),
+    )
+
+
+class TimelineSnapshot(PropertyTable):
+    """
+    Every item on every video, audio and subtitle track of a timeline, read once into
+    columns, without a [``TimelineItem``][pydavinci.wrappers.timelineitem.TimelineItem]
+    per item:
+
+    ```python
+    snapshot = resolve.active_timeline.snapshot()
+    snapshot["media_id"]  # One value per item
+    for color, group in snapshot.where("track_type", "video").group_by("clip_color").items():
+        print(color or "No color", len(group), sum(group["duration"]))
+    ```
+
+    Columns are ``track_type``, ``track_index``, ``name``, ``start``, ``end``,
+    ``duration``, ``left_offset``, ``right_offset``, ``media_id``, ``flags`` (a tuple per
+    item) and ``clip_color``. Frame numbers are kept in ``array`` columns and strings are
+    interned, so a snapshot of tens of thousands of items stays small. Rows are in track
+    order, then by start frame. The timeline markers are in ``markers``.
+
+    Args:
+        columns (Dict[str, Sequence[Any]]): equally long columns, keyed by column name
+        objs (List[PyRemoteTimelineItem], optional): remote items, in row order
+        markers (Dict[int, Dict[str, Any]], optional): timeline markers, by frame
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Sequence[Any]],
+        objs: Optional[List["PyRemoteTimelineItem"]] = None,
+        markers: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> None:
+        super().__init__(columns)  # type: ignore
+        self._objs = objs or []
+        self.markers: Dict[int, Dict[str, Any]] = markers or {}
+
+    @classmethod
+    def capture(
+        cls,
+        timeline: "Timeline",
+        max_workers: Optional[int] = None,
+        index: Optional[TimelineIndex] = None,
+    ) -> "TimelineSnapshot":
+        """
+        Reads every item and the markers of ``timeline``. Item fields are read from up to
+        ``max_workers`` threads at once.
+
+        Start, end and offsets are taken from ``index``, so a snapshot of a timeline that
+        is already indexed only reads name, flags, clip color and media pool item per
+        item. The media id is read once per media pool item, however many items use it.
+
+        Args:
+            timeline (Timeline): timeline
+            max_workers (int, optional): thread count. Defaults to what the current
+                backend allows.
+            index (TimelineIndex, optional): up to date index of ``timeline``. Built if
+                not provided.
+
+        Returns:
+            (TimelineSnapshot): timeline snapshot
+        """
+        if index is None:
+            index = TimelineIndex(timeline, max_workers=max_workers)
+
+        tracks: List[Tuple[str, int]] = []
+        objs: List["PyRemoteTimelineItem"] = []
+        starts, ends, lefts, rights = array("q"), array("q"), array("q"), array("q")
+        for track_type, track_index in index.tracks:
+            positions = index.track(track_type, track_index)
+            tracks.extend([(_intern(track_type), track_index)] * len(positions))
+            objs.extend(positions.objs)
+            starts.extend(positions.starts)
+            ends.extend(positions.ends)
+            lefts.extend(positions.left_offsets)
+            rights.extend(positions.right_offsets)
+
+        rows = remote_map(_read_fields, objs, max_workers)
+        # Media pool items are shared between items, keep each one alive while it's a key
+        media_ids: Dict[Any, str] = {}
+        for _, mediapoolitem, _, _ in rows:
+            if mediapoolitem is not None and mediapoolitem not in media_ids:
+                media_ids[mediapoolitem] = _intern(mediapoolitem.GetMediaId())
+
+        columns: Dict[str, Sequence[Any]] = {
+            "track_type": [track[0] for track in tracks],
+            "track_index": array("i", [track[1] for track in tracks]),
+            "name": [_intern(row[0]) for row in rows],
+            "start": starts,
+            "end": ends,
+            "duration": array("q", [end - start for start, end in zip(starts, ends, strict=True)]),
+            "left_offset": lefts,
+            "right_offset": rights,
+            "media_id": [media_ids[row[1]] if row[1] is not None else "" for row in rows],
+            "flags": [row[2] for row in rows],
+            "clip_color": [_intern(row[3]) for row in rows],
+        }
+        return cls(columns, objs, timeline._obj.GetMarkers() or {})
+
+    def item(self, index: int) -> TimelineItem:
+        """
+        Args:
+            index (int): row number
+
+        Returns:
+            (TimelineItem): the item of that row
+        """
+        return TimelineItem(self._objs[index])
+
+    def take(self, indices: Sequence[int]) -> "TimelineSnapshot":
+        """
+        Args:
+            indices (List[int]): row numbers to keep, in the order wanted
+
+        Returns:
+            (TimelineSnapshot): new snapshot with only those rows
+        """
+        columns: Dict[str, Sequence[Any]] = {}
+        for key, column in self.columns.items():
+            values = [column[i] for i in indices]
+            columns[key] = array(column.typecode, values) if isinstance(column, array) else values
+        objs = [self._objs[i] for i in indices] if self._objs else None
+        snapshot = TimelineSnapshot(columns, objs, self.markers)
+        snapshot._length = len(indices)
+        return snapshot
+
+    def track(self, track_type: str, track_index: int) -> "TimelineSnapshot":
+        """
+        Args:
+            track_type (str): valid ``track_type``: ``video``, ``audio``, ``subtitle``
+            track_index (int): track index. Starts at ``1``
+
+        Returns:
+            (TimelineSnapshot): the items of one track
+        """
+        types, indexes = self.columns["track_type"], self.columns["track_index"]
+        return self.take(
+            [i for i in range(len(self)) if indexes[i] == track_index and types[i] == track_type]
+        )
+
+    def __repr__(self) -> str:
+        return f"TimelineSnapshot({len(self)} items)"
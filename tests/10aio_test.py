@@ -0,0 +1,101 @@
+# flake8: noqa
+# type: ignore
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pydavinci import aio
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.main import connection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global backend
+    backend = connection.use_backend(FakeBackend())
+    backend.populate(clips=20, folders=1)
+    yield
+    aio.shutdown()
+    connection.use_backend()
+
+
+def test_async_wrappers():
+    async def main():
+        resolve = aio.Resolve()
+        project = await resolve.project
+        assert isinstance(project, aio.Project)
+        assert isinstance(await resolve.media_pool, aio.MediaPool)
+
+        await project.set("name", "Async")
+        assert await project.name == "Async"
+        assert project.sync.name == "Async"
+
+        pool = await resolve.media_pool
+        folder = await pool.root_folder
+        assert isinstance(folder, aio.AsyncWrapper)
+        clips = await folder.clips
+        assert all(isinstance(clip, aio.MediaPoolItem) for clip in clips)
+        assert await clips[0].set_metadata({"Scene": "4"})
+        assert await clips[0].get_metadata("Scene") == "4"
+
+        walked = [(path, await clip.name) async for path, clip in pool.iter_clips(limit=25)]
+        assert len(walked) == 20
+        assert walked[0][0] == "Master"
+
+        timeline = await pool.create_timeline_from_clips("async", clips)
+        assert isinstance(timeline, aio.Timeline)
+        assert await timeline.name == "async"
+
+    asyncio.run(main())
+
+
+def test_calls_run_off_the_event_loop():
+    backend.latency = 0.02
+    loop_thread = []
+    call_threads = set()
+    original = backend.remote_call
+
+    def remote_call(name, method):
+        call = original(name, method)
+
+        def tracked(*args, **kwargs):
+            call_threads.add(threading.get_ident())
+            return call(*args, **kwargs)
+
+        return tracked
+
+    backend.remote_call = remote_call
+
+    async def ticker(ticks):
+        while True:
+            ticks.append(time.perf_counter())
+            await asyncio.sleep(0.005)
+
+    async def main():
+        loop_thread.append(threading.get_ident())
+        ticks = []
+        task = asyncio.ensure_future(ticker(ticks))
+        pool = await aio.Resolve().media_pool
+        clips = await (await pool.root_folder).clips
+        names = await asyncio.gather(*(clip.name for clip in clips))
+        task.cancel()
+        return names, ticks
+
+    names, ticks = asyncio.run(main())
+    assert len(names) == 10
+    assert loop_thread[0] not in call_threads
+    # The loop kept running while remote calls were in flight
+    assert len(ticks) > 5
+
+
+def test_executor_follows_backend():
+    assert aio.get_executor()._max_workers == backend.max_workers
+    executor = aio.get_executor()
+    assert aio.get_executor() is executor
+
+    connection.use_backend(FakeBackend(max_workers=1))
+    assert aio.get_executor() is not executor
+    assert aio.get_executor()._max_workers == 1
@@ -0,0 +1,200 @@
+# flake8: noqa
+# type: ignore
+import asyncio
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.exceptions import RenderJobNotAdded
+from pydavinci.main import connection
+from pydavinci.wrappers.render import RenderScheduler, add_renderjob_stats
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, project, clock
+    clock = Clock()
+    backend = connection.use_backend(FakeBackend(clock=clock))
+    backend.populate(clips=4)
+    resolve = davinci.Resolve()
+    project = resolve.project
+    pool = resolve.media_pool
+    clips = pool.root_folder.clips
+    pool.create_timeline_from_clips("Reel 1", clips[:2])
+    pool.create_timeline_from_clips("Reel 2", clips[2:])
+    yield
+    connection.use_backend()
+
+
+def scheduler(**kwargs):
+    return RenderScheduler(project, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_submit_specs():
+    render = scheduler()
+    ids = render.submit(
+        [
+            {"timeline": "Reel 1", "settings": {"CustomName": "one"}},
+            {"timeline": "Reel 2", "format": "mov", "codec": "ProRes422HQ"},
+        ]
+    )
+    assert render.job_ids == ids and len(ids) == 2
+    jobs = {job["JobId"]: job for job in backend.resolve.project.GetRenderJobList()}
+    assert jobs[ids[0]]["TimelineName"] == "Reel 1"
+    assert jobs[ids[0]]["OutputFilename"].startswith("one.")
+    assert jobs[ids[1]]["TimelineName"] == "Reel 2"
+    assert jobs[ids[1]]["VideoCodec"] == "ProRes422HQ"
+
+    with pytest.raises(RenderJobNotAdded):
+        render.submit([{"preset": "Not a preset"}])
+
+
+def test_progress_and_callbacks():
+    completed = []
+    updates = []
+    render = scheduler(on_complete=completed.append, on_progress=updates.append)
+    render.submit([{"timeline": "Reel 1"}, {"timeline": "Reel 2"}])
+    assert render.start()
+
+    seen = list(render.progress())
+    assert seen == updates
+    assert [p["job_id"] for p in completed] == render.job_ids
+    assert all(p["time_taken_ms"] > 0 for p in completed)
+    assert any(p["status"] == "Rendering" and p["eta_ms"] for p in seen)
+    assert {p["status"] for p in render.statuses.values()} == {"Complete"}
+
+
+def test_many_jobs_cost_few_status_calls():
+    render = scheduler()
+    render.submit([{"settings": {"CustomName": f"job{i}"}} for i in range(200)])
+    started = clock.now
+    render.start()
+
+    backend.reset_calls()
+    statuses = render.wait()
+    elapsed = clock.now - started
+    assert len(statuses) == 200
+    assert all(p["status"] == "Complete" for p in statuses.values())
+    # A poll of every job per round would be 200 calls a round
+    assert backend.calls["GetRenderJobStatus"] / elapsed < 3
+
+
+def test_backs_off_with_eta():
+    render = scheduler(max_interval=30.0)
+    render.submit([{"timeline": "Reel 1"}])
+    backend.render_fps = 1.0
+    render.start()
+    render.poller.poll()
+    long_wait = render.poller.interval
+    clock.now += 0.99 * render.poller.statuses[render.job_ids[0]]["eta_ms"] / 1000
+    render.poller.poll()
+    assert render.poller.interval < long_wait
+    assert render.poller.min_interval <= render.poller.interval <= 30.0
+
+
+def test_stops_when_nothing_renders():
+    render = scheduler(idle_timeout=5.0)
+    render.submit([{"timeline": "Reel 1"}])
+    # Never started
+    assert render.wait()[render.job_ids[0]]["status"] == "Ready"
+    assert clock.now - 1000.0 < 10.0
+
+
+def test_add_renderjob_retries_with_backoff():
+    add_renderjob_stats.reset()
+    backend.dropped_job_ids = 3
+    job_id = project.add_renderjob(backoff=0.001)
+    assert job_id
+    assert [job["JobId"] for job in project.render_jobs] == [job_id]
+
+    last = add_renderjob_stats.last
+    assert last["attempts"] == 4 and not last["recovered"]
+    assert 0.007 <= last["wait_time"] < 1.0
+    assert add_renderjob_stats.retries == 3
+
+
+def test_add_renderjob_recovers_ghost_jobs():
+    add_renderjob_stats.reset()
+    backend.dropped_job_ids = 1
+    backend.ghost_jobs = True
+    backend.reset_calls()
+    job_id = project.add_renderjob(backoff=0.001)
+    # The job was queued without an id coming back: it's found, not added again
+    assert backend.calls["AddRenderJob"] == 1
+    assert [job["JobId"] for job in project.render_jobs] == [job_id]
+    assert add_renderjob_stats.recovered == 1
+    assert add_renderjob_stats.last["wait_time"] == 0
+
+
+def test_add_renderjob_deadline():
+    add_renderjob_stats.reset()
+    backend.dropped_job_ids = 10**6
+    with pytest.raises(RenderJobNotAdded):
+        project.add_renderjob(timeout=0.05, backoff=0.001, max_backoff=0.01)
+    assert add_renderjob_stats.timeouts == 1
+    assert add_renderjob_stats.jobs == 0
+    assert 1 < add_renderjob_stats.attempts < 50
+
+    assert project.add_renderjob(block=False) == ""
+
+
+def test_render_events():
+    render = scheduler()
+    render.submit([{"timeline": "Reel 1"}, {"timeline": "Reel 2"}])
+    project.add_renderjob()  # Never rendered
+    render.start()
+
+    events = list(project.render_events(clock=clock, sleep=clock.sleep, idle_timeout=5.0))
+    first, second = render.job_ids
+    for job_id in render.job_ids:
+        kinds = [e["type"] for e in events if e["job_id"] == job_id]
+        assert kinds[0] == "started" and kinds[-1] == "completed"
+        assert "progress" in kinds and "eta" in kinds
+    completed = [e for e in events if e["type"] == "completed"]
+    assert [e["job_id"] for e in completed] == [first, second]
+    assert all(e["time_taken_ms"] > 0 and e["percentage"] == 100 for e in completed)
+
+
+def test_render_events_failures():
+    render = scheduler()
+    render.submit([{"timeline": "Reel 1"}])
+    render.start()
+    events = project.render_events(render.job_ids, clock=clock, sleep=clock.sleep)
+    stream = iter(events)
+    assert next(stream)["type"] == "started"
+    project.stop_render()
+    rest = list(stream)
+    assert rest[-1]["type"] == "failed"
+    assert rest[-1]["status"] == "Cancelled"
+
+
+def test_render_events_async():
+    connection.use_backend(FakeBackend(render_fps=2000.0)).populate(clips=2)
+    resolve = davinci.Resolve()
+    pool = resolve.media_pool
+    pool.create_timeline_from_clips("Async", pool.root_folder.clips)
+    project = resolve.project
+    job_id = project.add_renderjob()
+    project.render([job_id])
+
+    async def collect():
+        events = project.render_events(min_interval=0.01, max_interval=0.05)
+        return [event async for event in events]
+
+    events = asyncio.run(collect())
+    assert events[0]["type"] == "started"
+    assert events[-1]["type"] == "completed"
+    assert events[-1]["job_id"] == job_id
@@ -0,0 +1,171 @@
+# flake8: noqa
+# type: ignore
+import pytest
+from pydantic import ValidationError
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.exceptions import SettingsNotApplied
+from pydavinci.main import connection
+from pydavinci.wrappers.project import Project
+from pydavinci.wrappers.settings.constructor import get_prj_settings
+from pydavinci.wrappers.settings.snapshot import SettingsSnapshot
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, project, settings
+    backend = connection.use_backend(FakeBackend())
+    backend.populate(clips=2)
+    resolve = davinci.Resolve()
+    project = resolve.project
+    settings = project.settings
+    yield
+    connection.use_backend()
+
+
+def remote(name):
+    return backend.resolve.project_manager.current_project.settings[name]
+
+
+def test_batch_sends_changed_settings_only():
+    backend.reset_calls()
+    with settings.batch() as batch:
+        settings.timeline.resolution_width = 3840
+        settings.timeline.resolution_height = 2160
+        settings.timeline.resolution_height = 1080  # Back to where it was
+        settings.audio.capture_num_channels = 4
+        assert backend.calls["SetSetting"] == 0
+        assert remote("timelineResolutionWidth") == "1920"
+
+    assert backend.calls["SetSetting"] == 2
+    assert sorted(batch.sent) == ["audioCaptureNumChannels", "timelineResolutionWidth"]
+    assert remote("timelineResolutionWidth") == "3840"
+    assert remote("audioCaptureNumChannels") == "4"
+    assert settings.timeline.resolution_width == 3840
+
+    # Outside of a batch, assignments are sent straight away again
+    settings.timeline.resolution_width = 1920
+    assert remote("timelineResolutionWidth") == "1920"
+
+
+def test_batch_exception_restores_local_values():
+    backend.reset_calls()
+    with pytest.raises(ValidationError):
+        with settings.batch():
+            settings.timeline.resolution_width = 3840
+            settings.audio.capture_num_channels = 3  # Must be a multiple of 2
+    assert backend.calls["SetSetting"] == 0
+    assert settings.timeline.resolution_width == 1920
+    assert settings.audio.capture_num_channels == 2
+
+
+def test_batch_rolls_back_refused_settings(monkeypatch):
+    fake_project = type(backend.resolve.project_manager.current_project)
+    set_setting = fake_project.SetSetting
+
+    def refuse_height(self, name, value):
+        if name == "timelineResolutionHeight":
+            return False
+        return set_setting(self, name, value)
+
+    monkeypatch.setattr(fake_project, "SetSetting", refuse_height)
+
+    with pytest.raises(SettingsNotApplied) as error:
+        with settings.timeline.batch():
+            settings.timeline.resolution_width = 3840
+            settings.timeline.resolution_height = 2160
+    assert error.value.setting == "timelineResolutionHeight"
+    assert remote("timelineResolutionWidth") == "1920"
+    assert settings.timeline.resolution_width == 1920
+    assert settings.timeline.resolution_height == 1080
+
+
+def test_settings_split_matches_models():
+    from pydavinci.wrappers.settings.constructor import PROJECT_SECTIONS, get_appropriate_keys
+
+    fresh = get_prj_settings(project, cached=False)
+    data = backend.resolve.project_manager.current_project.settings
+    for section, model in PROJECT_SECTIONS.items():
+        if section:
+            expected = model.parse_obj(
+                {**get_appropriate_keys(model, data), "_selfvalidate": False}
+            )
+            assert getattr(fresh, section).dict(exclude={"_obj", "_selfvalidate"}) == expected.dict(
+                exclude={"_obj", "_selfvalidate"}
+            )
+    assert fresh.timeline.resolution_width == 1920
+    assert fresh.super_scale == "auto"
+
+
+def test_settings_cached_per_project():
+    backend.reset_calls()
+    other = Project(project._obj)
+    assert other.settings is settings
+    assert backend.calls["GetSetting"] == 0
+    # Assignments through the models keep the cached settings up to date
+    other.settings.timeline.resolution_width = 3840
+    assert settings.timeline.resolution_width == 3840
+
+    assert project.set_setting("timelineResolutionWidth", "1280")
+    assert project.settings is not settings
+    assert project.settings.timeline.resolution_width == 1280
+    assert backend.calls["GetSetting"] == 1
+
+
+def test_settings_cache_follows_backend():
+    connection.use_backend(FakeBackend())
+    assert davinci.Resolve().project.settings is not settings
+
+
+def test_sections_parsed_on_first_use():
+    fresh = get_prj_settings(project, cached=False)
+    assert "color" not in fresh.__dict__ and "perf" not in fresh.__dict__
+    assert fresh.color is fresh.color
+    assert "color" in fresh.__dict__ and "perf" not in fresh.__dict__
+
+    # Sections parsed later still send their changes to the project
+    fresh.perf.auto_render_cache_after_time = 12
+    assert remote("perfAutoRenderCacheAfterTime") == "12"
+
+    assert set(fresh.dict()) >= {"audio", "deck", "playout", "timeline"}
+    assert "perf" in fresh.__dict__ and "capture" in fresh.__dict__
+
+
+def test_snapshot_diff():
+    before = project.snapshot_settings()
+    with pytest.raises(TypeError):
+        before["timelineResolutionWidth"] = "3840"
+    assert before == project.snapshot_settings()
+    assert hash(before) == hash(project.snapshot_settings())
+
+    template = {
+        "timelineResolutionWidth": 3840,
+        "timelineResolutionHeight": "1080",
+        "audioOutputHasTimecode": False,
+        "superScale": "2x",
+    }
+    assert before.diff(template) == {"timelineResolutionWidth": "3840", "superScale": 2}
+
+
+def test_apply_sends_differing_keys_only(tmp_path):
+    connection.use_backend(FakeBackend())
+    source = davinci.Resolve().project
+    source.set_setting("timelineResolutionWidth", "3840")
+    source.set_setting("colorScienceMode", "davinciYRGBColorManagedv2")
+    source.snapshot_settings().save(tmp_path / "house.json")
+
+    connection.use_backend(backend)
+    house = SettingsSnapshot.load(tmp_path / "house.json")
+    backend.reset_calls()
+    report = project.apply_settings(house)
+    assert sorted(report["sent"]) == ["colorScienceMode", "timelineResolutionWidth"]
+    assert report["failed"] == [] and report["unchanged"] == len(house) - 2
+    assert backend.calls["SetSetting"] == 2
+    assert project.snapshot_settings().diff(house) == {}
+    assert project.settings.timeline.resolution_width == 3840
+
+    backend.reset_calls()
+    assert project.apply_settings(house)["sent"] == []
+    assert backend.calls["SetSetting"] == 0
@@ -0,0 +1,161 @@
+# flake8: noqa
+# type: ignore
+from array import array
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.main import connection
+from pydavinci.wrappers.timelinediff import timeline_diff
+from pydavinci.wrappers.timelineindex import TimelineIndex
+from pydavinci.wrappers.timelineitem import TimelineItem
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, timeline, fake
+    backend = connection.use_backend(FakeBackend())
+    clips = backend.populate(clips=6).clips
+    resolve = davinci.Resolve()
+    timeline = resolve.media_pool.create_timeline_from_clips("Reel 1", [])
+    fake = backend.resolve.project.current_timeline
+    # V1: 86400-86500, 86500-86600, gap, 86700-86800
+    fake.add_item(clips[0], 86400, 100)
+    fake.add_item(clips[1], 86500, 100)
+    fake.add_item(clips[2], 86700, 100, left_offset=10)
+    # V2: 86550-86650
+    fake.add_item(clips[3], 86550, 100, track_index=2)
+    # A1: 86400-86800
+    fake.add_item(clips[4], 86400, 400, track_type="audio")
+    yield
+    connection.use_backend()
+
+
+def test_index_queries_without_remote_calls():
+    index = timeline.index()
+    assert len(index) == 5
+    assert index.tracks == [("video", 1), ("video", 2), ("audio", 1)]
+
+    backend.reset_calls()
+    under = index.at(86560, "video")
+    overlapping = index.overlapping(86590, 86710, "video")
+    assert backend.total_calls == 0
+
+    assert [item.start for item in under] == [86500, 86550]
+    assert [item.start for item in index.at(86500, "video")] == [86500]
+    assert index.at(86650, "video") == []
+    assert len(index.at(86650)) == 1
+    assert [item.start for item in overlapping] == [86500, 86700, 86550]
+
+    assert index.gaps("video", 1) == [(86600, 86700)]
+    assert index.gaps("video", 2) == [(86400, 86550), (86650, 86800)]
+    assert index.gaps("video", 1, 86000, 86900) == [(86000, 86400), (86600, 86700), (86800, 86900)]
+
+    assert index.nearest_edit(86540) == 86550
+    assert index.nearest_edit(86540, "audio") == 86400
+    assert index.nearest_edit(86525, "video") == 86500  # Tie, the earlier one
+
+    columns = index.track("video", 1)
+    assert list(columns.durations) == [100, 100, 100]
+    assert list(columns.left_offsets) == [0, 0, 10]
+
+
+def test_index_refresh_one_track():
+    index = TimelineIndex(timeline)
+    item = fake.tracks["video"][1][0]
+    item.start = 86700
+    assert index.gaps("video", 2)[0] == (86400, 86550)
+
+    backend.reset_calls()
+    index.refresh("video", 2)
+    assert backend.calls["GetItemListInTrack"] == 1
+    assert backend.calls["GetStart"] == 1
+    assert index.gaps("video", 2) == [(86400, 86700)]
+
+    fake.add_track("subtitle")
+    fake.add_item(None, 86400, 50, track_type="subtitle", name="Sub")
+    index.refresh("subtitle")
+    assert index.tracks[-1] == ("subtitle", 1)
+    assert index.at(86410, "subtitle")[0].name == "Sub"
+
+    with pytest.raises(ValueError):
+        index.refresh("titles")
+    with pytest.raises(ValueError):
+        index.refresh(track_index=2)
+
+
+def test_snapshot_columns():
+    TimelineItem(fake.tracks["video"][0][1]).add_flag("Blue")
+    TimelineItem(fake.tracks["video"][0][2]).color = "Purple"
+    fake.add_item(None, 86400, 50, track_type="subtitle", name="Sub")
+
+    backend.reset_calls()
+    snapshot = timeline.snapshot()
+    assert len(snapshot) == 6
+    assert backend.calls["GetItemListInTrack"] == 4
+    assert backend.calls["GetStart"] == 6 and backend.calls["GetDuration"] == 0
+
+    assert list(snapshot["track_type"]) == ["video"] * 4 + ["audio", "subtitle"]
+    assert list(snapshot["track_index"]) == [1, 1, 1, 2, 1, 1]
+    assert list(snapshot["start"]) == [86400, 86500, 86700, 86550, 86400, 86400]
+    assert list(snapshot["duration"]) == [100, 100, 100, 100, 400, 50]
+    assert snapshot["left_offset"][2] == 10
+    assert snapshot["flags"][1] == ("Blue",)
+    assert snapshot["clip_color"][2] == "Purple"
+    assert snapshot["media_id"][5] == ""
+    assert snapshot["media_id"][0] == resolve.media_pool.root_folder.clips[0].media_id
+    assert isinstance(snapshot["start"], array)
+    assert snapshot["name"][0] is snapshot.row(0)["name"]
+
+    v1 = snapshot.track("video", 1)
+    assert len(v1) == 3 and isinstance(v1["end"], array)
+    assert v1.item(2).start == 86700
+    assert len(snapshot.where("clip_color", "Purple")) == 1
+
+    index = timeline.index()
+    backend.reset_calls()
+    indexed = timeline.snapshot(index=index)
+    assert list(indexed["start"]) == list(snapshot["start"])
+    assert backend.calls["GetStart"] == 0 and backend.calls["GetItemListInTrack"] == 0
+    assert backend.calls["GetMediaId"] == len(set(snapshot["media_id"]) - {""})
+
+
+def test_timeline_diff():
+    fake.add_marker(0, "Blue", "Start", "", 1)
+    fake.add_marker(100, "Red", "Fix", "", 1)
+    copy = timeline.duplicate_timeline("Reel 1 v2")
+    other = backend.resolve.project.timelines[-1]
+    clips = backend.resolve.project.media_pool.root.clips
+    v1, v2 = other.tracks["video"][0], other.tracks["video"][1]
+
+    v1[0].left_offset, v1[0].duration = 5, 90  # Trimmed
+    v1[1].mediapoolitem = clips[5]  # Re-sourced, same place
+    v1[2].start = 86650  # Moved
+    moved_to_v3 = v2.pop(0)  # Moved to another track
+    other.add_item(moved_to_v3.mediapoolitem, moved_to_v3.start, 100, track_index=3)
+    other.tracks["audio"][0].clear()  # Deleted
+    other.add_item(clips[5], 86800, 24)  # Inserted
+    other.add_marker(200, "Green", "New", "", 1)
+    other._markers[100]["note"] = "Fixed"
+    del other._markers[0]
+
+    before = timeline.snapshot()
+    backend.reset_calls()
+    diff = timeline.diff(before)
+    assert not any(diff.values())
+    assert backend.calls["GetStart"] == len(before)  # Only self was read
+
+    diff = timeline_diff(before, copy)
+    assert [(c["a"]["start"], c["b"]["source_in"]) for c in diff["trimmed"]] == [(86400, 5)]
+    assert [c["b"]["media_id"] for c in diff["resourced"]] == [clips[5].GetMediaId()]
+    moved = {(c["a"]["track_index"], c["b"]["track_index"], c["b"]["start"]) for c in diff["moved"]}
+    assert moved == {(1, 1, 86650), (2, 3, 86550)}
+    assert [c["a"]["track_type"] for c in diff["deleted"]] == ["audio"]
+    assert [(c["b"]["start"], c["b"]["end"]) for c in diff["inserted"]] == [(86800, 86824)]
+    assert [(m["type"], m["frame"]) for m in diff["markers"]] == [
+        ("removed", 0),
+        ("changed", 100),
+        ("added", 200),
+    ]
@@ -0,0 +1,301 @@
+# flake8: noqa
+# type: ignore
+import math
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.main import connection
+from pydavinci.utils import frames_to_timecode, timecode_to_frames
+from pydavinci.wrappers.marker import MarkerCollection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, clip, fake
+    backend = connection.use_backend(FakeBackend())
+    backend.populate(clips=2, markers_per_clip=3)
+    resolve = davinci.Resolve()
+    clip = resolve.media_pool.root_folder.clips[0]
+    fake = clip._obj
+    yield
+    MarkerCollection.default_ttl = None
+    connection.use_backend()
+
+
+def test_fetch_reconciles_cache():
+    markers = clip.markers
+    first, second, third = markers.all
+    assert [m.frameid for m in (first, second, third)] == [0, 2, 4]
+
+    # Changed, deleted and added in the GUI
+    fake._markers[0]["note"] = "From the GUI"
+    del fake._markers[2]
+    fake.add_marker(10, "Red", "New")
+
+    assert [m.frameid for m in markers.all] == [0, 4, 10]
+    assert markers.all[0] is first and markers.all[1] is third
+    assert first.note == "From the GUI"
+    assert markers.find("Marker 2") is None
+
+
+def test_ttl_skips_fetches():
+    markers = MarkerCollection(clip, ttl=math.inf)
+    backend.reset_calls()
+    list(markers)
+    repr(markers)
+    assert len(markers.all) == 3
+    assert backend.calls["GetMarkers"] == 0
+    assert not markers.stale
+
+    fake.add_marker(10, "Red", "New")
+    markers.invalidate()
+    assert markers.stale
+    assert len(markers.all) == 4
+    assert backend.calls["GetMarkers"] == 1
+
+    # Without a ttl, every read fetches
+    markers.ttl = None
+    markers.all
+    markers.all
+    assert backend.calls["GetMarkers"] == 3
+
+
+def test_default_ttl():
+    MarkerCollection.default_ttl = 60.0
+    markers = resolve.media_pool.root_folder.clips[1].markers
+    assert markers.ttl == 60.0
+    backend.reset_calls()
+    markers.all
+    assert backend.calls["GetMarkers"] == 0
+
+
+def test_find_uses_indexes():
+    markers = clip.markers
+    markers.add(6, "Red", "VFX", customdata="shot-1")
+    markers.add(8, "Red", "VFX", customdata="shot-2")
+
+    backend.reset_calls()
+    assert markers.find(customdata="shot-2").frameid == 8
+    assert [m.frameid for m in markers.find_all("VFX")] == [6, 8]
+    assert [m.frameid for m in markers.find_all(name="VFX", color="Red")] == [6, 8]
+    assert markers.find_all(name="VFX", customdata="shot-3") is None
+    assert backend.total_calls == 0
+    with pytest.raises(ValueError):
+        markers.find()
+
+    # Kept up to date by setters, deletes and fetches
+    markers.find(customdata="shot-1").name = "Fixed"
+    assert markers.find(name="Fixed").frameid == 6
+    assert markers.find(customdata="shot-1", name="VFX") is None
+
+    markers.delete(customdata="shot-1")
+    assert markers.find(customdata="shot-1") is None
+    assert [m.frameid for m in markers.find_all("VFX")] == [8]
+
+    fake._markers[8]["customData"] = "shot-9"
+    markers.fetch()
+    assert markers.find(customdata="shot-2") is None
+    assert markers.find(customdata="shot-9").frameid == 8
+
+    markers.delete(color="Red")
+    assert markers.find_all(color="Red") is None
+    assert 8 not in fake._markers
+
+    # First by frame, whatever order they were added in
+    markers.add(9, "Red", "VFX")
+    markers.add(7, "Red", "VFX")
+    assert markers.find(name="VFX", color="Red").frameid == 7
+    assert [m.frameid for m in markers.find_all(color="Red")] == [7, 9]
+
+
+def test_range_queries():
+    markers = clip.markers
+    markers.add(20, "Red", "Long", duration=10)
+    markers.add(7, "Red", "Late")  # Added out of order
+
+    assert [m.frameid for m in markers.all] == [0, 2, 4, 7, 20]
+    backend.reset_calls()
+    assert [m.frameid for m in markers.in_range(2, 7)] == [2, 4]
+    assert markers.in_range(8, 20) == []
+    assert [m.frameid for m in markers.overlapping(25, 26)] == [20]
+    assert [m.frameid for m in markers.overlapping(4, 8)] == [4, 7]
+    assert markers.overlapping(30, 40) == []
+    assert markers.next_after(4).frameid == 7
+    assert markers.next_after(20) is None
+    assert markers.prev_before(4).frameid == 2
+    assert markers.prev_before(0) is None
+    assert backend.total_calls == 0
+
+    markers.delete(frameid=7)
+    assert markers.next_after(4).frameid == 20
+    del fake._markers[20]
+    markers.fetch()
+    assert markers.overlapping(25, 26) == []
+    assert markers.prev_before(100).frameid == 4
+
+
+def test_bulk_apply():
+    markers = clip.markers
+    markers.add(6, "Red", "A")
+    markers.add(8, "Red", "B", customdata="shot-1")
+    backend.reset_calls()
+    results = markers.bulk_apply(
+        [
+            {"action": "add", "frameid": 10, "color": "Green", "name": "New"},
+            {"action": "update", "frameid": 8, "customdata": "shot-2"},
+            {"action": "update", "frameid": 0, "note": "Moved", "new_frameid": 1},
+            {"action": "delete", "frameid": 6},
+            {"action": "delete", "frameid": 8},
+            {"action": "add", "frameid": 12, "color": "Orange", "name": "Bad"},
+            {"action": "update", "frameid": 99, "name": "Missing"},
+            {"action": "delete"},
+            {"action": "add", "frameid": 10**6, "color": "Blue", "name": "Too late"},
+        ]
+    )
+    assert [r["ok"] for r in results] == [True] * 5 + [False] * 4
+    assert results[5]["error"] == "Invalid marker color: Orange"
+    assert results[6]["error"] == "No marker at frame 99"
+    assert results[7]["error"] == "Missing 'frameid'"
+    assert results[8]["error"] == f"Resolve refused the change at frame {10**6}"
+
+    # Both reds go in one call, the update of 8 is never sent
+    assert backend.calls["DeleteMarkersByColor"] == 1
+    assert backend.calls["DeleteMarkerAtFrame"] == 1
+    assert backend.calls["UpdateMarkerCustomData"] == 0
+    assert backend.calls["AddMarker"] == 3
+    assert backend.calls["GetMarkers"] == 2  # Before and after
+
+    assert [m.frameid for m in markers.all] == [1, 2, 4, 10]
+    assert markers.find(note="Moved").name == "Marker 1"
+    assert sorted(fake._markers) == [1, 2, 4, 10]
+
+    backend.reset_calls()
+    markers.bulk_apply([{"action": "update", "frameid": 2, "customdata": "shot-3"}])
+    assert backend.calls["UpdateMarkerCustomData"] == 1 and backend.calls["AddMarker"] == 0
+    assert markers.find(customdata="shot-3").frameid == 2
+
+    backend.reset_calls()
+    markers.delete_all()
+    assert backend.total_calls == 1
+    assert markers.all == [] and fake._markers == {}
+
+
+def test_bulk_apply_restores_refused_updates():
+    markers = clip.markers
+    results = markers.bulk_apply(
+        [
+            {"action": "update", "frameid": 0, "duration": 10**9},
+            {"action": "update", "frameid": 2, "new_frameid": 10**6},
+            {"action": "update", "frameid": 4, "name": "Renamed"},
+        ]
+    )
+    assert [r["ok"] for r in results] == [False, False, True]
+    assert [(m.frameid, m.name, m.duration) for m in markers.all] == [
+        (0, "Marker 1", 1),
+        (2, "Marker 2", 1),
+        (4, "Renamed", 1),
+    ]
+    assert sorted(fake._markers) == [0, 2, 4]
+
+
+def test_bulk_apply_ignores_ttl():
+    markers = MarkerCollection(clip, ttl=math.inf)
+    markers.add(6, "Red", "A")
+    markers.add(8, "Red", "B")
+    # Added in the GUI, unseen by the cache
+    fake.add_marker(10, "Red", "C")
+
+    results = markers.bulk_apply(
+        [{"action": "delete", "frameid": 6}, {"action": "delete", "frameid": 8}]
+    )
+    assert all(r["ok"] for r in results)
+    assert sorted(fake._markers) == [0, 2, 4, 10]
+    assert [m.frameid for m in markers.all] == [0, 2, 4, 10]
+
+
+def test_export_import(tmp_path):
+    clip.markers.add(6, "Red", "Tab\tname", note="With, comma", customdata="shot-1")
+    fields = lambda markers: [(m.frameid, m.color, m.name, m.note, m.customdata) for m in markers]
+    expected = fields(clip.markers.all)
+
+    other = resolve.media_pool.root_folder.clips[1].markers
+    other.delete_all()
+    for suffix in (".csv", ".jsonl"):
+        assert clip.markers.export(tmp_path / f"markers{suffix}") == 4
+        backend.reset_calls()
+        results = other.import_(tmp_path / f"markers{suffix}")
+        assert all(r["ok"] for r in results)
+        assert backend.calls["AddMarker"] == 4 and backend.calls["GetMarkers"] == 2
+        assert fields(other.all) == expected
+        other.delete_all()
+
+    # Timecodes from the timeline frame rate and start
+    timeline = resolve.media_pool.create_timeline_from_clips("Reel 1", [])
+    backend.resolve.project.current_timeline.add_item(fake, 86400, 500)
+    timeline.markers.add(48, "Purple", "Fix", note="Flicker", duration=12)
+    timeline.markers.add(100, "Blue", "Done")
+    timeline.markers.export(tmp_path / "markers.edl")
+    timeline.markers.export(tmp_path / "markers.txt")
+    edl = (tmp_path / "markers.edl").read_text()
+    assert "01:00:02:00 01:00:02:12 01:00:02:00 01:00:02:12" in edl
+    assert " |C:ResolveColorPurple |M:Fix |D:12" in edl
+    avid = (tmp_path / "markers.txt").read_text().splitlines()
+    assert avid[0] == "Fix\t01:00:02:00\tV1\tmagenta\tFlicker\t12"
+
+    timeline.markers.delete_all()
+    timeline.markers.import_(tmp_path / "markers.edl")
+    assert [(m.frameid, m.color, m.duration) for m in timeline.markers] == [
+        (48, "Purple", 12),
+        (100, "Blue", 1),
+    ]
+    results = timeline.markers.import_(tmp_path / "markers.txt")
+    assert [r["error"] for r in results] == [
+        "Marker at frame 48 already exists",
+        "Marker at frame 100 already exists",
+    ]
+    timeline.markers.import_(tmp_path / "markers.txt", overwrite=True)
+    assert timeline.markers.all[0].color == "Pink" and timeline.markers.all[0].note == "Flicker"
+
+    (tmp_path / "locators.edl").write_text("* LOC: 01:00:01:00 YELLOW  Check sync\n")
+    timeline.markers.import_(tmp_path / "locators.edl")
+    assert timeline.markers.find("Check sync").frameid == 24
+
+    with pytest.raises(ValueError):
+        timeline.markers.export(tmp_path / "markers.xml")
+
+
+def test_import_bad_lines_and_overwrite(tmp_path):
+    path = tmp_path / "markers.csv"
+    path.write_text(
+        "frameid,timecode,color,name,note,duration,customdata\n"
+        "10,,Red,Good,,,\n"
+        ",,Green,missing\n"
+        "x,,Green,Bad frame,,,\n"
+        ",00:00:01:00,Blue,By timecode,,two,\n"
+        ",00:00:02:00,Blue,Also good,,2,\n"
+    )
+    backend.reset_calls()
+    results = clip.markers.import_(path)
+    assert [r["ok"] for r in results] == [True, False, False, False, True]
+    assert results[1]["error"] == "Line 3: Needs a 'frameid' or a 'timecode'"
+    assert results[2]["error"].startswith("Line 4: invalid literal")
+    assert results[3]["error"].startswith("Line 5: invalid literal")
+    assert backend.calls["AddMarker"] == 2
+    assert [m.frameid for m in clip.markers.all] == [0, 2, 4, 10, 48]
+
+    # Overwriting replaces the whole marker
+    clip.markers.bulk_apply([{"action": "update", "frameid": 10, "note": "Old", "customdata": "x"}])
+    path.write_text("frameid,color,name\n10,Green,Replaced\n")
+    clip.markers.import_(path, overwrite=True)
+    marker = clip.markers.find(name="Replaced")
+    assert (marker.frameid, marker.color, marker.note, marker.customdata) == (10, "Green", "", "")
+
+
+def test_drop_frame_timecode():
+    assert frames_to_timecode(1800, 29.97, drop=True) == "00:01:00;02"
+    assert frames_to_timecode(107892, 29.97, drop=True) == "01:00:00;00"
+    assert timecode_to_frames("00:10:00;00", 29.97) == 17982
+    assert timecode_to_frames("01:00:00:00", 25) == 90000
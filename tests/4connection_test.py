@@ -0,0 +1,104 @@
+# flake8: noqa
+# type: ignore
+import sys
+import threading
+import time
+
+import pytest
+
+from pydavinci.backends import Backend, get_backend
+from pydavinci.exceptions import ResolveNotFound
+from pydavinci.main import ResolveConnection
+
+
+class Remote:
+    def GetProductName(self):
+        return "DaVinci Resolve Studio"
+
+
+class Factory(Backend):
+    def __init__(self, delay=0.0, running=True):
+        self.calls = 0
+        self.delay = delay
+        self.running = running
+
+    def connect(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return Remote() if self.running else None
+
+    def is_remote(self, obj):
+        return isinstance(obj, Remote)
+
+
+def test_import_does_not_connect():
+    import pydavinci.main
+    import pydavinci.wrappers.timeline
+
+    assert not pydavinci.main.connection.connected
+    assert "fusionscript" not in sys.modules
+
+
+def test_connects_on_first_call():
+    factory = Factory()
+    conn = ResolveConnection(factory)
+    assert not conn.connected
+    assert factory.calls == 0
+
+    assert conn.GetProductName() == "DaVinci Resolve Studio"
+    assert conn.connected
+    conn.GetProductName()
+    assert factory.calls == 1
+
+
+def test_connect_is_thread_safe():
+    factory = Factory(delay=0.05)
+    conn = ResolveConnection(factory)
+    threads = [threading.Thread(target=conn.GetProductName) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert factory.calls == 1
+
+
+def test_reset_and_reconnect():
+    factory = Factory()
+    conn = ResolveConnection(factory)
+    first = conn.connect()
+    conn.reset()
+    assert not conn.connected
+    assert conn.connect() is not first
+    second = conn.connect()
+    assert conn.reconnect() is not second
+    assert factory.calls == 3
+
+
+def test_dunder_lookups_do_not_connect():
+    factory = Factory()
+    conn = ResolveConnection(factory)
+    assert not hasattr(conn, "__deepcopy__")
+    assert factory.calls == 0
+
+
+def test_resolve_not_running():
+    conn = ResolveConnection(Factory(running=False))
+    with pytest.raises(ResolveNotFound):
+        conn.GetProductName()
+    assert not conn.connected
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setenv("PYDAVINCI_BACKEND", "fake")
+    conn = ResolveConnection()
+    assert conn.backend.name == "fake"
+    assert conn.GetProductName() == "DaVinci Resolve Studio"
+
+    factory = Factory()
+    conn.use_backend(factory)
+    assert not conn.connected
+    assert conn.is_remote(conn.connect())
+    assert not conn.is_remote(object())
+
+    with pytest.raises(ValueError):
+        get_backend("nope")
@@ -0,0 +1,105 @@
+# flake8: noqa
+# type: ignore
+import time
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.main import connection
+from pydavinci.wrappers.mediapoolitem import MediaPoolItem
+from pydavinci.wrappers.settings.constructor import ProjectSettings, TimelineSettings
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend
+    backend = connection.use_backend(FakeBackend(render_fps=10000))
+    backend.populate(clips=12, folders=2, depth=1, markers_per_clip=2)
+    resolve = davinci.Resolve()
+    yield
+    connection.use_backend()
+
+
+def test_media_pool_tree():
+    root = resolve.media_pool.root_folder
+    assert root.name == "Master"
+    assert [f.name for f in root.subfolders] == ["Bin 1.1", "Bin 1.2"]
+    assert len(root.clips) + sum(len(f.clips) for f in root.subfolders) == 12
+    assert all(isinstance(clip, MediaPoolItem) for clip in root.clips)
+
+
+def test_project_settings_parse():
+    settings = resolve.project.settings
+    assert isinstance(settings, ProjectSettings)
+    assert settings.timeline.resolution_width == 1920
+    assert settings.super_scale == "auto"
+
+    settings.timeline.resolution_width = 3840
+    assert resolve.project.get_setting("timelineResolutionWidth") == "3840"
+
+
+def test_timeline_and_custom_settings():
+    pool = resolve.media_pool
+    pool.create_empty_timeline("fake timeline")
+    pool.append_to_timeline(pool.root_folder.clips[:3])
+
+    timeline = resolve.active_timeline
+    assert [item.name for item in timeline.items("video", 1)] == [
+        clip.name for clip in pool.root_folder.clips[:3]
+    ]
+
+    timeline.custom_settings(True)
+    assert isinstance(timeline.settings, TimelineSettings)
+
+
+def test_markers_and_metadata():
+    clip = resolve.media_pool.root_folder.clips[0]
+    assert [marker.frameid for marker in clip.markers.all] == [0, 2]
+    assert clip.markers.add(10, "Red", "new").frameid == 10
+    assert clip.markers.add(10, "Red", "duplicate") is None
+    assert clip.markers.add(100000, "Red", "out of range") is None
+
+    assert clip.set_metadata({"Scene": "12"}) is True
+    assert clip.set_metadata({"Not a field": "12"}) is False
+    assert clip.get_metadata("Scene") == "12"
+
+
+def test_render_simulation():
+    pool = resolve.media_pool
+    pool.create_timeline_from_clips("render", pool.root_folder.clips)
+    project = resolve.project
+    job_id = project.add_renderjob()
+    assert project.render_status(job_id)["JobStatus"] == "Ready"
+
+    assert project.render([job_id])
+    deadline = time.monotonic() + 5
+    while project.render_status(job_id)["JobStatus"] != "Complete":
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert project.render_status(job_id)["CompletionPercentage"] == 100
+
+
+def test_latency_and_call_counting():
+    backend.latency = 0.01
+    backend.latencies["GetName"] = 0.0
+    backend.reset_calls()
+
+    start = time.perf_counter()
+    resolve.media_pool.root_folder.clips
+    elapsed = time.perf_counter() - start
+
+    assert backend.calls["GetClipList"] == 1
+    assert elapsed >= 0.01 * (backend.total_calls - backend.calls["GetName"])
+    assert connection.is_remote(resolve.media_pool._obj)
+    assert not connection.is_remote(object())
+
+
+def test_markers_are_fetched_lazily():
+    backend.reset_calls()
+    clips = resolve.media_pool.root_folder.clips
+    assert backend.calls["GetMarkers"] == 0
+
+    assert clips[0].markers is clips[0].markers
+    assert backend.calls["GetMarkers"] == 1
@@ -0,0 +1,134 @@
+# flake8: noqa
+# type: ignore
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import pydavinci
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends import fusionscript
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.instrumentation import RemoteProxy
+from pydavinci.main import connection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend
+    backend = connection.use_backend(FakeBackend(latencies={"GetMarkers": 0.002}))
+    backend.populate(clips=10, markers_per_clip=1)
+    resolve = davinci.Resolve()
+    pool = resolve.media_pool
+    pool.create_timeline_from_clips("profiled", pool.root_folder.clips)
+    backend.reset_calls()
+    yield
+    connection.use_backend()
+
+
+def test_profile_matches_remote_calls():
+    with pydavinci.profile() as stats:
+        timeline = resolve.active_timeline
+        timeline.markers
+
+    assert stats.calls == dict(backend.calls)
+    assert stats["GetMarkers"].count >= 1
+    assert stats["GetMarkers"].p50 >= 0.002
+    assert stats.hot_paths(1)[0].method == "GetMarkers"
+    assert stats.total_time <= stats.wall_time
+
+
+def test_nothing_recorded_outside_profile():
+    with pydavinci.profile() as stats:
+        clips = resolve.media_pool.root_folder.clips
+    count = stats.total_calls
+
+    clips[0].name
+    resolve.project.name
+    assert stats.total_calls == count
+    assert not isinstance(resolve.media_pool._obj, RemoteProxy)
+
+
+def test_recorded_whenever_wrappers_were_created():
+    folder = resolve.media_pool.root_folder
+    with pydavinci.profile() as stats:
+        clips = folder.clips
+        pool = resolve.media_pool
+        subfolder = pool.add_subfolder("Moved", pool.root_folder)
+        assert pool.move_clips(clips[:2], subfolder)
+
+    assert stats.calls["GetClipList"] == 1
+    assert stats.calls["MoveClips"] == 1
+    assert len(resolve.media_pool.root_folder.subfolders[0].clips) == 2
+    assert not isinstance(clips[0]._obj, RemoteProxy)
+    assert not isinstance(pool._obj, RemoteProxy)
+
+
+def test_proxies_are_transparent():
+    root = RemoteProxy(backend.resolve, backend.is_remote)
+    with pydavinci.profile() as stats:
+        pool = root.GetProjectManager().GetCurrentProject().GetMediaPool()
+        clips = pool.GetRootFolder().GetClipList()
+        assert isinstance(clips[0], RemoteProxy)
+        assert pool.MoveClips(clips[:2], pool.GetRootFolder())
+        assert clips[0] == clips[0]._remote
+
+    assert backend.calls["MoveClips"] == 1
+    assert "MoveClips" in stats and "GetClipList" in stats
+
+
+class FusionStub(object):
+    # Native fusionscript objects take attribute and item assignment, like Fusion tools do
+
+    def __init__(self):
+        self.inputs = {}
+
+    def AddTool(self, name):
+        tool = FusionStub()
+        tool.Name = name
+        return tool
+
+    def __getitem__(self, key):
+        return self.inputs[key]
+
+    def __setitem__(self, key, value):
+        self.inputs[key] = value
+
+    def __len__(self):
+        return len(self.inputs)
+
+
+def test_fusionscript_proxies_pass_everything_through(monkeypatch):
+    monkeypatch.setattr(fusionscript, "load_fusionscript", lambda: None)
+    monkeypatch.setitem(
+        sys.modules, "fusionscript", SimpleNamespace(scriptapp=lambda _: FusionStub())
+    )
+    comp = fusionscript.FusionscriptBackend().connect()
+
+    with pydavinci.profile() as stats:
+        blur = comp.AddTool("Blur")
+    assert stats.calls == {"AddTool": 1}
+    assert isinstance(blur, RemoteProxy)
+
+    blur.XBlurSize = 2.5
+    assert blur.XBlurSize == 2.5 and blur._remote.XBlurSize == 2.5
+    blur["Input"] = comp
+    assert blur["Input"] == comp and blur._remote.inputs["Input"] is comp._remote
+    assert len(blur) == 1 and blur
+    assert "AddTool" in blur.__dir__() and "XBlurSize" in dir(blur)
+
+
+def test_exports():
+    with pydavinci.profile() as stats:
+        resolve.media_pool.root_folder.clips
+
+    data = json.loads(stats.to_json())
+    assert data["total_calls"] == stats.total_calls
+    assert set(data["methods"]["GetClipList"]) >= {"count", "p50", "p95", "p99"}
+
+    text = stats.to_prometheus()
+    assert 'pydavinci_remote_calls_total{method="GetClipList"} 1' in text
+    assert 'pydavinci_remote_call_duration_seconds_bucket{method="GetClipList",le="+Inf"} 1' in text
+    assert "# TYPE pydavinci_remote_call_duration_seconds histogram" in text
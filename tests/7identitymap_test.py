@@ -0,0 +1,86 @@
+# flake8: noqa
+# type: ignore
+import gc
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci import identitymap
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.identitymap import IdentityMap
+from pydavinci.main import connection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend
+    backend = connection.use_backend(FakeBackend())
+    backend.populate(clips=20, folders=2, markers_per_clip=1)
+    resolve = davinci.Resolve()
+    yield
+    identitymap.disable()
+    connection.use_backend()
+
+
+def test_disabled_by_default():
+    assert identitymap.get_identity_map() is None
+    backend.reset_calls()
+    first = resolve.media_pool.root_folder.clips
+    assert first[0] is not resolve.media_pool.root_folder.clips[0]
+    assert backend.calls["GetUniqueId"] == 0
+
+
+def test_same_entity_same_wrapper():
+    identitymap.enable()
+    clips = resolve.media_pool.root_folder.clips
+    assert [c is d for c, d in zip(clips, resolve.media_pool.root_folder.clips)] == [True] * 7
+    assert resolve.media_pool is resolve.media_pool
+    assert resolve.project is resolve.project
+
+
+def test_caches_survive():
+    identitymap.enable()
+    clip = resolve.media_pool.root_folder.clips[0]
+    clip.markers
+
+    backend.reset_calls()
+    for _ in range(10):
+        resolve.media_pool.root_folder.clips[0].markers
+    assert backend.calls["GetMarkers"] == 0
+
+
+def test_timeline_without_args():
+    identitymap.enable()
+    pool = resolve.media_pool
+    timeline = pool.create_timeline_from_clips("mapped", pool.root_folder.clips)
+    assert resolve.active_timeline is timeline
+    assert resolve.project.timelines[0] is timeline
+
+
+def test_lru_and_weak_references():
+    class Wrapper:
+        pass
+
+    mapping = IdentityMap(maxsize=2)
+    wrappers = [Wrapper() for _ in range(3)]
+    for i, wrapper in enumerate(wrappers):
+        mapping.add((Wrapper, str(i)), wrapper)
+
+    # Everything is still referenced from here
+    assert len(mapping) == 3
+    assert mapping.get((Wrapper, "0")) is wrappers[0]
+
+    # "1" is least recently used and no longer pinned, so it goes away once dropped
+    del wrappers
+    gc.collect()
+    assert (Wrapper, "1") not in mapping
+    assert (Wrapper, "0") in mapping and (Wrapper, "2") in mapping
+
+
+def test_cleared_on_reset():
+    mapping = identitymap.enable()
+    resolve.media_pool.root_folder.clips
+    assert len(mapping)
+    connection.reset()
+    assert not len(mapping)
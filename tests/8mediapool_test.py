@@ -0,0 +1,216 @@
+# flake8: noqa
+# type: ignore
+import time
+
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.main import connection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, pool
+    backend = connection.use_backend(FakeBackend())
+    # Master holds clips 0, 7, 14... and two levels of two bins each below it
+    backend.populate(clips=70, folders=2, depth=2)
+    resolve = davinci.Resolve()
+    pool = resolve.media_pool
+    yield
+    connection.use_backend()
+
+
+def test_walk_visits_every_clip():
+    walked = list(pool.iter_clips())
+    assert len(walked) == 70
+    assert len({clip.id for _, clip in walked}) == 70
+    assert {path for path, _ in walked} == {
+        "Master",
+        "Master/Bin 1.1",
+        "Master/Bin 1.2",
+        "Master/Bin 1.1/Bin 2.1",
+        "Master/Bin 1.1/Bin 2.2",
+        "Master/Bin 1.2/Bin 2.1",
+        "Master/Bin 1.2/Bin 2.2",
+    }
+
+
+def test_walk_order():
+    def folder_order(order):
+        paths = []
+        for path, _ in pool.iter_clips(order=order):
+            if not paths or paths[-1] != path:
+                paths.append(path)
+        return paths
+
+    assert folder_order("depth")[:3] == ["Master", "Master/Bin 1.1", "Master/Bin 1.1/Bin 2.1"]
+    assert folder_order("breadth")[:3] == ["Master", "Master/Bin 1.1", "Master/Bin 1.2"]
+
+    with pytest.raises(ValueError):
+        next(pool.iter_clips(order="sideways"))
+
+
+def test_walk_max_depth_and_filters():
+    assert {path for path, _ in pool.iter_clips(max_depth=0)} == {"Master"}
+    assert len(list(pool.iter_clips(max_depth=1))) == 30
+
+    only_first = {path for path, _ in pool.iter_clips(folders="* 1.1")}
+    assert only_first == {"Master", "Master/Bin 1.1"}
+
+    names = [clip.name for _, clip in pool.iter_clips(name="A001C00?.mov")]
+    assert sorted(names) == [f"A001C00{i}.mov" for i in range(1, 10)]
+    assert len(list(pool.iter_clips(name=lambda n: n.endswith("0.mov")))) == 7
+
+
+def test_walk_is_lazy():
+    backend.reset_calls()
+    walk = pool.iter_clips(limit=3)
+    assert backend.calls["GetClipList"] == 0
+
+    assert len(list(walk)) == 3
+    # Only the root folder was listed
+    assert backend.calls["GetClipList"] == 1
+    assert backend.calls["GetSubFolderList"] == 0
+
+    backend.reset_calls()
+    for path, clip in pool.iter_clips():
+        if path != "Master":
+            break
+    assert backend.calls["GetClipList"] == 2
+    assert backend.calls["GetSubFolderList"] == 1
+
+
+def test_index_lookups():
+    index = pool.index()
+    assert len(index) == 70
+
+    clip = index.find_by_name("A001C003.mov")[0]
+    assert clip.name == "A001C003.mov"
+    assert index.find_by_id(clip.id).id == clip.id
+    assert index.find_by_media_id(clip.media_id).id == clip.id
+    assert [c.id for c in index.find_by_path("/media/A001/A001C003.mov")] == [clip.id]
+    assert index.find_by_name("nope") == []
+
+    backend.reset_calls()
+    for _ in range(1000):
+        index.find_by_name("A001C003.mov")
+    assert backend.calls["GetClipList"] == 0
+
+
+def test_index_follows_wrapper_changes():
+    index = pool.index()
+    imported = pool.import_media(["/media/B001/B001C001.mov"])
+    assert index.find_by_path("/media/B001/B001C001.mov")[0].id == imported[0].id
+    assert index.entry(imported[0].id)["folder"] == ("Master",)
+
+    bin_ = pool.root_folder.subfolders[0]
+    assert pool.move_clips(imported, bin_)
+    assert index.entry(imported[0].id)["folder"] == ("Master", "Bin 1.1")
+
+    assert pool.delete_clips(imported)
+    assert index.find_by_path("/media/B001/B001C001.mov") == []
+
+    assert pool.delete_folders([bin_])
+    assert len(index) == 70 - 30
+
+
+def test_index_finds_new_folders():
+    index = pool.index()
+    new_bin = pool.add_subfolder("Selects", pool.root_folder)
+    clip = pool.root_folder.clips[0]
+    assert pool.move_clips([clip], new_bin)
+    assert index.entry(clip.id)["folder"] == ("Master", "Selects")
+
+    index.refresh(new_bin)
+    assert index.entry(clip.id)["folder"] == ("Master", "Selects")
+
+    # Deleted behind the index's back before it was seen, it isn't filed under the root
+    gone = pool.add_subfolder("Rejects", pool.root_folder)
+    backend.resolve.project.media_pool.DeleteFolders([gone._obj])
+    with pytest.raises(KeyError):
+        index.refresh(gone)
+
+
+def test_index_follows_moved_folders(tmp_path):
+    index = pool.index()
+    first, second = pool.root_folder.subfolders
+    slashed = pool.add_subfolder("Day 1/Cam A", first)
+    imported = pool.import_media(["/media/B001/B001C001.mov"])
+    assert pool.move_clips(imported, slashed)
+    nested = first.subfolders[0]
+    nested_clip = nested.clips[0]
+
+    assert pool.move_folders([first], second)
+    assert index.entry(imported[0].id)["folder"] == ("Master", "Bin 1.2", "Bin 1.1", "Day 1/Cam A")
+    assert index.entry(nested_clip.id)["folder"] == ("Master", "Bin 1.2", "Bin 1.1", nested.name)
+
+    index.save(tmp_path / "index.json")
+    loaded = type(index).load(tmp_path / "index.json")
+    assert loaded.entry(imported[0].id)["folder"] == ("Master", "Bin 1.2", "Bin 1.1", "Day 1/Cam A")
+    assert loaded.find_by_id(imported[0].id).id == imported[0].id
+    assert loaded.find_by_id(nested_clip.id).id == nested_clip.id
+
+
+def test_index_warm_start(tmp_path):
+    index = pool.index()
+    index.save(tmp_path / "index.json")
+    nested = index.find_by_name("A001C070.mov")[0]
+
+    backend.reset_calls()
+    loaded = type(index).load(tmp_path / "index.json")
+    assert len(loaded) == 70
+    assert backend.calls["GetClipList"] == 0
+
+    assert loaded.find_by_name("A001C070.mov")[0].id == nested.id
+    # Only the clip's own folder was listed
+    assert backend.calls["GetClipList"] == 1
+
+    # Clips deleted behind the index's back are dropped when found missing
+    backend.resolve.project.media_pool.DeleteClips([nested._obj])
+    loaded._objs.clear()
+    assert loaded.find_by_id(nested.id) is None
+    assert nested.id not in loaded
+
+
+def test_snapshot_properties():
+    clips = [clip for _, clip in pool.iter_clips()]
+    backend.reset_calls()
+    table = pool.snapshot_properties(clips, keys=["Clip Name", "File Path", "Nope"])
+    assert backend.calls["GetClipProperty"] == 70
+    assert len(table) == 70
+    assert table.keys == ["Clip Name", "File Path", "Nope"]
+    assert table["Clip Name"] == [clip.name for clip in clips]
+    assert table["Nope"] == [None] * 70
+    assert table.items == clips
+    assert table.row(3)["File Path"] == f"/media/A001/{clips[3].name}"
+
+    full = pool.snapshot_properties(clips[:2])
+    assert "Resolution" in full and len(full) == 2
+
+
+def test_snapshot_properties_group_and_filter():
+    clips = [clip for _, clip in pool.iter_clips()]
+    table = pool.snapshot_properties(clips, keys=["Clip Name", "FPS"])
+    groups = table.group_by("FPS")
+    assert sum(len(group) for group in groups.values()) == 70
+    for fps, group in groups.items():
+        assert set(group["FPS"]) == {fps}
+
+    picked = table.where("Clip Name", lambda name: name.endswith("0.mov"))
+    assert len(picked) == 7
+    assert [clip.name for clip in picked.items] == picked["Clip Name"]
+    assert len(table.where("Clip Name", "A001C001.mov")) == 1
+
+
+def test_snapshot_properties_concurrent():
+    clips = [clip for _, clip in pool.iter_clips()]
+    backend.latency = 0.01
+    started = time.perf_counter()
+    concurrent = pool.snapshot_properties(clips, keys=["Clip Name"])
+    elapsed = time.perf_counter() - started
+    serial = pool.snapshot_properties(clips, keys=["Clip Name"], max_workers=1)
+    assert concurrent.to_dict() == serial.to_dict()
+    # 70 calls one after another take at least 0.7s
+    assert elapsed < 0.35
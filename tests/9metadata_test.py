@@ -0,0 +1,94 @@
+# flake8: noqa
+# type: ignore
+import pytest
+
+import pydavinci.wrappers.resolve as davinci
+from pydavinci.backends.fake import FakeBackend
+from pydavinci.exceptions import MetadataNotSaved
+from pydavinci.main import connection
+
+
+@pytest.fixture(autouse=True)
+def load():
+
+    global resolve, backend, pool, clips
+    backend = connection.use_backend(FakeBackend())
+    backend.populate(clips=50)
+    resolve = davinci.Resolve()
+    pool = resolve.media_pool
+    clips = pool.root_folder.clips
+    yield
+    connection.use_backend()
+
+
+def test_metadata_mapping():
+    clip = clips[0]
+    backend.reset_calls()
+    clip.metadata["Scene"] = "12"
+    clip.metadata["Take"] = 3
+    assert backend.total_calls == 0
+    assert clip.metadata.dirty == {"Scene": "12", "Take": "3"}
+
+    assert clip.metadata["Scene"] == "12"
+    assert "Comments" not in clip.metadata
+    assert dict(clip.metadata) == {"Scene": "12", "Take": "3"}
+    assert backend.calls["GetMetadata"] == 1
+
+    assert clip.metadata.commit()
+    assert backend.calls["SetMetadata"] == 1
+    assert clip.metadata.dirty == {}
+    assert clip.get_metadata("Take") == "3"
+
+    # Setting a value back to what Resolve has isn't a change
+    clip.metadata["Scene"] = "12"
+    assert clip.metadata.dirty == {}
+    assert clip.metadata.commit()
+    assert backend.calls["SetMetadata"] == 1
+
+
+def test_metadata_context_manager():
+    clip = clips[0]
+    clip.set_metadata({"Comments": "soft focus"})
+    with clip.metadata as metadata:
+        metadata["Scene"] = "7"
+        del metadata["Comments"]
+    assert clip.get_metadata("Scene") == "7"
+    assert clip.get_metadata("Comments") == ""
+
+    with pytest.raises(RuntimeError):
+        with clip.metadata as metadata:
+            metadata["Scene"] = "8"
+            raise RuntimeError
+    assert clip.metadata.dirty == {}
+    assert clip.get_metadata("Scene") == "7"
+
+
+def test_metadata_refused_keys():
+    clip = clips[0]
+    clip.metadata["Scene"] = "1"
+    clip.metadata["Not a field"] = "1"
+    assert clip.metadata.commit() is False
+    # The valid key still got saved, the refused one is still pending
+    assert clip.get_metadata("Scene") == "1"
+    assert clip.metadata.dirty == {"Not a field": "1"}
+
+    with pytest.raises(MetadataNotSaved) as error:
+        with clip.metadata:
+            pass
+    assert error.value.keys == ["Not a field"]
+
+
+def test_commit_metadata_bulk():
+    for i, clip in enumerate(clips[:40]):
+        clip.metadata["Scene"] = str(i)
+    clips[5].metadata["Not a field"] = "x"
+
+    backend.reset_calls()
+    report = pool.commit_metadata(clips)
+    # One call per changed clip, plus one retry per key of the clip that failed
+    assert backend.calls["SetMetadata"] == 40 + 2
+    assert backend.calls["GetMetadata"] == 0
+    assert len(report["saved"]) == 39
+    assert len(report["unchanged"]) == 10
+    assert [(f["item"], f["keys"]) for f in report["failed"]] == [(clips[5], ["Not a field"])]
+    assert [clip.get_metadata("Scene") for clip in clips[:40]] == [str(i) for i in range(40)]